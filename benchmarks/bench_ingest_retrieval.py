@@ -0,0 +1,329 @@
+"""
+Ingest and Retrieval Benchmark - MentorIA
+Times each ingest and retrieval stage (load, split, embed, store, index,
+retrieve, assemble_context, answer) on synthetic corpora of growing size
+and on the real documents/ PDFs. Runs fully offline and deterministically:
+hashing embeddings, an echo chat model, an in-memory chunk collection and
+the local vector index replace every remote service.
+
+Reports throughput, latency percentiles and the process peak RSS after
+each stage (plus traced Python allocations with --trace-memory, which
+slows everything down), and saves them to JSON; pass a previous run as
+--baseline to compare.
+
+Usage:
+  python benchmarks/bench_ingest_retrieval.py
+  python benchmarks/bench_ingest_retrieval.py --sizes 100 1000 --queries 500
+  python benchmarks/bench_ingest_retrieval.py --baseline old.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-placeholder-key")
+# Every search must reach the local index: no coalescing, no shared cache
+os.environ["RETRIEVAL_BACKEND"] = "local"
+os.environ["RETRIEVAL_SINGLE_FLIGHT_GRACE_SECONDS"] = "0"
+
+import numpy as np  # noqa: E402
+
+from benchmarks.fixtures import (  # noqa: E402
+    EchoChatModel,
+    HashEmbeddings,
+    MemoryCollection,
+    sample_queries,
+    synthetic_pages,
+)
+from src.core import runnables  # noqa: E402
+from src.core.cache import TTLCache  # noqa: E402
+from src.core.context_builder import assemble_context  # noqa: E402
+from src.core.embedding_cache import QueryEmbeddingCache  # noqa: E402
+from src.core.graph import retrieval, vector_index  # noqa: E402
+from src.ingest import processing  # noqa: E402
+from src.ingest.loaders import load_documents  # noqa: E402
+from src.ingest.manifest import assign_chunk_ids  # noqa: E402
+from src.ingest.pipeline import peak_rss_mb  # noqa: E402
+from src.ingest.storage import store_in_mongodb  # noqa: E402
+
+DEFAULT_OUTPUT = ".cache/benchmarks/ingest_retrieval.json"
+
+
+def use_offline_models(dimensions: int) -> None:
+    """
+    Swaps the embedding and chat models used by ingestion, retrieval and
+    the agent chain for the deterministic fixtures.
+    """
+    embeddings = HashEmbeddings(dimensions)
+    query_cache = QueryEmbeddingCache(
+        embeddings_model=embeddings, model_name="hash", cache=TTLCache(max_size=1)
+    )
+    processing.get_embedding_model = lambda: embeddings
+    retrieval.get_query_embedding_cache = lambda: query_cache
+    runnables.get_llm_model = lambda temperature=0.3, model=None: EchoChatModel()
+    runnables.invalidate_runnables()
+
+
+def percentiles(latencies: List[float]) -> Dict[str, float]:
+    values = np.asarray(latencies) * 1e3
+    return {f"p{p}_ms": round(float(np.percentile(values, p)), 4) for p in (50, 90, 99)}
+
+
+def measure(name: str, fn: Callable, items: Optional[int], trace_memory: bool):
+    """
+    Runs one whole-corpus stage (output silenced) and returns its result
+    and report. items=None means the result's length.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = fn()
+    seconds = time.perf_counter() - started
+    report = stage_report(seconds, len(result) if items is None else items)
+    add_memory(report, trace_memory)
+    print(f"  {name:<17}{format_report(report)}")
+    return result, report
+
+
+def measure_each(name: str, fn: Callable, inputs: List, trace_memory: bool):
+    """
+    Runs a per-query stage once per input and returns the results and a
+    report with latency percentiles.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    results, latencies = [], []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for item in inputs:
+            started = time.perf_counter()
+            results.append(fn(item))
+            latencies.append(time.perf_counter() - started)
+    report = {**stage_report(sum(latencies), len(inputs)), **percentiles(latencies)}
+    add_memory(report, trace_memory)
+    print(f"  {name:<17}{format_report(report)}")
+    return results, report
+
+
+def add_memory(report: dict, trace_memory: bool) -> None:
+    report["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    if trace_memory:
+        report["peak_traced_mb"] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        tracemalloc.stop()
+
+
+def stage_report(seconds: float, items: int) -> dict:
+    return {
+        "seconds": round(seconds, 6),
+        "items": items,
+        "items_per_second": round(items / seconds, 2) if seconds else None,
+    }
+
+
+def format_report(report: dict) -> str:
+    text = f"{report['seconds']:9.3f}s  {report['items']:7d} items"
+    if report["items_per_second"]:
+        text += f"  {report['items_per_second']:12.1f}/s"
+    if "p50_ms" in report:
+        text += (
+            f"  p50 {report['p50_ms']:.3f}  p90 {report['p90_ms']:.3f}"
+            f"  p99 {report['p99_ms']:.3f} ms"
+        )
+    text += f"  rss {report['peak_rss_mb']:.0f} MB"
+    if "peak_traced_mb" in report:
+        text += f"  traced {report['peak_traced_mb']:.1f} MB"
+    return text
+
+
+def write_synthetic_corpus(num_pages: int, directory: Path) -> None:
+    """Writes the synthetic pages as TXT files, one per page."""
+    for page in synthetic_pages(num_pages):
+        name = Path(page.metadata["source"]).stem
+        path = directory / f"{name}_p{page.metadata['page']:02d}.txt"
+        path.write_text(page.page_content, encoding="utf-8")
+
+
+def run_corpus(
+    name: str, documents_path: str, num_queries: int, k: int, trace_memory: bool
+) -> dict:
+    print(f"\n{name}")
+    stages = {}
+
+    pages, stages["load"] = measure(
+        "load", lambda: load_documents(documents_path), None, trace_memory
+    )
+    chunks, stages["split"] = measure(
+        "split", lambda: processing.split_documents(pages), None, trace_memory
+    )
+    # Deterministic ids, as in ingestion, so stored documents are upserts
+    by_source: Dict[str, List] = {}
+    for chunk in chunks:
+        by_source.setdefault(chunk.metadata.get("source", ""), []).append(chunk)
+    for source, source_chunks in by_source.items():
+        assign_chunk_ids(source_chunks, source)
+    _, stages["embed"] = measure(
+        "embed",
+        lambda: processing.generate_embeddings(chunks, requests_per_minute=0),
+        None,
+        trace_memory,
+    )
+
+    collection = MemoryCollection()
+    _, stages["store"] = measure(
+        "store",
+        lambda: store_in_mongodb(chunks, collection=collection),
+        len(chunks),
+        trace_memory,
+    )
+
+    with tempfile.TemporaryDirectory() as index_root:
+        index_dir = os.path.join(index_root, "vector_index")
+        _, stages["index"] = measure(
+            "index",
+            lambda: vector_index.build_local_index(collection, index_dir),
+            len(chunks),
+            trace_memory,
+        )
+        retrieval.LOCAL_INDEX_PATH = index_dir
+        # Opened outside the timed stage, like a long-running server would
+        vector_index.get_local_index(index_dir)
+
+        queries = list(sample_queries(pages, num_queries))
+        results, stages["retrieve"] = measure_each(
+            "retrieve",
+            lambda question: retrieval.search_chunks(question, k=k),
+            queries,
+            trace_memory,
+        )
+
+    contexts, stages["assemble_context"] = measure_each(
+        "assemble_context", assemble_context, results, trace_memory
+    )
+
+    chain = runnables.get_agent_chain([], temperature=0.3)
+    inputs = [
+        {
+            "user_name": "Benchmark",
+            "user_role": "Analyst",
+            "context": context,
+            "conversation_summary": "(none)",
+            "chat_history": [],
+            "question": question,
+        }
+        for question, context in zip(queries, contexts)
+    ]
+    _, stages["answer"] = measure_each("answer", chain.invoke, inputs, trace_memory)
+
+    return {
+        "name": name,
+        "pages": len(pages),
+        "chunks": len(chunks),
+        "queries": len(queries),
+        "stages": stages,
+    }
+
+
+def compare(current: dict, baseline_path: str) -> None:
+    """Prints each stage's time relative to a previous run."""
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    previous = {corpus["name"]: corpus for corpus in baseline["corpora"]}
+
+    print(f"\nCompared with {baseline_path} (time ratio, >1 is slower)")
+    if baseline.get("settings") != current["settings"]:
+        print(f"  Warning: different settings {baseline.get('settings')}")
+    for corpus in current["corpora"]:
+        old = previous.get(corpus["name"])
+        if old is None:
+            continue
+        ratios = []
+        for stage, report in corpus["stages"].items():
+            old_report = old["stages"].get(stage)
+            if old_report and old_report["seconds"]:
+                ratios.append(
+                    f"{stage} {report['seconds'] / old_report['seconds']:.2f}x"
+                )
+        print(f"  {corpus['name']}: " + ", ".join(ratios))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 500, 2000],
+        help="Synthetic corpus sizes in pages",
+    )
+    parser.add_argument(
+        "--documents",
+        default="documents",
+        help="Real document directory (empty to skip)",
+    )
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also trace each stage's peak Python allocations (much slower)",
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", help="Previous JSON result to compare with")
+    args = parser.parse_args()
+
+    use_offline_models(args.dimensions)
+    trace_memory = args.trace_memory
+    # pypdf warns about every font it cannot fully parse
+    logging.getLogger("pypdf").setLevel(logging.ERROR)
+
+    corpora = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            write_synthetic_corpus(size, Path(directory))
+            corpora.append(
+                run_corpus(
+                    f"synthetic-{size}", directory, args.queries, args.k, trace_memory
+                )
+            )
+    if args.documents and os.path.isdir(args.documents):
+        corpora.append(
+            run_corpus("documents", args.documents, args.queries, args.k, trace_memory)
+        )
+
+    result = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "queries": args.queries,
+            "k": args.k,
+            "dimensions": args.dimensions,
+            "trace_memory": trace_memory,
+        },
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "corpora": corpora,
+    }
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"\nPeak RSS: {result['peak_rss_mb']} MB. Results saved to {output}")
+
+    if args.baseline:
+        compare(result, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
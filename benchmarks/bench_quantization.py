@@ -0,0 +1,213 @@
+"""
+Quantization Benchmark - MentorIA
+Compares float, int8 and binary embedding storage on clustered synthetic
+embeddings (dense vectors grouped by topic, like those of a document
+corpus): stored bytes per chunk, local index size, query latency and
+recall@k against an exact float search, for several rescoring factors.
+
+Chunks go through the real storage and index code (chunk_to_document,
+build_local_index, LocalVectorIndex.search) on an in-memory collection,
+so nothing remote is needed.
+
+Usage:
+  python benchmarks/bench_quantization.py
+  python benchmarks/bench_quantization.py --sizes 5000 50000 --factors 1 4 10
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bson  # noqa: E402
+import numpy as np  # noqa: E402
+from langchain_core.documents import Document  # noqa: E402
+
+from benchmarks.fixtures import MemoryCollection  # noqa: E402
+from src.core.graph.vector_index import (  # noqa: E402
+    LocalVectorIndex,
+    build_local_index,
+    current_index_dir,
+)
+from src.core.quantization import STORAGE_MODES, normalize_rows  # noqa: E402
+from src.ingest.storage import chunk_to_document  # noqa: E402
+
+DEFAULT_OUTPUT = ".cache/benchmarks/quantization.json"
+
+
+def clustered_embeddings(
+    count: int, dimensions: int, clusters: int, spread: float, seed: int
+) -> np.ndarray:
+    """Unit vectors scattered around random topic centers."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimensions)).astype(np.float32)
+    labels = rng.integers(0, clusters, count)
+    noise = rng.standard_normal((count, dimensions)).astype(np.float32)
+    return normalize_rows(centers[labels] + spread * noise)
+
+
+def query_embeddings(
+    corpus: np.ndarray, count: int, spread: float, seed: int
+) -> np.ndarray:
+    """Queries near random corpus vectors, as a question is near its answer."""
+    rng = np.random.default_rng(seed + 1)
+    anchors = corpus[rng.integers(0, len(corpus), count)]
+    noise = rng.standard_normal(anchors.shape).astype(np.float32)
+    return normalize_rows(anchors + spread * noise)
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> List[set]:
+    similarities = queries @ corpus.T
+    top = np.argsort(-similarities, axis=1)[:, :k]
+    return [set(row.tolist()) for row in top]
+
+
+def fill_collection(corpus: np.ndarray, storage: str) -> MemoryCollection:
+    collection = MemoryCollection()
+    documents = []
+    for i, vector in enumerate(corpus):
+        chunk = Document(
+            page_content=f"chunk {i}",
+            metadata={"chunk_id": f"{i:08d}", "embedding": vector.tolist()},
+        )
+        documents.append(chunk_to_document(chunk, storage))
+    collection.insert_many(documents)
+    return collection
+
+
+def stored_bytes(corpus: np.ndarray, storage: str, sample: int = 200) -> Dict:
+    """Mean BSON bytes per chunk of the embedding fields."""
+    index_field, total = [], []
+    for vector in corpus[:sample]:
+        chunk = Document(page_content="", metadata={"embedding": vector.tolist()})
+        doc = chunk_to_document(chunk, storage)
+        fields = {k: v for k, v in doc.items() if k.startswith("embedding")}
+        index_field.append(len(bson.encode({"embedding": doc["embedding"]})))
+        total.append(len(bson.encode(fields)))
+    return {
+        "index_field_bytes": round(float(np.mean(index_field)), 1),
+        "embedding_bytes": round(float(np.mean(total)), 1),
+    }
+
+
+def index_files(index_dir: str) -> Dict[str, int]:
+    return {
+        path.name: path.stat().st_size
+        for path in current_index_dir(index_dir).iterdir()
+    }
+
+
+def measure_search(
+    index: LocalVectorIndex, queries: np.ndarray, truth: List[set], k: int
+) -> Dict:
+    latencies, hits = [], 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        results = index.search(query.tolist(), k)
+        latencies.append(time.perf_counter() - started)
+        hits += len({int(r["id"]) for r in results} & expected)
+    values = np.asarray(latencies) * 1e3
+    return {
+        "recall_at_k": round(hits / (len(queries) * k), 4),
+        **{f"p{p}_ms": round(float(np.percentile(values, p)), 3) for p in (50, 99)},
+    }
+
+
+def run_size(size: int, args) -> dict:
+    print(f"\n{size} chunks, {args.dimensions} dimensions")
+    corpus = clustered_embeddings(
+        size, args.dimensions, args.clusters, args.spread, args.seed
+    )
+    queries = query_embeddings(corpus, args.queries, args.query_spread, args.seed)
+    truth = exact_top_k(corpus, queries, args.k)
+
+    modes = {}
+    for storage in STORAGE_MODES:
+        with tempfile.TemporaryDirectory() as root:
+            index_dir = os.path.join(root, "vector_index")
+            with contextlib.redirect_stdout(io.StringIO()):
+                build_local_index(
+                    fill_collection(corpus, storage), index_dir, storage=storage
+                )
+            files = index_files(index_dir)
+            scanned = files.get("embeddings.q", files.get("embeddings.f32", 0))
+            report = {
+                **stored_bytes(corpus, storage),
+                "scanned_index_bytes": scanned,
+                "index_bytes": sum(files.values()),
+                "searches": {},
+            }
+            index = LocalVectorIndex.load(index_dir)
+            # Float search is exact: the rescoring factor does not apply
+            for factor in args.factors if storage != "float" else [1]:
+                index.rescore_factor = factor
+                index.search(queries[0].tolist(), args.k)
+                report["searches"][str(factor)] = measure_search(
+                    index, queries, truth, args.k
+                )
+            del index
+        modes[storage] = report
+        for factor, search in report["searches"].items():
+            label = storage if storage == "float" else f"{storage} x{factor}"
+            print(
+                f"  {label:<11} stored {report['embedding_bytes']:8.0f} B/chunk"
+                f"  (index field {report['index_field_bytes']:6.0f} B)"
+                f"  scanned {report['scanned_index_bytes'] / 2**20:7.2f} MB"
+                f"  recall@{args.k} {search['recall_at_k']:.3f}"
+                f"  p50 {search['p50_ms']:.2f}  p99 {search['p99_ms']:.2f} ms"
+            )
+    return {"chunks": size, "modes": modes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000])
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument(
+        "--factors",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 16],
+        help="Rescoring factors: candidates = k * factor (1 = no rescoring)",
+    )
+    parser.add_argument("--clusters", type=int, default=50)
+    parser.add_argument(
+        "--spread", type=float, default=1.0, help="Noise around topic centers"
+    )
+    parser.add_argument(
+        "--query-spread", type=float, default=0.5, help="Noise around answers"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    results = [run_size(size, args) for size in args.sizes]
+
+    result = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            key: value for key, value in vars(args).items() if key != "output"
+        },
+        "sizes": results,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"\nResults saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Startup Benchmark - MentorIA
+Times cold starts in fresh interpreter processes: the CLI's --help, the
+imports behind each entry point (CLI, HTTP API, ingestion, orchestrator)
+and the server warm-up that builds the graph, tools and model clients.
+
+Children run without API keys and with an unreachable MongoDB, so any
+entry point that still connects or constructs clients at import shows up
+as a failure or a server selection timeout instead of passing silently.
+
+Usage:
+  python benchmarks/bench_startup.py
+  python benchmarks/bench_startup.py --repeat 10 --importtime 15
+  python benchmarks/bench_startup.py --baseline old.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = ".cache/benchmarks/startup.json"
+
+# name -> command run in a fresh interpreter (python ...)
+TARGETS = {
+    "cli_help": ["src/main.py", "--help"],
+    "cli_ingest_help": ["src/main.py", "ingest", "--help"],
+    "import_config": ["-c", "import src.config"],
+    "import_orchestrator": ["-c", "import src.core.agent_orchestrator"],
+    "import_api": ["-c", "import src.api"],
+    "import_ingest": ["-c", "import src.ingest.ingest"],
+    "warm_up": [os.path.join("benchmarks", "bench_startup.py"), "--child-warm-up"],
+}
+
+
+def child_env(with_keys: bool) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT
+    # Nothing listens on the discard port: an eager connection fails fast
+    env["MONGODB_CONNECTION_STRING"] = "mongodb://127.0.0.1:9"
+    env["MONGODB_SERVER_SELECTION_TIMEOUT_MS"] = "2000"
+    env.pop("GOOGLE_API_KEY", None)
+    env.pop("TAVILY_API_KEY", None)
+    if with_keys:
+        env["GOOGLE_API_KEY"] = "benchmark-placeholder-key"
+        env["TAVILY_API_KEY"] = "benchmark-placeholder-key"
+    return env
+
+
+def run_target(name: str, repeat: int) -> dict:
+    """Runs one target repeat times and summarizes its wall-clock time."""
+    command = [sys.executable, *TARGETS[name]]
+    # Warm-up needs the keys to construct the model clients, nothing else does
+    env = child_env(with_keys=name == "warm_up")
+    times, error, steps = [], None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            command, cwd=ROOT, env=env, capture_output=True, text=True
+        )
+        times.append(time.perf_counter() - started)
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1:]
+            break
+        if name == "warm_up":
+            steps = json.loads(completed.stdout.strip().splitlines()[-1])
+    report = {
+        "runs": len(times),
+        "median_seconds": round(statistics.median(times), 4),
+        "min_seconds": round(min(times), 4),
+    }
+    if error is not None:
+        report["error"] = error[0] if error else "exit code != 0"
+    if steps is not None:
+        report["steps"] = steps
+    return report
+
+
+def slowest_imports(args: List[str], limit: int) -> List[dict]:
+    """
+    Packages whose own modules take the most import time (python -X
+    importtime self times, summed per top-level package) for one target.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        env=child_env(with_keys=False),
+        capture_output=True,
+        text=True,
+    )
+    by_package: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, module = line[12:].split("|")
+        package = module.strip().split(".")[0]
+        by_package[package] = by_package.get(package, 0) + int(self_us)
+    slowest = sorted(by_package.items(), key=lambda item: item[1], reverse=True)
+    return [{"package": name, "ms": us / 1e3} for name, us in slowest[:limit]]
+
+
+def child_warm_up() -> None:
+    """
+    Runs warm_up() with an in-memory checkpointer (MongoDB is unreachable
+    here) and prints its step timings as JSON on the last line.
+    """
+    sys.path.append(ROOT)
+    started = time.perf_counter()
+    from benchmarks.fixtures import LatencySaver
+    from src.core import agent_orchestrator
+    from src.core.graph import graph_builder
+
+    imported = time.perf_counter() - started
+    graph_builder.get_checkpointer = lambda: LatencySaver(0.0, 0.0)
+    steps = agent_orchestrator.warm_up()
+    print(json.dumps({"import": round(imported, 4), **steps}))
+
+
+def format_report(report: dict) -> str:
+    text = f"median {report['median_seconds']:.3f}s  min {report['min_seconds']:.3f}s"
+    if "error" in report:
+        text += f"  FAILED: {report['error'][:100]}"
+    if report.get("steps"):
+        text += (
+            "  ("
+            + ", ".join(
+                f"{step} {seconds:.2f}s" if seconds is not None else f"{step} failed"
+                for step, seconds in report["steps"].items()
+            )
+            + ")"
+        )
+    return text
+
+
+def compare(current: dict, baseline_path: str) -> None:
+    """Prints each target's median time relative to a previous run."""
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    print(f"\nCompared with {baseline_path} (time ratio, >1 is slower)")
+    for name, report in current["targets"].items():
+        old = baseline["targets"].get(name)
+        if old and old["median_seconds"]:
+            ratio = report["median_seconds"] / old["median_seconds"]
+            print(f"  {name:<20}{ratio:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per target")
+    parser.add_argument(
+        "--targets", nargs="+", choices=sorted(TARGETS), default=list(TARGETS)
+    )
+    parser.add_argument(
+        "--importtime",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also list the N packages slowest to import for the CLI and API",
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", help="Previous JSON result to compare with")
+    parser.add_argument("--child-warm-up", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_warm_up:
+        child_warm_up()
+        return
+
+    print(f"Startup: {args.repeat} fresh processes per target")
+    targets: Dict[str, dict] = {}
+    for name in args.targets:
+        targets[name] = run_target(name, args.repeat)
+        print(f"  {name:<20}{format_report(targets[name])}")
+
+    imports: Optional[Dict[str, List[dict]]] = None
+    if args.importtime:
+        imports = {}
+        for name in ("cli_help", "import_api"):
+            imports[name] = slowest_imports(TARGETS[name], args.importtime)
+            print(f"\nSlowest imports ({name}):")
+            for item in imports[name]:
+                print(f"  {item['ms']:9.1f} ms  {item['package']}")
+
+    result = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {"repeat": args.repeat},
+        "targets": targets,
+        "slowest_imports": imports,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"\nResults saved to {output}")
+
+    if args.baseline:
+        compare(result, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Web Prefetch Benchmark - MentorIA
+Measures turns whose retrieval scores are weak (the web_prefetch tool
+policy) against the same turns with the tool policy off (tools bound, the
+agent decides): web searches, LLM calls and latency per turn.
+
+The fake model calls the web search with a reworded query, as Gemini
+does, so a prefetch keyed on the raw question cannot serve that call from
+the cache. Gemini, Tavily and MongoDB are latency-injecting fakes
+(benchmarks/fixtures.py).
+
+Usage:
+  python benchmarks/bench_web_prefetch.py
+  python benchmarks/bench_web_prefetch.py --turns 40 --search-seconds 2 --async
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark-placeholder-key")
+os.environ.setdefault("TAVILY_API_KEY", "benchmark-placeholder-key")
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+os.environ["RETRIEVAL_BACKEND"] = "weak_scores"
+os.environ["EMBEDDING_CACHE_BACKEND"] = "memory"
+os.environ["WEB_SEARCH_CACHE_BACKEND"] = "memory"
+
+import numpy as np  # noqa: E402
+
+from benchmarks.fixtures import (  # noqa: E402
+    LatencySaver,
+    SlowChatModel,
+    SlowEmbeddings,
+    slow_search_tool,
+)
+
+DEFAULT_OUTPUT = ".cache/benchmarks/web_prefetch.json"
+
+QUESTIONS = [
+    "Qual é o prazo para recurso de uma avaliação de desempenho?",
+    "Como solicitar auxílio para participação em congresso internacional?",
+    "Quais são as regras de teletrabalho para pesquisadores?",
+    "Como funciona o reembolso de despesas de viagem a campo?",
+    "Quem autoriza o uso de veículos oficiais aos finais de semana?",
+    "What are the rules for publishing research data in open repositories?",
+    "How do I request a parking permit at the headquarters?",
+    "Existe licença para capacitação em programas de pós-doutorado?",
+]
+
+
+def install_fakes(args) -> None:
+    """
+    Replaces every remote service with its fake; retrieval always returns
+    weak scores, so the tool policy picks web_prefetch.
+    """
+    from src.core import runnables
+    from src.core.graph import graph_builder, nodes, retrieval
+
+    saver = LatencySaver(0.0, 0.0)
+    graph_builder.get_checkpointer = lambda: saver
+
+    chunk = {
+        "text": "Trecho pouco relacionado de uma norma interna.",
+        "metadata": {"page": 1},
+        "source": "documents/norma.pdf",
+        "score": 0.5,
+    }
+
+    def search(question_embedding: List[float], k: int) -> List[Dict]:
+        time.sleep(args.vector_search_seconds)
+        return [chunk] * k
+
+    async def asearch(question_embedding: List[float], k: int) -> List[Dict]:
+        await asyncio.sleep(args.vector_search_seconds)
+        return [chunk] * k
+
+    retrieval.RETRIEVAL_BACKENDS["weak_scores"] = search
+    retrieval.ASYNC_RETRIEVAL_BACKENDS["weak_scores"] = asearch
+
+    llm = SlowChatModel(
+        first_token_seconds=args.llm_first_token,
+        token_seconds=args.llm_token_seconds,
+        answer_tokens=args.answer_tokens,
+        tool_call_percent=100,
+        tool_query_prefix="Embrapa ",
+    )
+    runnables.get_llm_model = lambda temperature=0.3, model=None: llm
+    runnables.get_embedding_model = lambda: SlowEmbeddings(seconds=0.0)
+    runnables.invalidate_runnables()
+
+    nodes.get_tavily_search_tool = lambda: slow_search_tool(args.search_seconds)
+
+
+def llm_calls(agent_loop: dict) -> int:
+    return agent_loop["llm_calls"]
+
+
+def run_mode(name: str, policy_enabled: bool, args) -> dict:
+    from src.core import agent_orchestrator
+    from src.core.graph import nodes, tool_policy
+
+    tool_policy.TOOL_POLICY_ENABLED = policy_enabled
+    tool = nodes.get_web_search_tool()
+    tool.cache.clear()
+    web_calls = tool.remote_calls
+    agent_calls = llm_calls(agent_orchestrator.get_agent_loop_stats())
+
+    questions = [
+        f"{QUESTIONS[i % len(QUESTIONS)]} ({name} {i})" for i in range(args.turns)
+    ]
+    latencies = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, question in enumerate(questions):
+            session = f"prefetch-{name}-{i}"
+            started = time.perf_counter()
+            if args.use_async:
+                asyncio.run(
+                    agent_orchestrator.agenerate_response(
+                        question, session, "Ana", "Analista"
+                    )
+                )
+            else:
+                agent_orchestrator.generate_response(
+                    question, session, "Ana", "Analista"
+                )
+            latencies.append(time.perf_counter() - started)
+
+    values = np.asarray(latencies)
+    agent_calls = llm_calls(agent_orchestrator.get_agent_loop_stats()) - agent_calls
+    return {
+        "turns": args.turns,
+        "web_calls_per_turn": round((tool.remote_calls - web_calls) / args.turns, 3),
+        "llm_calls_per_turn": round(agent_calls / args.turns, 3),
+        **{
+            f"p{p}_seconds": round(float(np.percentile(values, p)), 4) for p in (50, 90)
+        },
+        "mean_seconds": round(float(values.mean()), 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--turns", type=int, default=16)
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use agenerate_response instead of generate_response",
+    )
+    parser.add_argument("--llm-first-token", type=float, default=0.8)
+    parser.add_argument("--llm-token-seconds", type=float, default=0.02)
+    parser.add_argument("--answer-tokens", type=int, default=60)
+    parser.add_argument("--search-seconds", type=float, default=1.5)
+    parser.add_argument("--vector-search-seconds", type=float, default=0.08)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    install_fakes(args)
+
+    print(f"Weak-score turns ({'async' if args.use_async else 'sync'}):")
+    modes = {}
+    for name, enabled in (("tools", False), ("web_prefetch", True)):
+        modes[name] = run_mode(name, enabled, args)
+        report = modes[name]
+        print(
+            f"  {name:<14}web calls/turn {report['web_calls_per_turn']:.2f}  "
+            f"LLM calls/turn {report['llm_calls_per_turn']:.2f}  "
+            f"p50 {report['p50_seconds']:.2f}s  p90 {report['p90_seconds']:.2f}s"
+        )
+
+    result = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {key: value for key, value in vars(args).items()},
+        "modes": modes,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
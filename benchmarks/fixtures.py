@@ -0,0 +1,461 @@
+"""
+Benchmark Fixtures - MentorIA
+Deterministic offline stand-ins shared by the benchmarks: a hashing
+embedding model, a chat model that answers without any API call, an
+in-memory chunk collection and a synthetic corpus generator. The same
+inputs always give the same vectors, answers and corpora, so timings are
+comparable run to run.
+
+The latency-injecting variants (SlowChatModel, SlowEmbeddings,
+slow_search_tool, slow_search_backend, LatencySaver) sleep like Gemini,
+Tavily and MongoDB would, for load tests.
+"""
+
+import asyncio
+import json
+import random
+import re
+import time
+import zlib
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import bson
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.tools import BaseTool, StructuredTool
+from langgraph.checkpoint.memory import InMemorySaver
+
+_TOKEN = re.compile(r"\w+")
+
+
+class HashEmbeddings(Embeddings):
+    """
+    Bag-of-words embeddings with the hashing trick: each token adds +-1 to
+    a dimension picked by its CRC32. Texts sharing words get similar
+    vectors, so retrieval results are meaningful and stable.
+    """
+
+    def __init__(self, dimensions: int = 768):
+        self.dimensions = dimensions
+
+    def _embed(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in _TOKEN.findall(text.lower()):
+            h = zlib.crc32(token.encode("utf-8"))
+            vector[h % self.dimensions] += 1.0 if h & 0x80000000 else -1.0
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+
+class EchoChatModel(BaseChatModel):
+    """
+    Chat model that answers instantly with a fixed sentence built from the
+    prompt size; tool binding is accepted and ignored.
+    """
+
+    @property
+    def _llm_type(self) -> str:
+        return "echo"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        size = sum(len(str(message.content)) for message in messages)
+        answer = AIMessage(content=f"Answer built from {size} prompt characters.")
+        return ChatResult(generations=[ChatGeneration(message=answer)])
+
+
+class _Cursor(list):
+    def sort(self, key: str, direction: int = 1):
+        return _Cursor(
+            sorted(self, key=lambda doc: str(doc.get(key)), reverse=direction < 0)
+        )
+
+
+class MemoryCollection:
+    """
+    In-memory stand-in for the chunk collection, covering the calls made
+    by store_in_mongodb and build_local_index.
+
+    Documents are kept BSON-encoded, so writes and reads pay a
+    serialization cost close to the driver's.
+    """
+
+    def __init__(self):
+        self._docs: Dict[Any, bytes] = {}
+        self._next_id = 0
+
+    def _matches(self, doc: dict, query: Optional[dict]) -> bool:
+        for field, condition in (query or {}).items():
+            if isinstance(condition, dict) and "$exists" in condition:
+                if (field in doc) != condition["$exists"]:
+                    return False
+            elif isinstance(condition, dict) and "$in" in condition:
+                if doc.get(field) not in condition["$in"]:
+                    return False
+            elif isinstance(condition, dict) and "$not" in condition:
+                if self._matches(doc, {field: condition["$not"]}):
+                    return False
+            elif isinstance(condition, dict) and condition.get("$type") == "string":
+                if not isinstance(doc.get(field), str):
+                    return False
+            elif doc.get(field) != condition:
+                return False
+        return True
+
+    def bulk_write(self, requests: List, ordered: bool = True):
+        upserted = modified = 0
+        for request in requests:
+            # pymongo exposes no public accessors on ReplaceOne
+            doc_id = request._filter["_id"]
+            if doc_id in self._docs:
+                modified += 1
+            else:
+                upserted += 1
+            self._docs[doc_id] = bson.encode({**request._doc, "_id": doc_id})
+        return SimpleNamespace(upserted_count=upserted, modified_count=modified)
+
+    def insert_many(self, documents: List[dict]):
+        ids = []
+        for doc in documents:
+            doc_id = doc.get("_id", f"auto-{self._next_id}")
+            self._next_id += 1
+            self._docs[doc_id] = bson.encode({**doc, "_id": doc_id})
+            ids.append(doc_id)
+        return SimpleNamespace(inserted_ids=ids)
+
+    def find(self, query: Optional[dict] = None, projection: Optional[dict] = None):
+        docs = _Cursor()
+        for raw in self._docs.values():
+            doc = bson.decode(raw)
+            if self._matches(doc, query):
+                if projection:
+                    doc = {
+                        k: v for k, v in doc.items() if k in projection or k == "_id"
+                    }
+                docs.append(doc)
+        return docs
+
+    def count_documents(self, query: Optional[dict] = None) -> int:
+        return len(self.find(query))
+
+    def delete_many(self, query: dict):
+        doomed = [doc["_id"] for doc in self.find(query, {"_id": 1})]
+        for doc_id in doomed:
+            del self._docs[doc_id]
+        return SimpleNamespace(deleted_count=len(doomed))
+
+
+_SYLLABLES = (
+    "ma ta ri co pe la do ne sa vi ro gu be fi lo nu ca de pi so "
+    "tra pro cen gen ver mor tal pes qui sis for ges"
+).split()
+
+
+def _vocabulary(size: int, rng: random.Random) -> List[str]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def synthetic_pages(
+    num_pages: int, chars_per_page: int = 3000, seed: int = 42
+) -> List[Document]:
+    """
+    Generates num_pages pseudo-text pages spread over files of 10 pages,
+    shaped like PyPDFLoader output (source and page metadata).
+    """
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(5000, rng)
+    pages = []
+    for i in range(num_pages):
+        paragraphs, length = [], 0
+        while length < chars_per_page:
+            sentence = " ".join(rng.choices(vocabulary, k=rng.randint(8, 20)))
+            paragraphs.append(sentence.capitalize() + ".")
+            length += len(sentence) + 2
+        pages.append(
+            Document(
+                page_content="\n\n".join(paragraphs),
+                metadata={"source": f"synthetic/doc_{i // 10:04d}.pdf", "page": i % 10},
+            )
+        )
+    return pages
+
+
+def sample_queries(pages: List[Document], count: int, seed: int = 7) -> Iterator[str]:
+    """
+    Yields count distinct questions made of words taken from the pages, so
+    every query has relevant chunks and none hits a cache.
+    """
+    rng = random.Random(seed)
+    seen = set()
+    attempts = 0
+    while len(seen) < count and attempts < count * 10:
+        attempts += 1
+        words = _TOKEN.findall(rng.choice(pages).page_content)
+        start = rng.randrange(max(1, len(words) - 6))
+        question = "What is " + " ".join(words[start : start + 6]) + "?"
+        if question not in seen:
+            seen.add(question)
+            yield question
+
+
+_latency_rng = random.Random(1234)
+
+
+def jittered(seconds: float, jitter: float = 0.25) -> float:
+    """Returns seconds varied uniformly by +-jitter (a fraction)."""
+    return max(0.0, seconds * _latency_rng.uniform(1 - jitter, 1 + jitter))
+
+
+def _last_turn(messages: List) -> List:
+    """
+    Messages after the last final answer: the current question, its tool
+    calls and their results (the prompt repeats the question at the end).
+    """
+    for i in range(len(messages) - 1, -1, -1):
+        message = messages[i]
+        if message.type == "ai" and not getattr(message, "tool_calls", None):
+            return messages[i + 1 :]
+    return messages
+
+
+class SlowChatModel(BaseChatModel):
+    """
+    Chat model with Gemini-like timing: a delay before the first token,
+    then one delay per token. Streams when asked to.
+
+    With tools bound, it calls the web search on tool_call_percent of the
+    questions (picked by a hash of the question, so always the same ones),
+    once per turn, searching tool_query_prefix + the question (a real
+    model rewords the question into a search query).
+    """
+
+    first_token_seconds: float = 0.8
+    token_seconds: float = 0.02
+    answer_tokens: int = 60
+    tool_call_percent: int = 30
+    tool_query_prefix: str = ""
+    tools_bound: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self.model_copy(update={"tools_bound": bool(tools)})
+
+    def _tool_call(self, messages: List) -> Optional[dict]:
+        turn = _last_turn(messages)
+        if not self.tools_bound or any(m.type == "tool" for m in turn):
+            return None
+        question = str([m for m in turn if m.type == "human"][-1].content)
+        h = zlib.crc32(question.encode("utf-8"))
+        if h % 100 >= self.tool_call_percent:
+            return None
+        return {
+            "name": "tavily_search",
+            "args": {"query": self.tool_query_prefix + question},
+            "id": f"call_{h}",
+        }
+
+    def _words(self) -> List[str]:
+        return [f"palavra{i % 17} " for i in range(self.answer_tokens)]
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        call = self._tool_call(messages)
+        time.sleep(jittered(self.first_token_seconds))
+        if call:
+            message = AIMessage(content="", tool_calls=[call])
+        else:
+            time.sleep(jittered(self.token_seconds * self.answer_tokens))
+            message = AIMessage(content="".join(self._words()))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        call = self._tool_call(messages)
+        await asyncio.sleep(jittered(self.first_token_seconds))
+        if call:
+            message = AIMessage(content="", tool_calls=[call])
+        else:
+            await asyncio.sleep(jittered(self.token_seconds * self.answer_tokens))
+            message = AIMessage(content="".join(self._words()))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _chunks(self, call: Optional[dict]) -> Iterator[ChatGenerationChunk]:
+        if call:
+            chunk = AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    {
+                        "name": call["name"],
+                        "args": json.dumps(call["args"]),
+                        "id": call["id"],
+                        "index": 0,
+                    }
+                ],
+            )
+            yield ChatGenerationChunk(message=chunk)
+            return
+        for word in self._words():
+            yield ChatGenerationChunk(message=AIMessageChunk(content=word))
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(jittered(self.first_token_seconds))
+        for i, chunk in enumerate(self._chunks(self._tool_call(messages))):
+            if i:
+                time.sleep(jittered(self.token_seconds))
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(jittered(self.first_token_seconds))
+        for i, chunk in enumerate(self._chunks(self._tool_call(messages))):
+            if i:
+                await asyncio.sleep(jittered(self.token_seconds))
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+
+class SlowEmbeddings(HashEmbeddings):
+    """HashEmbeddings that take as long as an embedding API round trip."""
+
+    def __init__(self, dimensions: int = 768, seconds: float = 0.15):
+        super().__init__(dimensions)
+        self.seconds = seconds
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(jittered(self.seconds))
+        return super().embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        time.sleep(jittered(self.seconds))
+        return super().embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        await asyncio.sleep(jittered(self.seconds))
+        return super().embed_query(text)
+
+
+def slow_search_tool(seconds: float = 1.5) -> BaseTool:
+    """A stand-in for the Tavily tool that answers after seconds."""
+
+    def results(query: str) -> dict:
+        return {
+            "query": query,
+            "results": [
+                {
+                    "title": f"Result {i}",
+                    "url": f"https://example.com/{i}",
+                    "content": query,
+                }
+                for i in range(3)
+            ],
+        }
+
+    def search(query: str) -> dict:
+        time.sleep(jittered(seconds))
+        return results(query)
+
+    async def asearch(query: str) -> dict:
+        await asyncio.sleep(jittered(seconds))
+        return results(query)
+
+    return StructuredTool.from_function(
+        func=search,
+        coroutine=asearch,
+        name="tavily_search",
+        description="Searches the web for the query.",
+    )
+
+
+def slow_search_backend(seconds: float = 0.08, text_chars: int = 900):
+    """
+    Returns sync and async vector search backends (query embedding, k) ->
+    chunks, answering after seconds with scores between 0.6 and 0.95.
+    """
+    rng = random.Random(99)
+    text = ("Texto de norma interna sobre rotinas administrativas. " * 20)[:text_chars]
+
+    def chunks(k: int) -> List[Dict]:
+        return [
+            {
+                "text": f"{i}: {text}",
+                "metadata": {"page": i},
+                "source": f"documents/norma_{i}.pdf",
+                "score": round(rng.uniform(0.6, 0.95), 4),
+            }
+            for i in range(k)
+        ]
+
+    def search(question_embedding: List[float], k: int) -> List[Dict]:
+        time.sleep(jittered(seconds))
+        return chunks(k)
+
+    async def asearch(question_embedding: List[float], k: int) -> List[Dict]:
+        await asyncio.sleep(jittered(seconds))
+        return chunks(k)
+
+    return search, asearch
+
+
+class LatencySaver(InMemorySaver):
+    """
+    In-memory checkpointer with MongoDB-like round trip times on every
+    read and write.
+    """
+
+    def __init__(self, read_seconds: float = 0.01, write_seconds: float = 0.015):
+        super().__init__()
+        self.read_seconds = read_seconds
+        self.write_seconds = write_seconds
+
+    def _delayed(self, seconds: float, fn: Callable, *args):
+        time.sleep(jittered(seconds))
+        return fn(*args)
+
+    async def _adelayed(self, seconds: float, fn: Callable, *args):
+        await asyncio.sleep(jittered(seconds))
+        return fn(*args)
+
+    def get_tuple(self, config):
+        return self._delayed(self.read_seconds, super().get_tuple, config)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        return self._delayed(
+            self.write_seconds, super().put, config, checkpoint, metadata, new_versions
+        )
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        return self._delayed(
+            self.write_seconds, super().put_writes, config, writes, task_id, task_path
+        )
+
+    async def aget_tuple(self, config):
+        return await self._adelayed(self.read_seconds, super().get_tuple, config)
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        return await self._adelayed(
+            self.write_seconds, super().put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        return await self._adelayed(
+            self.write_seconds, super().put_writes, config, writes, task_id, task_path
+        )
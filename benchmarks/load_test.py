@@ -0,0 +1,348 @@
+"""
+Conversation Load Test - MentorIA
+Drives generate_response_stream (or generate_response, or their async
+variants) from N concurrent simulated sessions, each with its own
+thread_id and a multi-turn script, and sweeps N to find where latency
+knees. Gemini, Tavily and MongoDB are replaced by latency-injecting fakes
+(benchmarks/fixtures.py), so it runs on a laptop.
+
+Reports per concurrency level: time to first token and full response
+latency percentiles, turns per second, the knee (first level whose p99
+exceeds --knee-factor times the single-level baseline) and the highest
+level meeting --slo-p99, i.e. the sessions one replica can hold.
+
+Usage:
+  python benchmarks/load_test.py
+  python benchmarks/load_test.py --levels 1 8 32 64 --turns 6 --async
+  python benchmarks/load_test.py --llm-first-token 1.2 --search-seconds 2
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("GOOGLE_API_KEY", "load-test-placeholder-key")
+os.environ.setdefault("TAVILY_API_KEY", "load-test-placeholder-key")
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+os.environ["RETRIEVAL_BACKEND"] = "load_test"
+os.environ["EMBEDDING_CACHE_BACKEND"] = "memory"
+os.environ["WEB_SEARCH_CACHE_BACKEND"] = "memory"
+
+import numpy as np  # noqa: E402
+
+from benchmarks.fixtures import (  # noqa: E402
+    LatencySaver,
+    SlowChatModel,
+    SlowEmbeddings,
+    slow_search_backend,
+    slow_search_tool,
+)
+
+DEFAULT_OUTPUT = ".cache/benchmarks/load_test.json"
+
+# Mixes knowledge base questions, rewrites and small talk like real
+# onboarding conversations, so the router and tool policy paths all run
+SCRIPTS = [
+    [
+        "Olá!",
+        "Como funciona o registro de comparecimento ao serviço?",
+        "Quem aprova as horas extras no sistema de ponto?",
+        "Resuma em tópicos",
+        "Qual é a política de uso de redes sociais?",
+        "Obrigado!",
+    ],
+    [
+        "Quais são as regras da Lei de Estágio para a jornada?",
+        "E o estagiário tem direito a recesso?",
+        "Explique isso de novo",
+        "Onde encontro o código de conduta ética?",
+        "Como reporto um conflito de interesses?",
+        "Valeu",
+    ],
+    [
+        "What does the data governance policy say about sharing data?",
+        "Who is the data owner for business data?",
+        "Translate that in portuguese",
+        "What is the Embrapa management system SEG?",
+        "How does the risk management policy define integrity?",
+        "thanks",
+    ],
+]
+
+
+def install_fakes(args) -> None:
+    """
+    Replaces every remote service with its latency-injecting fake. Must
+    run before the first request, which builds the graph and its clients.
+    """
+    from src.core import runnables
+    from src.core.graph import graph_builder, nodes, retrieval
+
+    saver = LatencySaver(args.mongo_read_seconds, args.mongo_write_seconds)
+    graph_builder.get_checkpointer = lambda: saver
+
+    search, asearch = slow_search_backend(args.vector_search_seconds)
+    retrieval.RETRIEVAL_BACKENDS["load_test"] = search
+    retrieval.ASYNC_RETRIEVAL_BACKENDS["load_test"] = asearch
+
+    llm = SlowChatModel(
+        first_token_seconds=args.llm_first_token,
+        token_seconds=args.llm_token_seconds,
+        answer_tokens=args.answer_tokens,
+        tool_call_percent=args.tool_call_percent,
+    )
+    embeddings = SlowEmbeddings(seconds=args.embed_seconds)
+    runnables.get_llm_model = lambda temperature=0.3, model=None: llm
+    runnables.get_embedding_model = lambda: embeddings
+    runnables.invalidate_runnables()
+
+    nodes.get_tavily_search_tool = lambda: slow_search_tool(args.search_seconds)
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    array = np.asarray(values)
+    return {f"p{p}": round(float(np.percentile(array, p)), 4) for p in (50, 90, 99)}
+
+
+class TurnLog:
+    """Thread-safe record of every turn's timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.first_token: List[float] = []
+        self.total: List[float] = []
+        self.errors = 0
+
+    def record(self, first_token: Optional[float], total: float) -> None:
+        with self._lock:
+            self.total.append(total)
+            if first_token is not None:
+                self.first_token.append(first_token)
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+
+def run_session(orchestrator, session_id: str, script: List[str], args, log: TurnLog):
+    for question in script[: args.turns]:
+        started = time.perf_counter()
+        first_token = None
+        try:
+            if args.no_stream:
+                orchestrator.generate_response(question, session_id, "Ana", "Analista")
+            else:
+                stream = orchestrator.generate_response_stream(
+                    question, session_id, "Ana", "Analista"
+                )
+                for _ in stream:
+                    if first_token is None:
+                        first_token = time.perf_counter() - started
+        except Exception as e:
+            print(f"Turn failed in {session_id}: {e}", file=sys.stderr)
+            log.record_error()
+            continue
+        log.record(first_token, time.perf_counter() - started)
+        if args.think_time:
+            time.sleep(args.think_time)
+
+
+async def arun_session(
+    orchestrator, session_id: str, script: List[str], args, log: TurnLog
+):
+    for question in script[: args.turns]:
+        started = time.perf_counter()
+        first_token = None
+        try:
+            if args.no_stream:
+                await orchestrator.agenerate_response(
+                    question, session_id, "Ana", "Analista"
+                )
+            else:
+                stream = orchestrator.agenerate_response_stream(
+                    question, session_id, "Ana", "Analista"
+                )
+                async for _ in stream:
+                    if first_token is None:
+                        first_token = time.perf_counter() - started
+        except Exception as e:
+            print(f"Turn failed in {session_id}: {e}", file=sys.stderr)
+            log.record_error()
+            continue
+        log.record(first_token, time.perf_counter() - started)
+        if args.think_time:
+            await asyncio.sleep(args.think_time)
+
+
+def run_level(orchestrator, level: int, args) -> dict:
+    """Runs `level` concurrent sessions to completion and summarizes them."""
+    log = TurnLog()
+    scripts = [SCRIPTS[i % len(SCRIPTS)] for i in range(level)]
+    session_ids = [f"load-{args.run_id}-{level}-{i}" for i in range(level)]
+
+    started = time.perf_counter()
+    # The graph prints every node; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        if args.use_async:
+
+            async def run_all():
+                await asyncio.gather(
+                    *(
+                        arun_session(orchestrator, sid, script, args, log)
+                        for sid, script in zip(session_ids, scripts)
+                    )
+                )
+
+            asyncio.run(run_all())
+        else:
+            with ThreadPoolExecutor(max_workers=level) as pool:
+                for future in [
+                    pool.submit(run_session, orchestrator, sid, script, args, log)
+                    for sid, script in zip(session_ids, scripts)
+                ]:
+                    future.result()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "concurrency": level,
+        "turns": len(log.total),
+        "errors": log.errors,
+        "seconds": round(elapsed, 3),
+        "turns_per_second": round(len(log.total) / elapsed, 3),
+        "first_token_seconds": percentiles(log.first_token),
+        "total_seconds": percentiles(log.total),
+    }
+
+
+def find_knee(levels: List[dict], factor: float) -> Optional[int]:
+    """
+    First concurrency whose p99 latency exceeds factor times the lowest
+    level's; None if latency stays flat over the sweep.
+    """
+    baseline = levels[0]["total_seconds"].get("p99")
+    for level in levels[1:]:
+        if baseline and level["total_seconds"].get("p99", 0) > factor * baseline:
+            return level["concurrency"]
+    return None
+
+
+def max_within_slo(levels: List[dict], slo_p99: float) -> Optional[int]:
+    within = [
+        level["concurrency"]
+        for level in levels
+        if not level["errors"] and level["total_seconds"].get("p99", 0) <= slo_p99
+    ]
+    return max(within) if within else None
+
+
+def print_level(level: dict) -> None:
+    ttft = level["first_token_seconds"]
+    total = level["total_seconds"]
+    ttft_text = f"ttft p50 {ttft['p50']:.2f} p99 {ttft['p99']:.2f}s  " if ttft else ""
+    print(
+        f"  {level['concurrency']:4d} sessions  {level['turns_per_second']:7.2f} turns/s  "
+        f"{ttft_text}total p50 {total['p50']:.2f} p90 {total['p90']:.2f} "
+        f"p99 {total['p99']:.2f}s  errors {level['errors']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--levels",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16, 32, 64],
+        help="Concurrent session counts to sweep",
+    )
+    parser.add_argument("--turns", type=int, default=4, help="Turns per session")
+    parser.add_argument("--think-time", type=float, default=0.0)
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Use the async API (as the FastAPI server does) instead of threads",
+    )
+    parser.add_argument(
+        "--no-stream", action="store_true", help="Call generate_response instead"
+    )
+    parser.add_argument("--llm-first-token", type=float, default=0.8)
+    parser.add_argument("--llm-token-seconds", type=float, default=0.02)
+    parser.add_argument("--answer-tokens", type=int, default=60)
+    parser.add_argument("--tool-call-percent", type=int, default=30)
+    parser.add_argument("--embed-seconds", type=float, default=0.15)
+    parser.add_argument("--search-seconds", type=float, default=1.5)
+    parser.add_argument("--vector-search-seconds", type=float, default=0.08)
+    parser.add_argument("--mongo-read-seconds", type=float, default=0.01)
+    parser.add_argument("--mongo-write-seconds", type=float, default=0.015)
+    parser.add_argument("--knee-factor", type=float, default=1.5)
+    parser.add_argument(
+        "--slo-p99", type=float, default=10.0, help="p99 turn latency target (s)"
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+    args.run_id = int(time.time())
+
+    install_fakes(args)
+    from src.core import agent_orchestrator
+
+    mode = "async" if args.use_async else "threads"
+    api = "generate_response" if args.no_stream else "generate_response_stream"
+    print(f"Load test: {api} ({mode}), {args.turns} turns per session")
+
+    levels = []
+    for level in sorted(set(args.levels)):
+        levels.append(run_level(agent_orchestrator, level, args))
+        print_level(levels[-1])
+
+    knee = find_knee(levels, args.knee_factor)
+    capacity = max_within_slo(levels, args.slo_p99)
+    best = max(levels, key=lambda level: level["turns_per_second"])
+    print(
+        f"\nPeak throughput {best['turns_per_second']:.2f} turns/s at "
+        f"{best['concurrency']} sessions"
+    )
+    print(
+        f"Latency knee (p99 > {args.knee_factor}x baseline): "
+        f"{knee if knee else 'not reached'}"
+    )
+    print(
+        f"Max sessions with p99 <= {args.slo_p99}s: "
+        f"{capacity if capacity else 'none'}"
+    )
+
+    result = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {
+            key: value for key, value in vars(args).items() if key != "run_id"
+        },
+        "levels": levels,
+        "knee_concurrency": knee,
+        "max_concurrency_within_slo": capacity,
+        "peak_throughput_concurrency": best["concurrency"],
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+HTTP API - MentorIA
+ASGI service exposing MentorIA over HTTP, with server-sent events for
+streaming answers. Alternative to the Streamlit interface for bots and
+load-balanced deployments; contains no business logic or AI logic.
+
+Usage:
+  uvicorn src.api:api --host 0.0.0.0 --port 8000 --workers 4
+  python src/main.py serve --workers 4
+"""
+
+import asyncio
+import json
+import os
+import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn  # noqa: E402
+from fastapi import FastAPI, HTTPException  # noqa: E402
+from fastapi.responses import (  # noqa: E402
+    JSONResponse,
+    PlainTextResponse,
+    StreamingResponse,
+)
+from pydantic import BaseModel  # noqa: E402
+
+from src.config import (  # noqa: E402
+    API_HOST,
+    API_PORT,
+    API_WARM_UP,
+    API_WORKERS,
+    aclose_mongodb_client,
+    close_mongodb_client,
+    get_async_mongodb_client,
+)
+from src.core.agent_orchestrator import (  # noqa: E402
+    agenerate_response,
+    agenerate_response_stream,
+    aget_session_history,
+    warm_up,
+)
+from src.core.graph.graph_builder import ainitialize_conversation  # noqa: E402
+from src.core.telemetry import render_metrics  # noqa: E402
+from src.core.utils import extract_response_text  # noqa: E402
+
+
+class MessageRequest(BaseModel):
+    question: str
+    user_name: str = "Employee"
+    user_role: str = "New Role"
+
+
+class MessageResponse(BaseModel):
+    session_id: str
+    answer: str
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    if API_WARM_UP:
+        # Blocking client setup, kept off the event loop
+        await asyncio.to_thread(warm_up)
+    yield
+    await aclose_mongodb_client()
+    close_mongodb_client()
+
+
+api = FastAPI(title="MentorIA API", lifespan=lifespan)
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@api.get("/healthz")
+async def healthz():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "ok"}
+
+
+@api.get("/readyz")
+async def readyz():
+    """Readiness probe: MongoDB (knowledge base and checkpoints) answers."""
+    try:
+        await get_async_mongodb_client().admin.command("ping")
+    except Exception as e:
+        return JSONResponse(
+            status_code=503, content={"status": "unavailable", "error": str(e)}
+        )
+    return {"status": "ready"}
+
+
+@api.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint: latency histograms and cache counters."""
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@api.get("/sessions/{session_id}/messages")
+async def get_messages(session_id: str):
+    """Returns the conversation history of a session."""
+    history = await aget_session_history(session_id)
+    return {
+        "session_id": session_id,
+        "messages": [
+            {
+                "role": "user" if msg.type == "human" else "assistant",
+                "content": extract_response_text(msg),
+            }
+            for msg in history
+            if msg.type in ("human", "ai") and extract_response_text(msg)
+        ],
+    }
+
+
+@api.post("/sessions/{session_id}/messages", response_model=MessageResponse)
+async def post_message(session_id: str, request: MessageRequest):
+    """Answers a question and returns the complete response."""
+    if not request.question.strip():
+        raise HTTPException(status_code=422, detail="question must not be empty")
+
+    await ainitialize_conversation(session_id, request.user_name)
+    answer = await agenerate_response(
+        question=request.question,
+        session_id=session_id,
+        user_name=request.user_name,
+        user_role=request.user_role,
+    )
+    return MessageResponse(session_id=session_id, answer=extract_response_text(answer))
+
+
+@api.post("/sessions/{session_id}/messages/stream")
+async def stream_message(session_id: str, request: MessageRequest):
+    """
+    Answers a question as server-sent events: one 'token' event per text
+    chunk, then 'done' (or 'error').
+    """
+    if not request.question.strip():
+        raise HTTPException(status_code=422, detail="question must not be empty")
+
+    await ainitialize_conversation(session_id, request.user_name)
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for text in agenerate_response_stream(
+                question=request.question,
+                session_id=session_id,
+                user_name=request.user_name,
+                user_role=request.user_role,
+            ):
+                yield _sse_event("token", {"text": text})
+        except Exception as e:
+            yield _sse_event("error", {"error": str(e)})
+            return
+        yield _sse_event("done", {"session_id": session_id})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def run(host: str = API_HOST, port: int = API_PORT, workers: int = API_WORKERS):
+    """
+    Runs the API with uvicorn. Each worker is a separate process with its
+    own connection pool; conversation state lives in the checkpointer, so
+    any worker can serve any session.
+    """
+    uvicorn.run("src.api:api", host=host, port=port, workers=workers)
+
+
+if __name__ == "__main__":
+    run()
@@ -15,11 +15,8 @@ from src.core.utils import extract_response_text
 
 import streamlit as st  # noqa: E402
 from streamlit_extras.add_vertical_space import add_vertical_space  # noqa: E402
-from src.core.agent_orchestrator import (
-    generate_response_stream,
-    get_session_history,
-)
-from src.core.graph.graph_builder import initialize_conversation
+from src.core.agent_orchestrator import generate_response_stream
+from src.core.session_cache import ConversationSessionCache
 
 st.set_page_config(
     page_title="MentorIA - Onboarding Assistant",
@@ -41,28 +38,23 @@ with st.sidebar:
     st.text_input("Role", key="user_role", placeholder="Enter your role")
     add_vertical_space(2)
     if st.button("Start new session"):
-        st.session_state.conversation_id = str(uuid.uuid4())
-        st.session_state.messages = []
-        st.session_state.history_loaded = False
+        ConversationSessionCache(st.session_state).start(str(uuid.uuid4()))
         st.rerun()
     st.divider()
 
     st.markdown("### 🛠️ Admin")
 
+session = ConversationSessionCache(st.session_state)
+
 if "conversation_id" not in st.session_state:
-    st.session_state.conversation_id = str(uuid.uuid4())
+    session.start(str(uuid.uuid4()))
 
 user_name = st.session_state.get("user_name", "Employee")
 
-initialize_conversation(st.session_state.conversation_id, user_name)
-
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-
-history = get_session_history(st.session_state.conversation_id)
-st.session_state.messages = history
+# Read from the checkpointer only on the first run of a conversation
+history = session.history(user_name)
 
-for msg in st.session_state.messages:
+for msg in history:
     role = "user" if msg.type == "human" else "assistant"
     with st.chat_message(role):
         clean_content = extract_response_text(msg)
@@ -78,7 +70,7 @@ if prompt:
         try:
             stream_generator = generate_response_stream(
                 question=prompt,
-                session_id=st.session_state.conversation_id,
+                session_id=session.conversation_id,
                 user_name=st.session_state.get("user_name", "Employee"),
                 user_role=st.session_state.get("user_role", "New Role"),
             )
@@ -90,6 +82,7 @@ if prompt:
             response_text = None
 
     if response_text:
-        st.session_state.messages = get_session_history(
-            st.session_state.conversation_id
-        )
+        session.append_exchange(prompt, response_text)
+    else:
+        # The checkpoint may hold a partial turn: reload it on the next run
+        session.invalidate()
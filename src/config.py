@@ -3,23 +3,162 @@ Configuration Module - MentorIA Core
 Manages loading credentials from environment variables.
 """
 
+import atexit
 import os
-from langchain_google_genai import (
-    GoogleGenerativeAIEmbeddings,
-    ChatGoogleGenerativeAI,
-)
-from langchain_tavily import TavilySearch
-from pymongo import MongoClient
+import threading
+from typing import TYPE_CHECKING
+
+from pymongo import AsyncMongoClient, MongoClient, monitoring
+
+# The Google GenAI and Tavily clients take seconds to import: they are
+# imported by the factories below, on first use, so commands that never
+# call a model (ingest --help, compact-checkpoints, ...) skip them
+if TYPE_CHECKING:
+    from langchain_google_genai import (
+        ChatGoogleGenerativeAI,
+        GoogleGenerativeAIEmbeddings,
+    )
+    from langchain_tavily import TavilySearch
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 
 
 MONGODB_CONNECTION_STRING = os.getenv("MONGODB_CONNECTION_STRING")
 
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "50"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+MONGODB_MAX_IDLE_TIME_MS = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "300000"))
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = int(
+    os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000")
+)
+MONGODB_CONNECT_TIMEOUT_MS = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "10000"))
+MONGODB_SOCKET_TIMEOUT_MS = int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", "30000"))
+MONGODB_READ_PREFERENCE = os.getenv("MONGODB_READ_PREFERENCE", "primaryPreferred")
+
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
 
+EMBEDDING_MODEL_NAME = os.getenv("EMBEDDING_MODEL", "models/embedding-001")
+
+LLM_MODEL_NAME = os.getenv("LLM_MODEL", "gemini-2.5-pro")
+
+# How the assistant addresses users who did not give their name
+DEFAULT_USER_NAME = "Colaborador"
+
+# Retrieval backend: "atlas" ($vectorSearch) or "local" (memory-mapped index)
+RETRIEVAL_BACKEND = os.getenv("RETRIEVAL_BACKEND", "atlas")
+LOCAL_INDEX_PATH = os.getenv("LOCAL_INDEX_PATH", ".cache/vector_index")
+# Chunk embedding storage, chosen at ingest time: "float" (array of
+# doubles), "int8" (scalar-quantized) or "binary" (one bit per dimension).
+# Quantized modes keep a float32 copy to rescore the best
+# k * QUANTIZED_RESCORE_FACTOR candidates. Switching modes requires
+# ingest --full-refresh and an Atlas vector index matching the new type.
+EMBEDDING_STORAGE = os.getenv("EMBEDDING_STORAGE", "float").lower()
+QUANTIZED_RESCORE_FACTOR = int(os.getenv("QUANTIZED_RESCORE_FACTOR", "4"))
+# Seconds a finished search keeps being shared with identical questions
+RETRIEVAL_SINGLE_FLIGHT_GRACE_SECONDS = float(
+    os.getenv("RETRIEVAL_SINGLE_FLIGHT_GRACE_SECONDS", "2")
+)
+
+# Retrieval router: set ROUTER_ENABLED=false to search on every turn
+ROUTER_ENABLED = os.getenv("ROUTER_ENABLED", "true").lower() == "true"
+ROUTER_CONTEXT_TTL_SECONDS = float(os.getenv("ROUTER_CONTEXT_TTL_SECONDS", "1800"))
+
+# Tool binding by retrieval score: no web search tool at or above STRONG,
+# web search run before the first LLM call, which gets its results, below WEAK
+TOOL_POLICY_ENABLED = os.getenv("TOOL_POLICY_ENABLED", "true").lower() == "true"
+TOOL_POLICY_STRONG_SCORE = float(os.getenv("TOOL_POLICY_STRONG_SCORE", "0.85"))
+TOOL_POLICY_WEAK_SCORE = float(os.getenv("TOOL_POLICY_WEAK_SCORE", "0.7"))
+
+# Per-request latency budget (0 disables it). Retrieval and each web search
+# get their own timeout; ANSWER_RESERVE_SECONDS is kept for the final answer,
+# so tools are withheld and summarization skipped when less remains.
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "30"))
+RETRIEVAL_TIMEOUT_SECONDS = float(os.getenv("RETRIEVAL_TIMEOUT_SECONDS", "5"))
+TOOL_TIMEOUT_SECONDS = float(os.getenv("TOOL_TIMEOUT_SECONDS", "8"))
+ANSWER_RESERVE_SECONDS = float(os.getenv("ANSWER_RESERVE_SECONDS", "10"))
+# Threads running sync retrieval, tool calls and summaries under a timeout:
+# calls beyond this many wait for a free worker
+DEADLINE_POOL_WORKERS = int(os.getenv("DEADLINE_POOL_WORKERS", "32"))
+
+# Estimated tokens of retrieved knowledge base text sent to the agent
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CONTEXT_TOKEN_BUDGET", "1500"))
+
+# Chat history sent to the agent: once the earlier turns exceed
+# HISTORY_MAX_TURNS or HISTORY_TOKEN_BUDGET, the oldest are folded into a
+# running summary until HISTORY_KEEP_TURNS remain verbatim
+HISTORY_MAX_TURNS = int(os.getenv("HISTORY_MAX_TURNS", "8"))
+HISTORY_KEEP_TURNS = int(os.getenv("HISTORY_KEEP_TURNS", "4"))
+HISTORY_TOKEN_BUDGET = int(os.getenv("HISTORY_TOKEN_BUDGET", "3000"))
+HISTORY_SUMMARY_MAX_WORDS = int(os.getenv("HISTORY_SUMMARY_MAX_WORDS", "250"))
+
+# Telemetry: metrics are always kept in memory (served at /metrics); set
+# TELEMETRY_JSON_LOGS=true to also log every span as a JSON line on stderr
+TELEMETRY_JSON_LOGS = os.getenv("TELEMETRY_JSON_LOGS", "false").lower() == "true"
+
+# Conversation checkpoints: latest checkpoints kept per session (0 keeps
+# all) and seconds after which idle sessions expire (0 never expires)
+CHECKPOINT_KEEP_LAST = int(os.getenv("CHECKPOINT_KEEP_LAST", "10"))
+CHECKPOINT_TTL_SECONDS = int(os.getenv("CHECKPOINT_TTL_SECONDS", "2592000"))
+
+# Semantic answer cache consulted before running the graph
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "1000"))
+SEMANTIC_CACHE_TTL_SECONDS = float(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "86400"))
+SEMANTIC_CACHE_MIN_WORDS = int(os.getenv("SEMANTIC_CACHE_MIN_WORDS", "3"))
+SEMANTIC_CACHE_VERSION_CHECK_SECONDS = float(
+    os.getenv("SEMANTIC_CACHE_VERSION_CHECK_SECONDS", "60")
+)
+
+# HTTP API server. With API_WARM_UP each worker builds the graph, opens
+# MongoDB and creates the model clients before accepting requests, instead
+# of on the first request
+API_HOST = os.getenv("API_HOST", "0.0.0.0")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+API_WORKERS = int(os.getenv("API_WORKERS", "1"))
+API_WARM_UP = os.getenv("API_WARM_UP", "true").lower() == "true"
+
+# Ingestion embedding engine
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "100"))
+EMBED_CONCURRENCY = int(os.getenv("EMBED_CONCURRENCY", "4"))
+EMBED_REQUESTS_PER_MINUTE = float(os.getenv("EMBED_REQUESTS_PER_MINUTE", "0"))
+EMBED_MAX_RETRIES = int(os.getenv("EMBED_MAX_RETRIES", "5"))
+
+# Parallel document loading (0 workers = one per CPU core)
+LOADER_WORKERS = int(os.getenv("LOADER_WORKERS", "0"))
+LOADER_PAGES_PER_TASK = int(os.getenv("LOADER_PAGES_PER_TASK", "0"))
+
+# Incremental ingestion manifest: "mongo" (next to the chunks) or "file"
+INGEST_MANIFEST_BACKEND = os.getenv("INGEST_MANIFEST_BACKEND", "mongo")
+INGEST_MANIFEST_PATH = os.getenv("INGEST_MANIFEST_PATH", ".cache/ingest_manifest.json")
 
-def get_embedding_model() -> GoogleGenerativeAIEmbeddings:
+# Knowledge base version, bumped by ingestion and watched by the semantic
+# answer cache: "mongo" (<COLLECTION>_meta) or "file" (KB_VERSION_PATH)
+KB_VERSION_BACKEND = os.getenv("KB_VERSION_BACKEND", INGEST_MANIFEST_BACKEND)
+KB_VERSION_PATH = os.getenv(
+    "KB_VERSION_PATH", os.path.splitext(INGEST_MANIFEST_PATH)[0] + ".version"
+)
+
+# Query-embedding cache: "memory", "file" (SQLite) or "mongo"
+EMBEDDING_CACHE_BACKEND = os.getenv("EMBEDDING_CACHE_BACKEND", "memory")
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "2048"))
+EMBEDDING_CACHE_TTL_SECONDS = float(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", "604800"))
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", ".cache/query_embeddings.db")
+EMBEDDING_CACHE_COLLECTION = os.getenv(
+    "EMBEDDING_CACHE_COLLECTION", "query_embedding_cache"
+)
+
+# Web search (Tavily) result cache: "memory", "file" (SQLite) or "mongo"
+WEB_SEARCH_CACHE_BACKEND = os.getenv("WEB_SEARCH_CACHE_BACKEND", "memory")
+WEB_SEARCH_CACHE_SIZE = int(os.getenv("WEB_SEARCH_CACHE_SIZE", "512"))
+WEB_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("WEB_SEARCH_CACHE_TTL_SECONDS", "21600"))
+WEB_SEARCH_CACHE_PATH = os.getenv("WEB_SEARCH_CACHE_PATH", ".cache/web_search.db")
+WEB_SEARCH_CACHE_COLLECTION = os.getenv(
+    "WEB_SEARCH_CACHE_COLLECTION", "web_search_cache"
+)
+
+
+def get_embedding_model() -> "GoogleGenerativeAIEmbeddings":
     """
     Loads the embedding model.
 
@@ -28,42 +167,253 @@ def get_embedding_model() -> GoogleGenerativeAIEmbeddings:
     """
     if not GOOGLE_API_KEY:
         raise ValueError("GOOGLE_API_KEY not found in environment variables")
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
     return GoogleGenerativeAIEmbeddings(
-        model="models/embedding-001", google_api_key=GOOGLE_API_KEY
+        model=EMBEDDING_MODEL_NAME, google_api_key=GOOGLE_API_KEY
     )
 
 
+class _PoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Collects connection pool counters for the shared MongoDB client.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {
+            "connections_created": 0,
+            "connections_closed": 0,
+            "checked_out": 0,
+            "checkout_failures": 0,
+            "pool_clears": 0,
+        }
+
+    def _incr(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["open_connections"] = (
+            stats["connections_created"] - stats["connections_closed"]
+        )
+        return stats
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._incr("pool_clears")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._incr("connections_created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._incr("connections_closed")
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._incr("checkout_failures")
+
+    def connection_checked_out(self, event):
+        self._incr("checked_out")
+
+    def connection_checked_in(self, event):
+        self._incr("checked_out", -1)
+
+
+class MongoConnectionManager:
+    """
+    Process-wide owner of a single pooled MongoClient.
+
+    MongoClient is thread-safe and keeps its own connection pool, so one
+    instance is shared by retrieval, ingestion and the checkpointer instead
+    of paying a new handshake on every request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._async_client = None
+        self._listener = _PoolStatsListener()
+
+    def _client_options(self) -> dict:
+        if not MONGODB_CONNECTION_STRING:
+            raise ValueError(
+                "MONGODB_CONNECTION_STRING not found in environment variables"
+            )
+        return {
+            "host": MONGODB_CONNECTION_STRING,
+            "maxPoolSize": MONGODB_MAX_POOL_SIZE,
+            "minPoolSize": MONGODB_MIN_POOL_SIZE,
+            "maxIdleTimeMS": MONGODB_MAX_IDLE_TIME_MS,
+            "serverSelectionTimeoutMS": MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            "connectTimeoutMS": MONGODB_CONNECT_TIMEOUT_MS,
+            "socketTimeoutMS": MONGODB_SOCKET_TIMEOUT_MS,
+            "readPreference": MONGODB_READ_PREFERENCE,
+            "appname": "mentoria",
+            "event_listeners": [self._listener],
+        }
+
+    def get_client(self) -> MongoClient:
+        """
+        Returns the shared client, creating it on first use.
+
+        Returns:
+            MongoClient: Shared MongoDB client.
+
+        Raises:
+            ValueError: If MONGODB_CONNECTION_STRING is not set
+        """
+        if self._client is not None:
+            return self._client
+
+        with self._lock:
+            if self._client is None:
+                self._client = MongoClient(**self._client_options())
+            return self._client
+
+    def get_async_client(self) -> AsyncMongoClient:
+        """
+        Returns the shared asyncio client, creating it on first use.
+
+        The async client binds to the event loop that first uses it, so it
+        is meant for a single server loop.
+
+        Returns:
+            AsyncMongoClient: Shared asyncio MongoDB client.
+        """
+        if self._async_client is not None:
+            return self._async_client
+
+        with self._lock:
+            if self._async_client is None:
+                self._async_client = AsyncMongoClient(**self._client_options())
+            return self._async_client
+
+    def close(self) -> None:
+        """
+        Closes the shared client. A later get_client() opens a new one.
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared asyncio client.
+        """
+        client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.close()
+
+    def stats(self) -> dict:
+        """
+        Returns connection pool counters and the configured pool settings.
+        """
+        stats = self._listener.snapshot()
+        stats.update(
+            {
+                "connected": self._client is not None,
+                "async_connected": self._async_client is not None,
+                "max_pool_size": MONGODB_MAX_POOL_SIZE,
+                "min_pool_size": MONGODB_MIN_POOL_SIZE,
+                "read_preference": MONGODB_READ_PREFERENCE,
+            }
+        )
+        return stats
+
+
+_mongodb_manager = MongoConnectionManager()
+atexit.register(_mongodb_manager.close)
+
+
 def get_mongodb_client() -> MongoClient:
     """
-    Loads the MongoDB client.
+    Loads the shared MongoDB client.
+
+    The client is pooled and shared across the process; callers must not
+    close it. Use close_mongodb_client() for an explicit shutdown.
 
     Returns:
         MongoClient: MongoDB client.
     """
-    if not MONGODB_CONNECTION_STRING:
-        raise ValueError("MONGODB_CONNECTION_STRING not found in environment variables")
-    return MongoClient(MONGODB_CONNECTION_STRING)
+    return _mongodb_manager.get_client()
+
+
+def get_async_mongodb_client() -> AsyncMongoClient:
+    """
+    Loads the shared asyncio MongoDB client (same pool settings as
+    get_mongodb_client). Callers must not close it.
+
+    Returns:
+        AsyncMongoClient: asyncio MongoDB client.
+    """
+    return _mongodb_manager.get_async_client()
+
+
+def close_mongodb_client() -> None:
+    """
+    Closes the shared MongoDB client and its connection pool.
+    """
+    _mongodb_manager.close()
 
 
-def get_llm_model(temperature=0.3) -> ChatGoogleGenerativeAI:
+async def aclose_mongodb_client() -> None:
+    """
+    Closes the shared asyncio MongoDB client. Call it from the event loop
+    that used the client, e.g. on server shutdown.
+    """
+    await _mongodb_manager.aclose()
+
+
+def get_mongodb_pool_stats() -> dict:
+    """
+    Returns statistics about the shared MongoDB connection pool.
+
+    Returns:
+        dict: Pool counters (open/checked-out connections, failures) and
+            the configured pool settings.
+    """
+    return _mongodb_manager.stats()
+
+
+def get_llm_model(temperature=0.3, model=None) -> "ChatGoogleGenerativeAI":
     """
     Creates a configured LLM instance.
 
     Args:
         temperature: Temperature for the LLM (default: 0.3)
+        model: Model name (default: LLM_MODEL env, gemini-2.5-pro)
 
     Returns:
         ChatGoogleGenerativeAI: Configured LLM instance
     """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     return ChatGoogleGenerativeAI(
-        model="gemini-2.5-pro",
+        model=model or LLM_MODEL_NAME,
         google_api_key=GOOGLE_API_KEY,
         temperature=temperature,
         response_mime_type="text/plain",
     )
 
 
-def get_tavily_search_tool() -> TavilySearch:
+def get_tavily_search_tool() -> "TavilySearch":
     """
     Creates a Tavily search tool instance.
 
@@ -75,6 +425,8 @@ def get_tavily_search_tool() -> TavilySearch:
     """
     if not TAVILY_API_KEY:
         raise ValueError("TAVILY_API_KEY not found in environment variables")
+    from langchain_tavily import TavilySearch
+
     return TavilySearch(
         max_results=3,
         api_key=TAVILY_API_KEY,
@@ -3,31 +3,222 @@ Chain Module - MentorIA Core
 Responsible for orchestrating the execution graph using LangGraph.
 """
 
-from src.core.graph.graph_builder import app
+import re
+import sys
+import time
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from src.config import (
+    LOCAL_INDEX_PATH,
+    RETRIEVAL_BACKEND,
+    SEMANTIC_CACHE_ENABLED,
+    get_mongodb_pool_stats,
+)
+from src.core.deadline import deadline_configurable, deadline_stats, get_deadline_stats
+from src.core.embedding_cache import (
+    get_query_embedding_cache,
+    peek_query_embedding_cache,
+)
+from src.core.graph.graph_builder import aget_app, get_app
+from src.core.graph.nodes import get_tools, peek_web_search_tool
+from src.core.graph.retrieval import get_search_coalescing_stats
+from src.core.graph.router import get_routing_stats
 from src.core.graph.state import MentoriaState
+from src.core.graph.tool_policy import get_agent_loop_stats
+from src.core.graph.vector_index import get_local_index
+from src.core.runnables import get_agent_chain, get_summary_chain
+from src.core.semantic_cache import (
+    CachedAnswer,
+    get_semantic_cache,
+    is_self_contained,
+    peek_semantic_cache,
+)
+from src.core.telemetry import register_collector, telemetry_handler
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.runnables.config import RunnableConfig
 
 
-def generate_response(
+def _lookup_cached_answer(
+    question: str, user_role: str
+) -> tuple[Optional[CachedAnswer], Optional[List[float]]]:
+    """
+    Looks the question up in the semantic answer cache.
+
+    Returns:
+        tuple: (cached answer or None, question embedding or None when the
+            question is not cacheable)
+    """
+    if not SEMANTIC_CACHE_ENABLED or not is_self_contained(question):
+        return None, None
+
+    try:
+        embedding = get_query_embedding_cache().embed_query(question)
+        return get_semantic_cache().lookup(embedding, user_role), embedding
+    except Exception as e:
+        print(f"Warning: semantic cache lookup failed: {e}")
+        return None, None
+
+
+async def _alookup_cached_answer(
+    question: str, user_role: str
+) -> tuple[Optional[CachedAnswer], Optional[List[float]]]:
+    if not SEMANTIC_CACHE_ENABLED or not is_self_contained(question):
+        return None, None
+
+    try:
+        embedding = await get_query_embedding_cache().aembed_query(question)
+        return await get_semantic_cache().alookup(embedding, user_role), embedding
+    except Exception as e:
+        print(f"Warning: semantic cache lookup failed: {e}")
+        return None, None
+
+
+def _is_shareable(final_state: Optional[dict]) -> bool:
+    """
+    True if a run's answer depends on nothing but its question and the
+    knowledge base, so other users may be served it: the conversation had
+    no earlier question and no step degraded to meet the deadline.
+    """
+    if not final_state or final_state.get("degraded"):
+        return False
+    questions = [m for m in final_state.get("messages", []) if m.type == "human"]
+    return len(questions) <= 1 and not final_state.get("summary")
+
+
+def _store_answer(
+    embedding: Optional[List[float]],
+    final_state: Optional[dict],
     question: str,
-    session_id: str,
+    answer: str,
     user_name: str,
     user_role: str,
-) -> str:
-    config = RunnableConfig(configurable={"thread_id": session_id})
+    started_at: float,
+) -> None:
+    if embedding is None or not answer or not _is_shareable(final_state):
+        return
+    get_semantic_cache().store(
+        embedding,
+        user_role,
+        question,
+        answer,
+        user_name=user_name,
+        latency=time.perf_counter() - started_at,
+    )
+
+
+def _record_cached_exchange(
+    config: RunnableConfig,
+    question: str,
+    answer: str,
+    user_name: str,
+    user_role: str,
+) -> None:
+    """
+    Appends a cache-served exchange to the conversation checkpoint, so the
+    history looks the same as if the graph had produced the answer.
+    """
+    get_app().update_state(
+        config,
+        _cached_exchange_update(question, answer, user_name, user_role),
+        as_node="agent",
+    )
+
+
+def _cached_exchange_update(
+    question: str, answer: str, user_name: str, user_role: str
+) -> dict:
+    return {
+        "messages": [HumanMessage(content=question), AIMessage(content=answer)],
+        "question": question,
+        "user_name": user_name,
+        "user_role": user_role,
+    }
+
+
+def _graph_config(session_id: str) -> RunnableConfig:
+    """
+    Config for one graph run: the conversation thread, the request
+    deadline every node checks and the telemetry callbacks.
+    """
+    return RunnableConfig(
+        configurable={"thread_id": session_id, **deadline_configurable()},
+        callbacks=[telemetry_handler],
+    )
+
 
-    initial_state = MentoriaState(
+def _initial_state(
+    question: str, user_name: str, user_role: str
+) -> MentoriaState:
+    return MentoriaState(
         loop_count=0,
         question=question,
         user_name=user_name,
         user_role=user_role,
         messages=[HumanMessage(content=question)],
         context="",
+        degraded=False,
     )
 
-    final_state = app.invoke(initial_state, config=config)
-    return final_state["messages"][-1].content
+
+def _iter_agent_text(message, metadata: dict) -> Iterator[str]:
+    """
+    Yields the text parts of a streamed agent message chunk.
+    """
+    if metadata.get("langgraph_node") != "agent" or not isinstance(
+        message, AIMessage
+    ):
+        return
+
+    content = message.content
+
+    if isinstance(content, str):
+        if content:
+            yield content
+
+    elif isinstance(content, list):
+        for part in content:
+            if isinstance(part, dict):
+                if "text" in part:
+                    yield part["text"]
+            elif isinstance(part, str):
+                yield part
+
+
+def _iter_text_pieces(text: str) -> Iterator[str]:
+    """
+    Splits a cached answer into word groups so it streams like a live one.
+    """
+    words = re.findall(r"\S+\s*", text)
+    for i in range(0, len(words), 8):
+        yield "".join(words[i : i + 8])
+
+
+def generate_response(
+    question: str,
+    session_id: str,
+    user_name: str,
+    user_role: str,
+) -> str:
+    config = RunnableConfig(configurable={"thread_id": session_id})
+
+    started_at = time.perf_counter()
+    cached, embedding = _lookup_cached_answer(question, user_role)
+    if cached is not None:
+        answer = cached.personalized(user_name)
+        _record_cached_exchange(config, question, answer, user_name, user_role)
+        return answer
+
+    initial_state = _initial_state(question, user_name, user_role)
+
+    run_config = _graph_config(session_id)
+    final_state = get_app().invoke(initial_state, config=run_config)
+    deadline_stats.record_request(run_config)
+    answer = final_state["messages"][-1].content
+    if isinstance(answer, str):
+        _store_answer(
+            embedding, final_state, question, answer, user_name, user_role, started_at
+        )
+    return answer
 
 
 def generate_response_stream(
@@ -38,39 +229,230 @@ def generate_response_stream(
 ):
     config = RunnableConfig(configurable={"thread_id": session_id})
 
-    initial_state = MentoriaState(
-        loop_count=0,
-        question=question,
-        user_name=user_name,
-        user_role=user_role,
-        messages=[HumanMessage(content=question)],
-        context="",
-    )
+    started_at = time.perf_counter()
+    cached, embedding = _lookup_cached_answer(question, user_role)
+    if cached is not None:
+        answer = cached.personalized(user_name)
+        _record_cached_exchange(config, question, answer, user_name, user_role)
+        yield from _iter_text_pieces(answer)
+        return
 
-    stream = app.stream(initial_state, config=config, stream_mode="messages")
+    initial_state = _initial_state(question, user_name, user_role)
 
-    for message, metadata in stream:
-        if metadata.get("langgraph_node") == "agent" and isinstance(message, AIMessage):
-            content = message.content
+    run_config = _graph_config(session_id)
+    stream = get_app().stream(
+        initial_state, config=run_config, stream_mode=["messages", "values"]
+    )
 
-            if isinstance(content, str):
-                if content:
-                    yield content
+    parts, final_state = [], None
+    for mode, chunk in stream:
+        if mode == "values":
+            final_state = chunk
+            continue
+        for text in _iter_agent_text(*chunk):
+            parts.append(text)
+            yield text
 
-            elif isinstance(content, list):
-                for part in content:
-                    if isinstance(part, dict):
-                        if "text" in part:
-                            yield part["text"]
-                    elif isinstance(part, str):
-                        yield part
+    deadline_stats.record_request(run_config)
+    _store_answer(
+        embedding,
+        final_state,
+        question,
+        "".join(parts),
+        user_name,
+        user_role,
+        started_at,
+    )
 
 
 def get_session_history(session_id: str):
     config = RunnableConfig(configurable={"thread_id": session_id})
 
-    state = app.get_state(config)
+    state = get_app().get_state(config)
 
     if state and state.values:
         return state.values.get("messages", [])
     return []
+
+
+async def agenerate_response(
+    question: str,
+    session_id: str,
+    user_name: str,
+    user_role: str,
+) -> str:
+    """
+    Async variant of generate_response built on app.ainvoke.
+    """
+    config = RunnableConfig(configurable={"thread_id": session_id})
+    app = await aget_app()
+
+    started_at = time.perf_counter()
+    cached, embedding = await _alookup_cached_answer(question, user_role)
+    if cached is not None:
+        answer = cached.personalized(user_name)
+        await app.aupdate_state(
+            config,
+            _cached_exchange_update(question, answer, user_name, user_role),
+            as_node="agent",
+        )
+        return answer
+
+    initial_state = _initial_state(question, user_name, user_role)
+
+    run_config = _graph_config(session_id)
+    final_state = await app.ainvoke(initial_state, config=run_config)
+    deadline_stats.record_request(run_config)
+    answer = final_state["messages"][-1].content
+    if isinstance(answer, str):
+        _store_answer(
+            embedding, final_state, question, answer, user_name, user_role, started_at
+        )
+    return answer
+
+
+async def agenerate_response_stream(
+    question: str,
+    session_id: str,
+    user_name: str,
+    user_role: str,
+) -> AsyncIterator[str]:
+    """
+    Async variant of generate_response_stream built on app.astream.
+    """
+    config = RunnableConfig(configurable={"thread_id": session_id})
+    app = await aget_app()
+
+    started_at = time.perf_counter()
+    cached, embedding = await _alookup_cached_answer(question, user_role)
+    if cached is not None:
+        answer = cached.personalized(user_name)
+        await app.aupdate_state(
+            config,
+            _cached_exchange_update(question, answer, user_name, user_role),
+            as_node="agent",
+        )
+        for piece in _iter_text_pieces(answer):
+            yield piece
+        return
+
+    initial_state = _initial_state(question, user_name, user_role)
+
+    run_config = _graph_config(session_id)
+    stream = app.astream(
+        initial_state, config=run_config, stream_mode=["messages", "values"]
+    )
+
+    parts, final_state = [], None
+    async for mode, chunk in stream:
+        if mode == "values":
+            final_state = chunk
+            continue
+        for text in _iter_agent_text(*chunk):
+            parts.append(text)
+            yield text
+
+    deadline_stats.record_request(run_config)
+    _store_answer(
+        embedding,
+        final_state,
+        question,
+        "".join(parts),
+        user_name,
+        user_role,
+        started_at,
+    )
+
+
+async def aget_session_history(session_id: str):
+    config = RunnableConfig(configurable={"thread_id": session_id})
+    app = await aget_app()
+
+    state = await app.aget_state(config)
+
+    if state and state.values:
+        return state.values.get("messages", [])
+    return []
+
+
+def get_semantic_cache_stats() -> Optional[dict]:
+    """
+    Returns semantic answer cache hit rate and saved latency
+    (None until the cache is first used).
+    """
+    cache = peek_semantic_cache()
+    return cache.stats() if cache else None
+
+
+def get_web_search_cache_stats() -> Optional[dict]:
+    """
+    Returns web search result cache hit rate and saved latency
+    (None until the web search tool is first used).
+    """
+    tool = peek_web_search_tool()
+    return tool.stats() if tool else None
+
+
+def get_query_embedding_cache_stats() -> Optional[dict]:
+    """
+    Returns query-embedding cache hit rate
+    (None until the cache is first used).
+    """
+    cache = peek_query_embedding_cache()
+    return cache.stats() if cache else None
+
+
+def warm_up() -> Dict[str, Optional[float]]:
+    """
+    Builds everything the first request would otherwise pay for: the
+    graph and its MongoDB checkpointer, the web search tool, the model
+    clients and chains, and the retrieval and answer caches.
+
+    Meant for servers, before they accept traffic. A failing step is
+    logged and skipped (it is retried lazily on first use).
+
+    Returns:
+        dict: Seconds taken by each step, None for the failed ones.
+    """
+    steps: Dict[str, Callable[[], object]] = {
+        "graph": get_app,
+        "tools": get_tools,
+        "agent_chains": lambda: [
+            get_agent_chain([]),
+            get_agent_chain(get_tools()),
+        ],
+        "summary_chain": get_summary_chain,
+        "query_embeddings": get_query_embedding_cache,
+    }
+    if RETRIEVAL_BACKEND == "local":
+        steps["local_index"] = lambda: get_local_index(LOCAL_INDEX_PATH)
+    if SEMANTIC_CACHE_ENABLED:
+        steps["semantic_cache"] = get_semantic_cache
+
+    timings: Dict[str, Optional[float]] = {}
+    for name, step in steps.items():
+        started_at = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            print(f"Warning: warm-up step {name} failed: {e}", file=sys.stderr)
+            timings[name] = None
+            continue
+        timings[name] = time.perf_counter() - started_at
+
+    summary = ", ".join(
+        f"{name} failed" if seconds is None else f"{name} {seconds:.2f}s"
+        for name, seconds in timings.items()
+    )
+    print(f"Warm-up: {summary}")
+    return timings
+
+
+register_collector("routing", get_routing_stats)
+register_collector("agent_loop", get_agent_loop_stats)
+register_collector("search_coalescing", get_search_coalescing_stats)
+register_collector("deadline", get_deadline_stats)
+register_collector("semantic_cache", get_semantic_cache_stats)
+register_collector("web_search_cache", get_web_search_cache_stats)
+register_collector("query_embedding_cache", get_query_embedding_cache_stats)
+register_collector("mongodb_pool", get_mongodb_pool_stats)
@@ -0,0 +1,259 @@
+"""
+Cache Module - MentorIA Core
+Bounded in-memory LRU/TTL cache with optional persistent backends.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from pymongo.collection import Collection
+
+from src.config import get_mongodb_client
+
+_MISSING = object()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalizes free text for use as a cache key.
+
+    Lowercases, trims and collapses internal whitespace so that trivially
+    different spellings of the same question share one entry.
+    """
+    return " ".join(text.lower().split())
+
+
+class SQLiteCacheStore:
+    """
+    Persistent cache backend stored in a local SQLite file.
+    Values must be JSON-serializable.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            self.delete(key)
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float]) -> None:
+        expires_at = time.time() + ttl_seconds if ttl_seconds else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+
+class MongoCacheStore:
+    """
+    Persistent cache backend stored in a MongoDB collection.
+    Expired documents are removed by a TTL index on 'expires_at'.
+    """
+
+    def __init__(self, collection: Collection):
+        self._collection = collection
+        self._collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def get(self, key: str) -> Optional[Any]:
+        doc = self._collection.find_one({"_id": key})
+        if doc is None:
+            return None
+        expires_at = doc.get("expires_at")
+        if expires_at is not None:
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if expires_at < datetime.now(timezone.utc):
+                return None
+        return doc["value"]
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float]) -> None:
+        expires_at = (
+            datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+            if ttl_seconds
+            else None
+        )
+        self._collection.replace_one(
+            {"_id": key},
+            {"_id": key, "value": value, "expires_at": expires_at},
+            upsert=True,
+        )
+
+    def delete(self, key: str) -> None:
+        self._collection.delete_one({"_id": key})
+
+    def clear(self) -> None:
+        self._collection.delete_many({})
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with per-entry time-to-live.
+
+    The in-memory layer is bounded by max_size (least recently used entries
+    are evicted first). An optional persistent store is consulted on memory
+    misses and written through on every set.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = None,
+        store=None,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._store_hits = 0
+        self._evictions = 0
+
+    def _expiry(self) -> Optional[float]:
+        return time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+
+    def _put(self, key: str, value: Any) -> None:
+        self._entries[key] = (value, self._expiry())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns the cached value for key, or default if absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+
+        if self.store is not None:
+            value = self.store.get(key)
+            if value is not None:
+                with self._lock:
+                    self._put(key, value)
+                    self._hits += 1
+                    self._store_hits += 1
+                return value
+
+        with self._lock:
+            self._misses += 1
+        return default
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores value under key in memory and in the persistent store.
+        """
+        with self._lock:
+            self._put(key, value)
+        if self.store is not None:
+            self.store.set(key, value, self.ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.store is not None:
+            self.store.delete(key)
+
+    def clear(self) -> None:
+        """
+        Drops every entry, including the persistent store.
+        """
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """
+        Returns hit/miss/eviction counters and the current size.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "store_hits": self._store_hits,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+
+def build_cache_store(backend: str, path: str, collection_name: str, setting: str):
+    """
+    Creates the persistent backend of a TTLCache.
+
+    Args:
+        backend: "memory" (no persistent store), "file" (SQLite) or "mongo"
+        path: SQLite file used by the "file" backend
+        collection_name: Collection used by the "mongo" backend
+        setting: Name of the environment variable holding backend, for
+            error messages
+
+    Raises:
+        ValueError: If the backend is unknown or DATABASE is missing
+    """
+    if backend == "memory":
+        return None
+
+    if backend == "file":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return SQLiteCacheStore(path)
+
+    if backend == "mongo":
+        database_name = os.getenv("DATABASE")
+        if not database_name:
+            raise ValueError("DATABASE not found in environment variables")
+        client = get_mongodb_client()
+        return MongoCacheStore(client[database_name][collection_name])
+
+    raise ValueError(
+        f"Invalid {setting} '{backend}' (expected 'memory', 'file' or 'mongo')"
+    )
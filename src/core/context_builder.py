@@ -0,0 +1,156 @@
+"""
+Context Builder Module - MentorIA Core
+Assembles retrieved chunks into the prompt context: overlapping chunks of
+the same page are merged, duplicated text is dropped, and the blocks are
+packed by score into a token budget with a source label for citations.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from src.config import CONTEXT_TOKEN_BUDGET
+from src.core.utils import estimate_tokens
+
+# Shortest shared span treated as chunk overlap rather than coincidence
+MIN_OVERLAP_CHARS = 30
+
+# Blocks are truncated to fit the budget only if this much room is left
+MIN_TRUNCATED_TOKENS = 50
+
+
+def _overlap(left: str, right: str, min_overlap: int = MIN_OVERLAP_CHARS) -> int:
+    """
+    Returns the length of the longest suffix of left that is a prefix of
+    right (0 if shorter than min_overlap).
+    """
+    probe = right[:min_overlap]
+    if len(probe) < min_overlap:
+        return 0
+    start = left.find(probe, max(0, len(left) - len(right)))
+    while start != -1:
+        if right.startswith(left[start:]):
+            return len(left) - start
+        start = left.find(probe, start + 1)
+    return 0
+
+
+def _merge(existing: str, new: str) -> Optional[str]:
+    """
+    Merges two texts from the same page when one contains or overlaps the
+    other. Returns None when they are unrelated.
+    """
+    if new in existing:
+        return existing
+    if existing in new:
+        return new
+    overlap = _overlap(existing, new)
+    if overlap:
+        return existing + new[overlap:]
+    overlap = _overlap(new, existing)
+    if overlap:
+        return new + existing[overlap:]
+    return None
+
+
+def _location(result: Dict) -> tuple:
+    metadata = result.get("metadata") or {}
+    source = metadata.get("source") or result.get("source") or "unknown"
+    page = metadata.get("page_label")
+    if page is None and metadata.get("page") is not None:
+        page = int(metadata["page"]) + 1
+    return source, page
+
+
+def merge_chunks(results: List[Dict]) -> List[Dict]:
+    """
+    Merges retrieved chunks that overlap (or repeat) within the same source
+    page into contiguous blocks.
+
+    Args:
+        results: Chunks with 'text', 'metadata', 'source' and 'score'
+
+    Returns:
+        List[Dict]: Blocks with 'text', 'source', 'page' and 'score' (the
+            best score among merged chunks), best first
+    """
+    blocks: List[Dict] = []
+    for result in results:
+        text = (result.get("text") or "").strip()
+        if not text:
+            continue
+        source, page = _location(result)
+        candidate = {
+            "text": text,
+            "source": source,
+            "page": page,
+            "score": result.get("score") or 0.0,
+        }
+
+        # A merge can make the block overlap another one, so keep absorbing
+        merged = True
+        while merged:
+            merged = False
+            for i, block in enumerate(blocks):
+                if (block["source"], block["page"]) != (source, page):
+                    continue
+                merged_text = _merge(block["text"], candidate["text"])
+                if merged_text is not None:
+                    del blocks[i]
+                    candidate["text"] = merged_text
+                    candidate["score"] = max(candidate["score"], block["score"])
+                    merged = True
+                    break
+        blocks.append(candidate)
+
+    return sorted(blocks, key=lambda block: block["score"], reverse=True)
+
+
+def source_label(block: Dict) -> str:
+    name = os.path.basename(str(block["source"])) or str(block["source"])
+    if block["page"] is not None:
+        return f"[Source: {name}, page {block['page']}]"
+    return f"[Source: {name}]"
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(" ", 0, max_chars - 1)
+    return text[: cut if cut > 0 else max_chars - 1].rstrip() + "…"
+
+
+def assemble_context(
+    results: List[Dict], token_budget: int = CONTEXT_TOKEN_BUDGET
+) -> str:
+    """
+    Builds the context string sent to the agent.
+
+    Blocks are added best score first while they fit the token budget. A
+    block that does not fit is truncated if enough room is left, otherwise
+    skipped, and lower-scored blocks that still fit keep filling the rest.
+
+    Args:
+        results: Chunks from search_chunks, with 'score'
+        token_budget: Estimated tokens available for the context
+
+    Returns:
+        str: Labelled blocks, or "" when nothing was retrieved
+    """
+    parts = []
+    remaining = token_budget
+    for block in merge_chunks(results):
+        label = source_label(block)
+        cost = estimate_tokens(label) + estimate_tokens(block["text"]) + 1
+        if cost <= remaining:
+            parts.append(f"{label}\n{block['text']}")
+            remaining -= cost
+            continue
+
+        room = remaining - estimate_tokens(label) - 1
+        if room >= MIN_TRUNCATED_TOKENS:
+            text = _truncate(block["text"], room)
+            parts.append(f"{label}\n{text}")
+            remaining -= estimate_tokens(label) + estimate_tokens(text) + 1
+
+    return "\n\n".join(parts)
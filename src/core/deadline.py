@@ -0,0 +1,172 @@
+"""
+Deadline Module - MentorIA Core
+Per-request latency budget carried through the graph in the RunnableConfig,
+so every node can check how much time is left and degrade instead of
+overrunning it.
+"""
+
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+from src.config import (
+    ANSWER_RESERVE_SECONDS,
+    DEADLINE_POOL_WORKERS,
+    REQUEST_DEADLINE_SECONDS,
+)
+
+DEADLINE_KEY = "deadline"
+
+# What a timed-out step raises: asyncio.wait_for and future.result raise
+# their own TimeoutError classes before Python 3.11, aliases of it since
+TIMEOUT_ERRORS = (TimeoutError, FuturesTimeoutError, asyncio.TimeoutError)
+
+
+def deadline_configurable(budget_seconds: Optional[float] = None) -> dict:
+    """
+    Returns the configurable entry that sets a deadline budget_seconds from
+    now (REQUEST_DEADLINE_SECONDS by default; 0 or less sets none).
+    """
+    budget = REQUEST_DEADLINE_SECONDS if budget_seconds is None else budget_seconds
+    if not budget or budget <= 0:
+        return {}
+    return {DEADLINE_KEY: time.time() + budget}
+
+
+def remaining_seconds(config: Optional[RunnableConfig]) -> Optional[float]:
+    """
+    Returns the seconds left before the request deadline, None when the
+    request has no deadline. Negative once the deadline has passed.
+    """
+    deadline = ((config or {}).get("configurable") or {}).get(DEADLINE_KEY)
+    if deadline is None:
+        return None
+    return deadline - time.time()
+
+
+def has_time_for(config: Optional[RunnableConfig], seconds: float) -> bool:
+    """
+    True if the request has no deadline or at least seconds left.
+    """
+    remaining = remaining_seconds(config)
+    return remaining is None or remaining >= seconds
+
+
+def step_timeout(
+    config: Optional[RunnableConfig], limit: float = 0.0, reserve: float = 0.0
+) -> Optional[float]:
+    """
+    Timeout for one step: its own limit (0 for none), capped by the time
+    left minus reserve. None means no timeout at all.
+    """
+    remaining = remaining_seconds(config)
+    limits = [limit] if limit > 0 else []
+    if remaining is not None:
+        limits.append(remaining - reserve)
+    return max(0.0, min(limits)) if limits else None
+
+
+def has_time_for_tools(config: Optional[RunnableConfig], tool_timeout: float) -> bool:
+    """
+    True if a tool call of up to tool_timeout seconds still leaves
+    ANSWER_RESERVE_SECONDS for the final answer.
+    """
+    return has_time_for(config, tool_timeout + ANSWER_RESERVE_SECONDS)
+
+
+_timeout_executor = ThreadPoolExecutor(
+    max_workers=DEADLINE_POOL_WORKERS, thread_name_prefix="deadline"
+)
+
+
+def run_with_timeout(fn: Callable[[], Any], timeout: Optional[float]) -> Any:
+    """
+    Runs fn() on the deadline pool and returns its result, raising
+    TimeoutError after timeout seconds (no limit when None).
+
+    The clock starts when fn starts, so waiting for a free worker does not
+    eat into its budget; a call still queued after timeout seconds is
+    cancelled and never runs. Threads cannot be cancelled: once started,
+    fn keeps running on timeout and its result is dropped (or shared,
+    through the single-flight and result caches).
+    """
+    if timeout is None:
+        return fn()
+    # Copied so callbacks and tracing still see the caller's run
+    context = contextvars.copy_context()
+    started = threading.Event()
+
+    def run():
+        started.set()
+        return context.run(fn)
+
+    future = _timeout_executor.submit(run)
+    if not started.wait(timeout) and future.cancel():
+        raise TimeoutError(f"No worker free within {timeout:.1f}s")
+    try:
+        return future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        raise TimeoutError(f"Timed out after {timeout:.1f}s") from None
+
+
+class DeadlineStats:
+    """
+    Thread-safe counters of requests under a deadline and of every
+    degradation applied to meet it.
+    """
+
+    EVENTS = (
+        "retrieval_timeouts",
+        "summaries_skipped",
+        "tools_withheld",
+        "tool_calls_skipped",
+        "tool_calls_timed_out",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {event: 0 for event in self.EVENTS}
+        self._requests = 0
+        self._exceeded = 0
+
+    def record(self, event: str) -> None:
+        with self._lock:
+            self._counts[event] += 1
+
+    def record_request(self, config: Optional[RunnableConfig]) -> None:
+        """
+        Records a finished request and whether it overran its deadline.
+        """
+        remaining = remaining_seconds(config)
+        if remaining is None:
+            return
+        with self._lock:
+            self._requests += 1
+            self._exceeded += int(remaining < 0)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "deadline_exceeded": self._exceeded,
+                "deadline_exceeded_rate": (
+                    self._exceeded / self._requests if self._requests else 0.0
+                ),
+                **self._counts,
+            }
+
+
+deadline_stats = DeadlineStats()
+
+
+def get_deadline_stats() -> dict:
+    """
+    Returns timeout and degradation counters for the request deadline SLO.
+    """
+    return deadline_stats.stats()
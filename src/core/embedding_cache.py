@@ -0,0 +1,130 @@
+"""
+Embedding Cache Module - MentorIA Core
+Caches query embeddings so repeated questions skip the embedding API call.
+"""
+
+import asyncio
+import hashlib
+import threading
+from typing import List, Optional
+
+from src.config import (
+    EMBEDDING_CACHE_BACKEND,
+    EMBEDDING_CACHE_COLLECTION,
+    EMBEDDING_CACHE_PATH,
+    EMBEDDING_CACHE_SIZE,
+    EMBEDDING_CACHE_TTL_SECONDS,
+    EMBEDDING_MODEL_NAME,
+)
+from src.core.cache import TTLCache, build_cache_store, normalize_text
+from src.core.runnables import get_shared_embedding_model
+from src.core.telemetry import EMBEDDING_SECONDS, span
+
+
+class QueryEmbeddingCache:
+    """
+    Read-through cache in front of an embedding model's embed_query.
+
+    Keys combine the model name with the normalized question text, so a
+    model change never serves vectors from a different embedding space.
+    """
+
+    def __init__(
+        self,
+        embeddings_model=None,
+        model_name: str = EMBEDDING_MODEL_NAME,
+        cache: Optional[TTLCache] = None,
+    ):
+        self._embeddings_model = embeddings_model
+        self.model_name = model_name
+        self.cache = cache if cache is not None else TTLCache()
+
+    @property
+    def embeddings_model(self):
+        if self._embeddings_model is not None:
+            return self._embeddings_model
+        return get_shared_embedding_model()
+
+    def cache_key(self, question: str) -> str:
+        digest = hashlib.sha256(normalize_text(question).encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{digest}"
+
+    def embed_query(self, question: str) -> List[float]:
+        """
+        Returns the embedding for question, calling the model only on a miss.
+
+        Args:
+            question: User's question
+
+        Returns:
+            List[float]: Question embedding
+        """
+        key = self.cache_key(question)
+        embedding = self.cache.get(key)
+        if embedding is None:
+            with span("embedding", EMBEDDING_SECONDS, kind="query"):
+                embedding = self.embeddings_model.embed_query(question)
+            self.cache.set(key, list(embedding))
+        return embedding
+
+    async def aembed_query(self, question: str) -> List[float]:
+        """
+        Async variant of embed_query. Persistent-store lookups run in a
+        worker thread so they never block the event loop.
+        """
+        key = self.cache_key(question)
+        if self.cache.store is None:
+            embedding = self.cache.get(key)
+        else:
+            embedding = await asyncio.to_thread(self.cache.get, key)
+
+        if embedding is None:
+            with span("embedding", EMBEDDING_SECONDS, kind="query"):
+                embedding = await self.embeddings_model.aembed_query(question)
+            if self.cache.store is None:
+                self.cache.set(key, list(embedding))
+            else:
+                await asyncio.to_thread(self.cache.set, key, list(embedding))
+        return embedding
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+_query_embedding_cache: Optional[QueryEmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """
+    Returns the process-wide query-embedding cache configured from the
+    EMBEDDING_CACHE_* environment variables.
+
+    Returns:
+        QueryEmbeddingCache: Shared cache instance
+    """
+    global _query_embedding_cache
+    if _query_embedding_cache is None:
+        with _cache_lock:
+            if _query_embedding_cache is None:
+                _query_embedding_cache = QueryEmbeddingCache(
+                    cache=TTLCache(
+                        max_size=EMBEDDING_CACHE_SIZE,
+                        ttl_seconds=EMBEDDING_CACHE_TTL_SECONDS,
+                        store=build_cache_store(
+                            EMBEDDING_CACHE_BACKEND,
+                            EMBEDDING_CACHE_PATH,
+                            EMBEDDING_CACHE_COLLECTION,
+                            "EMBEDDING_CACHE_BACKEND",
+                        ),
+                    )
+                )
+    return _query_embedding_cache
+
+
+def peek_query_embedding_cache() -> Optional[QueryEmbeddingCache]:
+    """
+    Returns the process-wide query-embedding cache if it was already
+    created, without creating it (or its persistent store).
+    """
+    return _query_embedding_cache
@@ -0,0 +1,228 @@
+"""
+Checkpointing Module - MentorIA Core
+MongoDB checkpointer with a retention policy: ephemeral state channels are
+not persisted, only the latest checkpoints of each thread are kept, idle
+sessions expire through a TTL index, and existing data can be compacted.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+from bson import ObjectId
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.mongodb import MongoDBSaver
+from pymongo import MongoClient
+
+from src.config import CHECKPOINT_KEEP_LAST, CHECKPOINT_TTL_SECONDS
+from src.core.telemetry import CHECKPOINT_SECONDS, span
+
+# Recomputed on every turn, so there is no point in persisting them
+EPHEMERAL_CHANNELS = ("context",)
+
+# Checkpoints written at the start of a turn; pruning runs once per turn
+_TURN_SOURCES = ("input", "update")
+
+
+class CompactMongoDBSaver(MongoDBSaver):
+    """
+    MongoDBSaver that keeps persisted state small.
+
+    Args:
+        client: MongoDB client
+        ephemeral_channels: State keys left out of stored checkpoints and
+            pending writes
+        keep_last: Checkpoints kept per thread, 0 keeps all
+        ttl: Seconds after which checkpoints expire, None disables expiry
+        **kwargs: Forwarded to MongoDBSaver (db_name, collection names, serde)
+    """
+
+    def __init__(
+        self,
+        client: MongoClient,
+        ephemeral_channels: Sequence[str] = EPHEMERAL_CHANNELS,
+        keep_last: int = CHECKPOINT_KEEP_LAST,
+        ttl: Optional[int] = CHECKPOINT_TTL_SECONDS or None,
+        **kwargs: Any,
+    ):
+        super().__init__(client, ttl=ttl, **kwargs)
+        self.ephemeral_channels = frozenset(ephemeral_channels)
+        self.keep_last = keep_last
+
+    def _strip_ephemeral(self, checkpoint: dict) -> Tuple[dict, bool]:
+        values = checkpoint.get("channel_values") or {}
+        if not self.ephemeral_channels.intersection(values):
+            return checkpoint, False
+        stripped = {
+            key: value
+            for key, value in values.items()
+            if key not in self.ephemeral_channels
+        }
+        return {**checkpoint, "channel_values": stripped}, True
+
+    def get_tuple(self, config: RunnableConfig):
+        with span("checkpoint", CHECKPOINT_SECONDS, operation="get"):
+            return super().get_tuple(config)
+
+    def put(self, config: RunnableConfig, checkpoint, metadata, new_versions):
+        checkpoint, _ = self._strip_ephemeral(checkpoint)
+        with span("checkpoint", CHECKPOINT_SECONDS, operation="put"):
+            saved = super().put(config, checkpoint, metadata, new_versions)
+        if self.keep_last and metadata.get("source") in _TURN_SOURCES:
+            configurable = saved["configurable"]
+            self.prune_thread(
+                configurable["thread_id"], configurable["checkpoint_ns"]
+            )
+        return saved
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        # A task left without writes is simply re-run if a turn is resumed
+        writes = [w for w in writes if w[0] not in self.ephemeral_channels]
+        if writes:
+            with span("checkpoint", CHECKPOINT_SECONDS, operation="put_writes"):
+                super().put_writes(config, writes, task_id, task_path)
+
+    def prune_thread(
+        self, thread_id: str, checkpoint_ns: str = "", keep_last: Optional[int] = None
+    ) -> int:
+        """
+        Deletes all but the latest checkpoints of a thread, with their writes.
+
+        Returns:
+            int: Number of deleted checkpoints
+        """
+        keep_last = self.keep_last if keep_last is None else keep_last
+        if keep_last <= 0:
+            return 0
+
+        query = {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns}
+        stale_ids = [
+            doc["checkpoint_id"]
+            for doc in self.checkpoint_collection.find(
+                query, {"checkpoint_id": 1, "_id": 0}
+            )
+            .sort("checkpoint_id", -1)
+            .skip(keep_last)
+        ]
+        if not stale_ids:
+            return 0
+
+        stale = {**query, "checkpoint_id": {"$in": stale_ids}}
+        self.writes_collection.delete_many(stale)
+        return self.checkpoint_collection.delete_many(stale).deleted_count
+
+    def compact_checkpoint(self, doc: dict) -> bool:
+        """
+        Rewrites a stored checkpoint without its ephemeral channels.
+
+        Returns:
+            bool: True if the document was rewritten
+        """
+        checkpoint = self.serde.loads_typed((doc["type"], doc["checkpoint"]))
+        checkpoint, changed = self._strip_ephemeral(checkpoint)
+        if not changed:
+            return False
+        type_, serialized = self.serde.dumps_typed(checkpoint)
+        self.checkpoint_collection.update_one(
+            {"_id": doc["_id"]}, {"$set": {"type": type_, "checkpoint": serialized}}
+        )
+        return True
+
+    def iter_threads(self) -> Iterable[dict]:
+        """
+        Yields {thread_id, checkpoint_ns, last_id} for every stored thread,
+        where last_id is the ObjectId of its most recent checkpoint.
+        """
+        pipeline = [
+            {
+                "$group": {
+                    "_id": {"thread_id": "$thread_id", "ns": "$checkpoint_ns"},
+                    "last_id": {"$max": "$_id"},
+                }
+            }
+        ]
+        for doc in self.checkpoint_collection.aggregate(pipeline):
+            yield {
+                "thread_id": doc["_id"]["thread_id"],
+                "checkpoint_ns": doc["_id"]["ns"],
+                "last_id": doc["last_id"],
+            }
+
+    def storage_stats(self) -> dict:
+        """
+        Returns document counts and data sizes of the checkpoint collections.
+        """
+        stats = {}
+        for name, collection in (
+            ("checkpoints", self.checkpoint_collection),
+            ("writes", self.writes_collection),
+        ):
+            coll_stats = self.db.command("collStats", collection.name)
+            stats[name] = {
+                "count": coll_stats.get("count", 0),
+                "size_bytes": coll_stats.get("size", 0),
+            }
+        return stats
+
+
+def compact_checkpoints(
+    saver: CompactMongoDBSaver,
+    keep_last: Optional[int] = None,
+    max_idle_days: float = 0,
+) -> dict:
+    """
+    Applies the retention policy to data already stored: deletes idle
+    threads, prunes the rest to their latest checkpoints and strips
+    ephemeral channels from what remains.
+
+    Args:
+        saver: Checkpointer whose collections are compacted
+        keep_last: Checkpoints kept per thread (default: the saver's)
+        max_idle_days: Delete threads without checkpoints for this many
+            days, 0 keeps every thread
+
+    Returns:
+        dict: Counters plus storage stats before and after
+    """
+    keep_last = saver.keep_last if keep_last is None else keep_last
+    totals = {
+        "threads": 0,
+        "expired_threads": 0,
+        "pruned_checkpoints": 0,
+        "rewritten_checkpoints": 0,
+    }
+    before = saver.storage_stats()
+
+    idle_cutoff = None
+    if max_idle_days > 0:
+        idle_cutoff = ObjectId.from_datetime(
+            datetime.now(timezone.utc) - timedelta(days=max_idle_days)
+        )
+
+    for thread in list(saver.iter_threads()):
+        totals["threads"] += 1
+        query = {
+            "thread_id": thread["thread_id"],
+            "checkpoint_ns": thread["checkpoint_ns"],
+        }
+        if idle_cutoff is not None and thread["last_id"] < idle_cutoff:
+            saver.writes_collection.delete_many(query)
+            saver.checkpoint_collection.delete_many(query)
+            totals["expired_threads"] += 1
+            continue
+
+        totals["pruned_checkpoints"] += saver.prune_thread(
+            thread["thread_id"], thread["checkpoint_ns"], keep_last
+        )
+        for doc in saver.checkpoint_collection.find(query):
+            if saver.compact_checkpoint(doc):
+                totals["rewritten_checkpoints"] += 1
+
+    totals["before"] = before
+    totals["after"] = saver.storage_stats()
+    return totals
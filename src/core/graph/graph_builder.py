@@ -1,11 +1,26 @@
+import asyncio
+import threading
+from typing import List, Optional
+
 from langgraph.graph import StateGraph, END, START
 from langgraph.prebuilt import tools_condition
-from langchain_core.messages import AIMessage
-from src.config import get_mongodb_client
-from src.core.graph.nodes import agent_node, retrieve_node, tool_node
+from langchain_core.messages import AIMessage, BaseMessage
+from src.config import DEFAULT_USER_NAME, get_mongodb_client
+from src.core.graph.checkpointing import CompactMongoDBSaver
+from src.core.graph.history import ahistory_node, history_node
+from src.core.graph.nodes import (
+    aagent_node,
+    agent_node,
+    aretrieve_node,
+    atools_node,
+    retrieve_node,
+    tools_node,
+)
+from src.core.graph.router import next_after_route, route_node
 from src.core.graph.state import MentoriaState
-from langgraph.checkpoint.mongodb import MongoDBSaver
+from langchain_core.runnables import RunnableLambda
 from langchain_core.runnables.config import RunnableConfig
+from langgraph.graph.state import CompiledStateGraph
 
 
 def limited_tools_condition(state):
@@ -19,47 +34,130 @@ def limited_tools_condition(state):
     return tools_condition(state)
 
 
-client = get_mongodb_client()
-checkpointer = MongoDBSaver(client=client)
+def build_workflow() -> StateGraph:
+    """
+    Defines the MentorIA graph (nodes and edges, no checkpointer).
+    """
+    workflow = StateGraph(MentoriaState)
+
+    # Each node has a sync and an async implementation: invoke/stream use the
+    # former, ainvoke/astream the latter.
+    workflow.add_node("route", route_node)
+    workflow.add_node("retrieve", RunnableLambda(retrieve_node, afunc=aretrieve_node))
+    workflow.add_node("history", RunnableLambda(history_node, afunc=ahistory_node))
+    # Deferred: waits for history and, when routed there, retrieval
+    workflow.add_node(
+        "agent", RunnableLambda(agent_node, afunc=aagent_node), defer=True
+    )
+    workflow.add_node("tools", RunnableLambda(tools_node, afunc=atools_node))
+
+    workflow.add_edge(START, "route")
 
-workflow = StateGraph(MentoriaState)
+    # Retrieval (unless the router skips it) runs in parallel with history
+    # summarization
+    workflow.add_conditional_edges("route", next_after_route, ["retrieve", "history"])
+    workflow.add_edge("retrieve", "agent")
+    workflow.add_edge("history", "agent")
 
-workflow.add_node("retrieve", retrieve_node)
-workflow.add_node("agent", agent_node)
-workflow.add_node("tools", tool_node)
+    workflow.add_conditional_edges(
+        "agent", limited_tools_condition, {"tools": "tools", END: END}
+    )
 
+    workflow.add_edge("tools", "agent")
+    return workflow
 
-workflow.add_edge(START, "retrieve")
 
-workflow.add_edge("retrieve", "agent")
+_checkpointer: Optional[CompactMongoDBSaver] = None
+_app: Optional[CompiledStateGraph] = None
+_build_lock = threading.Lock()
 
-workflow.add_conditional_edges(
-    "agent", limited_tools_condition, {"tools": "tools", END: END}
-)
 
-workflow.add_edge("tools", "agent")
+def get_checkpointer() -> CompactMongoDBSaver:
+    """
+    Returns the process-wide checkpointer, connecting to MongoDB (and
+    creating its indexes) on first use rather than at import.
+    """
+    global _checkpointer
+    if _checkpointer is None:
+        with _build_lock:
+            if _checkpointer is None:
+                _checkpointer = CompactMongoDBSaver(client=get_mongodb_client())
+    return _checkpointer
+
 
-app = workflow.compile(checkpointer=checkpointer)
+def get_app() -> CompiledStateGraph:
+    """
+    Returns the compiled MentorIA graph, built with the shared checkpointer
+    on first use.
+    """
+    global _app
+    if _app is None:
+        checkpointer = get_checkpointer()
+        with _build_lock:
+            if _app is None:
+                _app = build_workflow().compile(checkpointer=checkpointer)
+    return _app
 
 
-def initialize_conversation(session_id: str, user_name: str) -> None:
+async def aget_app() -> CompiledStateGraph:
+    """
+    Async variant of get_app: the first build (MongoDB connection and
+    checkpoint index creation) runs in a worker thread, off the event loop.
+    """
+    if _app is not None:
+        return _app
+    return await asyncio.to_thread(get_app)
+
+
+def _welcome_text(user_name: str) -> str:
+    return (
+        f"Olá,\t **{user_name}**! 👋\n\n"
+        "Sou o **MentorIA**, seu assistente de onboarding.\n"
+        "Estou aqui para tirar suas dúvidas sobre cultura, processos e ferramentas.\n\n"
+        "Por onde você gostaria de começar hoje?"
+    )
+
+
+def initialize_conversation(session_id: str, user_name: str) -> List[BaseMessage]:
     """
     Verifica se a sessão é nova e injeta a mensagem de boas-vindas no banco.
+    Retorna o histórico da sessão, evitando uma segunda leitura do estado.
     """
     config = RunnableConfig(configurable={"thread_id": session_id})
+    app = get_app()
 
     current_state = app.get_state(config)
 
     user_name = user_name.strip()
-    user_name = user_name if user_name else "Colaborador"
+    user_name = user_name if user_name else DEFAULT_USER_NAME
 
     if not current_state.values or not current_state.values.get("messages"):
-        welcome_text = (
-            f"Olá,\t **{user_name}**! 👋\n\n"
-            "Sou o **MentorIA**, seu assistente de onboarding.\n"
-            "Estou aqui para tirar suas dúvidas sobre cultura, processos e ferramentas.\n\n"
-            "Por onde você gostaria de começar hoje?"
+        welcome_message = AIMessage(content=_welcome_text(user_name))
+        app.update_state(config, {"messages": [welcome_message]}, as_node="agent")
+        return [welcome_message]
+
+    return current_state.values["messages"]
+
+
+async def ainitialize_conversation(
+    session_id: str, user_name: str
+) -> List[BaseMessage]:
+    """
+    Versão assíncrona de initialize_conversation.
+    """
+    config = RunnableConfig(configurable={"thread_id": session_id})
+    app = await aget_app()
+
+    current_state = await app.aget_state(config)
+
+    user_name = user_name.strip()
+    user_name = user_name if user_name else DEFAULT_USER_NAME
+
+    if not current_state.values or not current_state.values.get("messages"):
+        welcome_message = AIMessage(content=_welcome_text(user_name))
+        await app.aupdate_state(
+            config, {"messages": [welcome_message]}, as_node="agent"
         )
+        return [welcome_message]
 
-        welcome_message = AIMessage(content=welcome_text)
-        app.update_state(config, {"messages": [welcome_message]}, as_node="agent")
+    return current_state.values["messages"]
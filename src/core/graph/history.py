@@ -0,0 +1,198 @@
+"""
+History Module - MentorIA Core
+Keeps the chat history sent to the agent bounded: the most recent turns go
+verbatim, older turns are folded incrementally into a running summary
+stored in the graph state.
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+
+from src.config import (
+    ANSWER_RESERVE_SECONDS,
+    HISTORY_KEEP_TURNS,
+    HISTORY_MAX_TURNS,
+    HISTORY_SUMMARY_MAX_WORDS,
+    HISTORY_TOKEN_BUDGET,
+)
+from src.core.deadline import (
+    TIMEOUT_ERRORS,
+    deadline_stats,
+    run_with_timeout,
+    step_timeout,
+)
+from src.core.graph.state import MentoriaState
+from src.core.runnables import get_summary_chain
+from src.core.utils import estimate_tokens, extract_response_text
+
+
+def split_turns(messages: List[BaseMessage], start: int = 0) -> List[Tuple[int, int]]:
+    """
+    Splits messages[start:] into turns, each beginning at a human message
+    (the agent's tool calls and tool results stay with their turn).
+
+    Returns:
+        List[Tuple[int, int]]: (start, end) index ranges into messages
+    """
+    boundaries = [i for i in range(start, len(messages)) if messages[i].type == "human"]
+    if not boundaries or boundaries[0] != start:
+        boundaries.insert(0, start)
+    ends = boundaries[1:] + [len(messages)]
+    return [(b, e) for b, e in zip(boundaries, ends) if b < e]
+
+
+def is_transcript_message(message: BaseMessage) -> bool:
+    """
+    True for the user's messages and the agent's final answers; tool calls
+    and tool results are only needed within their own turn.
+    """
+    if message.type == "human":
+        return True
+    return message.type == "ai" and not getattr(message, "tool_calls", None)
+
+
+def _turn_tokens(messages: List[BaseMessage], turn: Tuple[int, int]) -> int:
+    return sum(
+        estimate_tokens(extract_response_text(message))
+        for message in messages[turn[0] : turn[1]]
+        if is_transcript_message(message)
+    )
+
+
+def plan_summarization(
+    messages: List[BaseMessage],
+    summarized_count: int,
+    max_turns: int = HISTORY_MAX_TURNS,
+    keep_turns: int = HISTORY_KEEP_TURNS,
+    token_budget: int = HISTORY_TOKEN_BUDGET,
+) -> Optional[int]:
+    """
+    Decides whether older turns must be folded into the summary.
+
+    Nothing happens while the earlier turns fit in max_turns and
+    token_budget. Past that, the oldest turns are folded until keep_turns
+    remain within half the budget, so summarization runs every few turns
+    instead of on every one.
+
+    Returns:
+        Optional[int]: The new summarized_count, or None to keep the
+            current history as is
+    """
+    turns = split_turns(messages, summarized_count)
+    # The current turn (question plus any tool round trips) is never folded
+    earlier = turns[:-1]
+    if not earlier:
+        return None
+
+    tokens = [_turn_tokens(messages, turn) for turn in earlier]
+    if len(earlier) <= max_turns and sum(tokens) <= token_budget:
+        return None
+
+    first_kept = 0
+    while first_kept < len(earlier) and (
+        len(earlier) - first_kept > keep_turns
+        or sum(tokens[first_kept:]) > token_budget // 2
+    ):
+        first_kept += 1
+
+    if first_kept == len(earlier):
+        return turns[-1][0]
+    return earlier[first_kept][0]
+
+
+def render_turns(messages: List[BaseMessage]) -> str:
+    """
+    Renders messages as a plain transcript for the summarizer. Tool calls
+    and tool results are left out; the answers built on them are kept.
+    """
+    lines = []
+    for message in messages:
+        if not is_transcript_message(message):
+            continue
+        text = extract_response_text(message).strip()
+        if text:
+            speaker = "Employee" if message.type == "human" else "MentorIA"
+            lines.append(f"{speaker}: {text}")
+    return "\n".join(lines)
+
+
+def recent_history(state: MentoriaState) -> List[BaseMessage]:
+    """
+    Returns the messages the agent sees verbatim: those not yet folded into
+    the summary, capped at the last HISTORY_MAX_TURNS earlier turns in case
+    summarization failed. Earlier turns keep only their transcript, so the
+    agent never sees old tool calls (which also need no bound tools).
+    """
+    messages = state["messages"]
+    turns = split_turns(messages, state.get("summarized_count", 0))
+    if not turns:
+        return []
+    first = turns[max(0, len(turns) - 1 - HISTORY_MAX_TURNS)][0]
+    current = turns[-1][0]
+    earlier = [m for m in messages[first:current] if is_transcript_message(m)]
+    return earlier + messages[current:]
+
+
+def _summary_inputs(state: MentoriaState, new_count: int) -> dict:
+    messages = state["messages"]
+    return {
+        "summary": state.get("summary") or "(empty)",
+        "turns": render_turns(messages[state.get("summarized_count", 0) : new_count]),
+        "max_words": HISTORY_SUMMARY_MAX_WORDS,
+    }
+
+
+def _summary_timeout(config: RunnableConfig) -> Optional[float]:
+    # The agent waits for this node, so it must leave time for the answer
+    return step_timeout(config, reserve=ANSWER_RESERVE_SECONDS)
+
+
+def _summary_skipped(reason: str) -> dict:
+    # The turns stay verbatim (up to HISTORY_MAX_TURNS) and are folded later
+    print(f"Warning: history summarization skipped: {reason}")
+    deadline_stats.record("summaries_skipped")
+    return {}
+
+
+def history_node(state: MentoriaState, config: RunnableConfig):
+    new_count = plan_summarization(state["messages"], state.get("summarized_count", 0))
+    if new_count is None:
+        return {}
+    timeout = _summary_timeout(config)
+    if timeout == 0:
+        return _summary_skipped("no time left before the deadline")
+
+    print("--- SUMMARIZING HISTORY ---")
+    inputs = _summary_inputs(state, new_count)
+    try:
+        summary = run_with_timeout(lambda: get_summary_chain().invoke(inputs), timeout)
+    except TIMEOUT_ERRORS:
+        return _summary_skipped(f"timed out after {timeout:.1f}s")
+    except Exception as e:
+        print(f"Warning: history summarization failed: {e}")
+        return {}
+    return {"summary": summary.strip(), "summarized_count": new_count}
+
+
+async def ahistory_node(state: MentoriaState, config: RunnableConfig):
+    new_count = plan_summarization(state["messages"], state.get("summarized_count", 0))
+    if new_count is None:
+        return {}
+    timeout = _summary_timeout(config)
+    if timeout == 0:
+        return _summary_skipped("no time left before the deadline")
+
+    print("--- SUMMARIZING HISTORY ---")
+    try:
+        summary = await asyncio.wait_for(
+            get_summary_chain().ainvoke(_summary_inputs(state, new_count)), timeout
+        )
+    except TIMEOUT_ERRORS:
+        return _summary_skipped(f"timed out after {timeout:.1f}s")
+    except Exception as e:
+        print(f"Warning: history summarization failed: {e}")
+        return {}
+    return {"summary": summary.strip(), "summarized_count": new_count}
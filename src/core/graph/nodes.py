@@ -1,46 +1,262 @@
+import asyncio
+import threading
+from typing import List, Optional
+
+from langchain_core.messages import BaseMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.prebuilt import ToolNode
 
-from src.config import get_llm_model, get_tavily_search_tool
+from src.config import (
+    ANSWER_RESERVE_SECONDS,
+    RETRIEVAL_TIMEOUT_SECONDS,
+    TOOL_TIMEOUT_SECONDS,
+    get_tavily_search_tool,
+)
+from src.core.deadline import (
+    TIMEOUT_ERRORS,
+    deadline_stats,
+    has_time_for_tools,
+    run_with_timeout,
+    step_timeout,
+)
+from src.core.graph.history import recent_history
 from src.core.graph.state import MentoriaState
-from src.core.graph.prompts import get_mentoria_prompt
-from src.core.graph.retrieval import retrieve_context
-from src.core.utils import format_context
+from src.core.context_builder import assemble_context
+from src.core.graph.retrieval import asearch_chunks, search_chunks
+from src.core.graph.router import remember_context
+from src.core.graph.tool_policy import (
+    INTERNAL_ONLY,
+    WEB_PREFETCH,
+    aprefetch_web_search,
+    choose_tool_policy,
+    is_first_pass,
+    prefetch_web_search,
+    record_agent_call,
+)
+from src.core.runnables import get_agent_chain
+from src.core.tool_cache import CachedTool, cached_search_tool
 
-tavily_tool = get_tavily_search_tool()
-tools = [tavily_tool]
-tool_node = ToolNode(tools)
+_web_search_tool: Optional[CachedTool] = None
+_tool_node: Optional[ToolNode] = None
+_tools_lock = threading.Lock()
 
 
-def retrieve_node(state: MentoriaState):
-    print("--- RETRIEVING CONTEXT ---")
-    question = state["question"]
+def get_web_search_tool() -> CachedTool:
+    """
+    Returns the cached Tavily search tool, created on first use so that
+    importing the graph needs neither the Tavily client nor its API key.
+    """
+    global _web_search_tool, _tool_node
+    if _web_search_tool is None:
+        with _tools_lock:
+            if _web_search_tool is None:
+                tool = cached_search_tool(get_tavily_search_tool())
+                _tool_node = ToolNode([tool])
+                _web_search_tool = tool
+    return _web_search_tool
+
+
+def peek_web_search_tool() -> Optional[CachedTool]:
+    """
+    Returns the cached Tavily search tool if it was already created,
+    without creating it (which needs the Tavily API key).
+    """
+    return _web_search_tool
+
+
+def get_tools() -> list:
+    """Tools the agent may call."""
+    return [get_web_search_tool()]
 
-    chunks = retrieve_context(question=question, k=5)
-    formatted_context = format_context(chunks)
+
+def get_tool_node() -> ToolNode:
+    """ToolNode executing the calls to get_tools()."""
+    get_web_search_tool()
+    return _tool_node
+
+
+def _retrieved_context(config: RunnableConfig, results: list) -> dict:
+    formatted_context = assemble_context(results)
 
     if not formatted_context:
         formatted_context = "No internal context found."
 
-    return {"context": formatted_context}
+    scores = [result["score"] for result in results]
+    remember_context(config, formatted_context, scores)
+    return {"context": formatted_context, "retrieval_scores": scores}
+
+
+def _retrieval_timed_out(timeout: float) -> dict:
+    print(f"Warning: retrieval timed out after {timeout:.1f}s; answering without it")
+    deadline_stats.record("retrieval_timeouts")
+    return {
+        "context": "No internal context found.",
+        "retrieval_scores": [],
+        "degraded": True,
+    }
+
+
+def retrieve_node(state: MentoriaState, config: RunnableConfig):
+    print("--- RETRIEVING CONTEXT ---")
+    question = state["question"]
+
+    timeout = step_timeout(config, RETRIEVAL_TIMEOUT_SECONDS)
+    try:
+        results = run_with_timeout(
+            lambda: search_chunks(question=question, k=5), timeout
+        )
+    except TIMEOUT_ERRORS:
+        return _retrieval_timed_out(timeout)
+
+    return _retrieved_context(config, results)
+
+
+async def aretrieve_node(state: MentoriaState, config: RunnableConfig):
+    print("--- RETRIEVING CONTEXT ---")
+    question = state["question"]
+
+    timeout = step_timeout(config, RETRIEVAL_TIMEOUT_SECONDS)
+    try:
+        results = await asyncio.wait_for(
+            asearch_chunks(question=question, k=5), timeout
+        )
+    except TIMEOUT_ERRORS:
+        return _retrieval_timed_out(timeout)
+
+    return _retrieved_context(config, results)
+
 
+def _agent_inputs(state: MentoriaState, prefetched: List[BaseMessage]) -> dict:
+    return {
+        "user_name": state["user_name"],
+        "user_role": state["user_role"],
+        # Not persisted in checkpoints, so absent when a turn is resumed
+        "context": state.get("context") or "No internal context found.",
+        "conversation_summary": state.get("summary") or "(none)",
+        "chat_history": recent_history(state) + prefetched,
+        "question": state["question"],
+    }
 
-def agent_node(state: MentoriaState):
+
+def _bound_tools(policy: str, config: RunnableConfig) -> list:
+    """
+    Tools bound for this call: none under INTERNAL_ONLY, nor once a web
+    search would eat into the time kept for the answer (the agent then
+    has to answer with what it has).
+    """
+    if policy == INTERNAL_ONLY:
+        return []
+    if not has_time_for_tools(config, TOOL_TIMEOUT_SECONDS):
+        print("--- DEADLINE: TOOLS WITHHELD ---")
+        deadline_stats.record("tools_withheld")
+        return []
+    return get_tools()
+
+
+def _prefetch_timeout(config: RunnableConfig) -> Optional[float]:
+    return step_timeout(config, TOOL_TIMEOUT_SECONDS, reserve=ANSWER_RESERVE_SECONDS)
+
+
+def _agent_update(messages: list, policy: str, bound_tools: list) -> dict:
+    update = {"messages": messages, "loop_count": 1}
+    if policy != INTERNAL_ONLY and not bound_tools:
+        # Tools withheld for the deadline
+        update["degraded"] = True
+    return update
+
+
+def agent_node(state: MentoriaState, config: RunnableConfig):
+    print("--- AGENT THINKING ---")
+    policy = choose_tool_policy(state)
+    bound_tools = _bound_tools(policy, config)
+    chain = get_agent_chain(bound_tools, temperature=0.3)
+    prefetched = []
+    if policy == WEB_PREFETCH and bound_tools and is_first_pass(state):
+        prefetched = prefetch_web_search(
+            get_web_search_tool(), state["question"], _prefetch_timeout(config)
+        )
+
+    response = chain.invoke(_agent_inputs(state, prefetched))
+
+    record_agent_call(state, policy, response)
+    return _agent_update([*prefetched, response], policy, bound_tools)
+
+
+async def aagent_node(state: MentoriaState, config: RunnableConfig):
     print("--- AGENT THINKING ---")
-    llm = get_llm_model(temperature=0.3)
-    llm_with_tools = llm.bind_tools(tools)
+    policy = choose_tool_policy(state)
+    bound_tools = _bound_tools(policy, config)
+    chain = get_agent_chain(bound_tools, temperature=0.3)
+    prefetched = []
+    if policy == WEB_PREFETCH and bound_tools and is_first_pass(state):
+        prefetched = await aprefetch_web_search(
+            get_web_search_tool(), state["question"], _prefetch_timeout(config)
+        )
+
+    response = await chain.ainvoke(_agent_inputs(state, prefetched))
+
+    record_agent_call(state, policy, response)
+    return _agent_update([*prefetched, response], policy, bound_tools)
+
+
+def _unanswered_tool_calls(state: MentoriaState, reason: str) -> dict:
+    """
+    Answers every pending tool call with an error, so the agent sees why
+    it got no results and answers without them.
+    """
+    calls = getattr(state["messages"][-1], "tool_calls", None) or []
+    return {
+        "messages": [
+            ToolMessage(
+                content=f"{reason}. Answer with the context you already have.",
+                tool_call_id=call["id"],
+                name=call["name"],
+                status="error",
+            )
+            for call in calls
+        ],
+        "degraded": True,
+    }
+
+
+def _tool_timeout(config: RunnableConfig):
+    """
+    Timeout for the pending tool calls, keeping ANSWER_RESERVE_SECONDS for
+    the answer; None when no time is left for them at all.
+    """
+    if not has_time_for_tools(config, 0):
+        print("--- DEADLINE: TOOL CALLS SKIPPED ---")
+        deadline_stats.record("tool_calls_skipped")
+        return None
+    return step_timeout(config, TOOL_TIMEOUT_SECONDS, reserve=ANSWER_RESERVE_SECONDS)
+
+
+def _tool_calls_timed_out(state: MentoriaState, timeout: float) -> dict:
+    print(f"Warning: tool calls timed out after {timeout:.1f}s")
+    deadline_stats.record("tool_calls_timed_out")
+    return _unanswered_tool_calls(state, "Tool call timed out")
+
+
+_NO_TIME_FOR_TOOLS = "Tool call skipped: the response time budget is exhausted"
+
+
+def tools_node(state: MentoriaState, config: RunnableConfig):
+    timeout = _tool_timeout(config)
+    if timeout is None:
+        return _unanswered_tool_calls(state, _NO_TIME_FOR_TOOLS)
 
-    prompt_template = get_mentoria_prompt()
+    try:
+        return run_with_timeout(lambda: get_tool_node().invoke(state, config), timeout)
+    except TIMEOUT_ERRORS:
+        return _tool_calls_timed_out(state, timeout)
 
-    chain = prompt_template | llm_with_tools
 
-    response = chain.invoke(
-        {
-            "user_name": state["user_name"],
-            "user_role": state["user_role"],
-            "context": state["context"],
-            "chat_history": state["messages"],
-            "question": state["question"],
-        }
-    )
+async def atools_node(state: MentoriaState, config: RunnableConfig):
+    timeout = _tool_timeout(config)
+    if timeout is None:
+        return _unanswered_tool_calls(state, _NO_TIME_FOR_TOOLS)
 
-    return {"messages": [response], "loop_count": 1}
+    try:
+        return await asyncio.wait_for(get_tool_node().ainvoke(state, config), timeout)
+    except TIMEOUT_ERRORS:
+        return _tool_calls_timed_out(state, timeout)
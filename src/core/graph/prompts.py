@@ -37,6 +37,7 @@ Your mission is to accelerate the integration of new employees by providing accu
         - DO NOT try to invent information if the context is empty and the search fails. Admit you don't know and suggest who to talk to (e.g., HR or Manager).
     4. **SYNTHESIS**:
         - When answering, cite whether the information came from "Internal Knowledge Base" or "External Sources".
+        - Each context block starts with a [Source: document, page] label; cite it for internal information.
         - Connect the answer directly to the user's role responsibilities.
 </core_instructions>
 
@@ -44,12 +45,34 @@ Now respond to {user_name}:
 """
 
 HUMAN_CONTEXT_TEXT = """
+Summary of the earlier conversation (older turns are not repeated below):
+<conversation_summary>
+{conversation_summary}
+</conversation_summary>
+
 Here is the relevant context for your question (RAG):
 <context>
 {context}
 </context>
 """
 
+SUMMARY_SYSTEM_TEXT = """
+You maintain the running summary of an onboarding conversation between a new employee and MentorIA.
+Update the existing summary with the new turns. Keep facts the employee shared about themselves, questions asked, answers and decisions given, and open follow-ups.
+Drop greetings and small talk. Write in the language of the conversation, in at most {max_words} words.
+Return only the updated summary.
+"""
+
+SUMMARY_HUMAN_TEXT = """
+<current_summary>
+{summary}
+</current_summary>
+
+<new_turns>
+{turns}
+</new_turns>
+"""
+
 
 def get_mentoria_prompt() -> ChatPromptTemplate:
     """
@@ -59,6 +82,7 @@ def get_mentoria_prompt() -> ChatPromptTemplate:
     - user_name (str)
     - user_role (str)
     - context (str)
+    - conversation_summary (str)
     - chat_history (List[BaseMessage])
     - question (str)
     """
@@ -70,3 +94,20 @@ def get_mentoria_prompt() -> ChatPromptTemplate:
             HumanMessagePromptTemplate.from_template("{question}"),
         ]
     )
+
+
+def get_summary_prompt() -> ChatPromptTemplate:
+    """
+    Returns the prompt that folds older turns into the running summary.
+
+    Expected Input Variables in Chain:
+    - summary (str)
+    - turns (str)
+    - max_words (int)
+    """
+    return ChatPromptTemplate.from_messages(
+        [
+            SystemMessagePromptTemplate.from_template(SUMMARY_SYSTEM_TEXT),
+            HumanMessagePromptTemplate.from_template(SUMMARY_HUMAN_TEXT),
+        ]
+    )
@@ -1,19 +1,244 @@
 """
 Retrieval Module - MentorIA Core
-Responsible for vector search in MongoDB Atlas.
+Responsible for vector search in MongoDB Atlas or in the local index.
 """
 
+import asyncio
 import os
-from typing import List
+from typing import Dict, List
 
 from pymongo.collection import Collection
 from pymongo.errors import PyMongoError
-from src.config import get_embedding_model, get_mongodb_client
+from src.config import (
+    EMBEDDING_STORAGE,
+    LOCAL_INDEX_PATH,
+    QUANTIZED_RESCORE_FACTOR,
+    RETRIEVAL_BACKEND,
+    RETRIEVAL_SINGLE_FLIGHT_GRACE_SECONDS,
+    get_async_mongodb_client,
+    get_mongodb_client,
+)
+from src.core.cache import normalize_text
+from src.core.embedding_cache import get_query_embedding_cache
+from src.core.graph.vector_index import get_local_index
+from src.core.quantization import (
+    FLOAT,
+    FULL_EMBEDDING_FIELD,
+    decode_vector,
+    quantize,
+    rescore,
+    to_bson_vector,
+)
+from src.core.singleflight import SingleFlight
+from src.core.telemetry import VECTOR_SEARCH_SECONDS, span
 
 
 DATABASE_NAME = os.getenv("DATABASE")
 COLLECTION_NAME = os.getenv("COLLECTION")
 
+# Identical questions searched concurrently share one embedding + search
+_search_flight = SingleFlight(grace_seconds=RETRIEVAL_SINGLE_FLIGHT_GRACE_SECONDS)
+
+
+def _check_collection_settings() -> None:
+    if not COLLECTION_NAME:
+        raise ValueError("COLLECTION not found in environment variables")
+
+    if not DATABASE_NAME:
+        raise ValueError("DATABASE not found in environment variables")
+
+
+def _vector_search_pipeline(question_embedding: List[float], k: int) -> List[Dict]:
+    query_vector = question_embedding
+    projection = {
+        "text": 1,
+        "metadata": 1,
+        "source": 1,
+        "score": {"$meta": "vectorSearchScore"},
+    }
+    if EMBEDDING_STORAGE != FLOAT:
+        # Quantized index: over-fetch candidates with their float32 copy,
+        # reranked exactly by _rescore_candidates
+        k *= QUANTIZED_RESCORE_FACTOR
+        query_vector = to_bson_vector(
+            quantize(question_embedding, EMBEDDING_STORAGE)[0], EMBEDDING_STORAGE
+        )
+        projection[FULL_EMBEDDING_FIELD] = 1
+    return [
+        {
+            "$vectorSearch": {
+                "index": "vector_index",
+                "path": "embedding",
+                "queryVector": query_vector,
+                "numCandidates": k * 10,
+                "limit": k,
+            }
+        },
+        {"$project": projection},
+    ]
+
+
+def _rescore_candidates(
+    question_embedding: List[float], results: List[Dict], k: int
+) -> List[Dict]:
+    if EMBEDDING_STORAGE == FLOAT:
+        return results
+    vectors = [decode_vector(doc.pop(FULL_EMBEDDING_FIELD)) for doc in results]
+    return rescore(question_embedding, results, vectors, k)
+
+
+def atlas_vector_search(question_embedding: List[float], k: int) -> List[Dict]:
+    """
+    Runs a $vectorSearch aggregation against MongoDB Atlas.
+
+    Args:
+        question_embedding: Query vector
+        k: Number of chunks to retrieve
+
+    Returns:
+        List[Dict]: Chunks with text, metadata, source and score
+    """
+    _check_collection_settings()
+
+    client = get_mongodb_client()
+    db = client[DATABASE_NAME]
+    collection: Collection = db[COLLECTION_NAME]
+
+    pipeline = _vector_search_pipeline(question_embedding, k)
+    results = list(collection.aggregate(pipeline))
+    return _rescore_candidates(question_embedding, results, k)
+
+
+async def aatlas_vector_search(question_embedding: List[float], k: int) -> List[Dict]:
+    """
+    Async variant of atlas_vector_search using the asyncio MongoDB driver.
+    """
+    _check_collection_settings()
+
+    client = get_async_mongodb_client()
+    collection = client[DATABASE_NAME][COLLECTION_NAME]
+
+    pipeline = _vector_search_pipeline(question_embedding, k)
+    cursor = await collection.aggregate(pipeline)
+    results = await cursor.to_list()
+    return _rescore_candidates(question_embedding, results, k)
+
+
+def local_vector_search(question_embedding: List[float], k: int) -> List[Dict]:
+    """
+    Searches the in-process memory-mapped index built at ingestion time.
+
+    Args:
+        question_embedding: Query vector
+        k: Number of chunks to retrieve
+
+    Returns:
+        List[Dict]: Chunks with text, metadata, source and score
+    """
+    return get_local_index(LOCAL_INDEX_PATH).search(question_embedding, k)
+
+
+async def alocal_vector_search(question_embedding: List[float], k: int) -> List[Dict]:
+    """
+    Async variant of local_vector_search; the matrix product runs in a
+    worker thread.
+    """
+    return await asyncio.to_thread(local_vector_search, question_embedding, k)
+
+
+RETRIEVAL_BACKENDS = {
+    "atlas": atlas_vector_search,
+    "local": local_vector_search,
+}
+
+ASYNC_RETRIEVAL_BACKENDS = {
+    "atlas": aatlas_vector_search,
+    "local": alocal_vector_search,
+}
+
+
+def _get_backend(backends: dict):
+    backend = backends.get(RETRIEVAL_BACKEND)
+    if backend is None:
+        raise ValueError(
+            f"Invalid RETRIEVAL_BACKEND '{RETRIEVAL_BACKEND}' "
+            f"(expected one of: {', '.join(backends)})"
+        )
+    return backend
+
+
+def _warn_if_empty(results: List[Dict]) -> List[Dict]:
+    if not results:
+        print(
+            f"Warning: Vector search ({RETRIEVAL_BACKEND}) returned no "
+            "results. Check if the 'vector_index' is configured in "
+            "MongoDB Atlas or the local index has been built."
+        )
+    return results
+
+
+def _search_key(question: str, k: int) -> tuple:
+    return (RETRIEVAL_BACKEND, k, normalize_text(question))
+
+
+def get_search_coalescing_stats() -> dict:
+    """
+    Returns how many searches were served by a concurrent identical one.
+    """
+    return _search_flight.stats()
+
+
+def search_chunks(question: str, k: int = 5) -> List[Dict]:
+    """
+    Retrieves the k most relevant chunks for a question, with their
+    metadata and similarity score, from the configured backend.
+
+    Args:
+        question: User's question
+        k: Number of chunks to retrieve (default: 5)
+
+    Returns:
+        List[Dict]: Chunks with 'text', 'metadata', 'source' and 'score',
+            best first
+    """
+    backend = _get_backend(RETRIEVAL_BACKENDS)
+
+    def search() -> List[Dict]:
+        try:
+            question_embedding = get_query_embedding_cache().embed_query(question)
+            with span(
+                "vector_search", VECTOR_SEARCH_SECONDS, backend=RETRIEVAL_BACKEND
+            ):
+                return backend(question_embedding, k)
+        except PyMongoError as e:
+            print(f"Error connecting to MongoDB or executing the query: {e}")
+            raise
+
+    results = _search_flight.do(_search_key(question, k), search)
+    return _warn_if_empty(list(results))
+
+
+async def asearch_chunks(question: str, k: int = 5) -> List[Dict]:
+    """
+    Async variant of search_chunks.
+    """
+    backend = _get_backend(ASYNC_RETRIEVAL_BACKENDS)
+
+    async def search() -> List[Dict]:
+        try:
+            cache = get_query_embedding_cache()
+            question_embedding = await cache.aembed_query(question)
+            with span(
+                "vector_search", VECTOR_SEARCH_SECONDS, backend=RETRIEVAL_BACKEND
+            ):
+                return await backend(question_embedding, k)
+        except PyMongoError as e:
+            print(f"Error connecting to MongoDB or executing the query: {e}")
+            raise
+
+    results = await _search_flight.ado(_search_key(question, k), search)
+    return _warn_if_empty(list(results))
+
 
 def retrieve_context(
     question: str,
@@ -25,62 +250,26 @@ def retrieve_context(
 
     Args:
         question: User's question
-        google_api_key: Google API key
-        mongodb_connection_string: MongoDB connection string
-        database_name: Database name
-        collection_name: Collection name
         k: Number of chunks to retrieve (default: 5)
 
     Returns:
         List[str]: List of retrieved chunk texts
     """
-    try:
-        embeddings_model = get_embedding_model()
-        question_embedding = embeddings_model.embed_query(question)
-
-        client = get_mongodb_client()
-
-        if not COLLECTION_NAME:
-            raise ValueError("COLLECTION not found in environment variables")
-
-        if not DATABASE_NAME:
-            raise ValueError("DATABASE not found in environment variables")
-
-        db = client[DATABASE_NAME]
-        collection: Collection = db[COLLECTION_NAME]
-
-        pipeline = [
-            {
-                "$vectorSearch": {
-                    "index": "vector_index",
-                    "path": "embedding",
-                    "queryVector": question_embedding,
-                    "numCandidates": k * 10,
-                    "limit": k,
-                }
-            },
-            {
-                "$project": {
-                    "text": 1,
-                    "metadata": 1,
-                    "source": 1,
-                    "score": {"$meta": "vectorSearchScore"},
-                }
-            },
-        ]
-
-        results = list(collection.aggregate(pipeline))
-        client.close()
-
-        if not results:
-            print(
-                "Warning: Vector search returned no results. "
-                "Check if the 'vector_index' is configured "
-                "in MongoDB Atlas."
-            )
-            return []
-    except PyMongoError as e:
-        print(f"Error connecting to MongoDB or executing the query: {e}")
-        raise
-
-    return [result["text"] for result in results]
+    return [result["text"] for result in search_chunks(question, k)]
+
+
+async def aretrieve_context(
+    question: str,
+    k: int = 5,
+) -> List[str]:
+    """
+    Async variant of retrieve_context.
+
+    Args:
+        question: User's question
+        k: Number of chunks to retrieve (default: 5)
+
+    Returns:
+        List[str]: List of retrieved chunk texts
+    """
+    return [result["text"] for result in await asearch_chunks(question, k)]
@@ -0,0 +1,218 @@
+"""
+Router Module - MentorIA Core
+Decides, without any model call, whether a message needs a fresh
+knowledge base search, can reuse the previous turn's context (rewrites of
+the previous answer), or needs no context at all (small talk).
+"""
+
+import re
+import threading
+from typing import List, Optional, Set, Tuple
+
+from langchain_core.runnables import RunnableConfig
+
+from src.config import ROUTER_CONTEXT_TTL_SECONDS, ROUTER_ENABLED
+from src.core.cache import TTLCache, normalize_text
+from src.core.graph.state import MentoriaState
+
+RETRIEVE = "retrieve"
+REUSE = "reuse"
+SKIP = "skip"
+
+NO_CONTEXT_NEEDED = "No internal context needed for this message."
+
+# Whole messages that carry no information need
+_SMALL_TALK = re.compile(
+    r"^(hi|hello|hey|thanks|thank you|thx|ok|okay|cool|great|nice|perfect|"
+    r"got it|bye|goodbye|good (morning|afternoon|evening)|"
+    r"oi|olá|ola|obrigad[oa]|valeu|blz|beleza|certo|entendi|perfeito|"
+    r"ótimo|otimo|show|legal|tchau|até mais|ate mais|"
+    r"bom dia|boa tarde|boa noite)"
+    r"( (so much|a lot|muito|mesmo|mentoria))*[\s!.,😀🙂👍🙏]*$"
+)
+
+# Instructions that only reshape the previous answer
+_REWRITE = re.compile(
+    r"\b(shorten|shorter|summari[sz]e|rephrase|reword|simplify|translate|"
+    r"bullet points?|in (english|portuguese)|explain (that|it) again|"
+    r"resuma|resumir|encurte|mais curt[oa]|reformule|simplifique|traduza|"
+    r"em tópicos|em topicos|em inglês|em ingles|em português|em portugues|"
+    r"explique (isso|de novo|novamente))\b"
+)
+
+# A rewrite instruction longer than this probably asks something new too
+_MAX_REWRITE_WORDS = 12
+
+_WORD = re.compile(r"\w+")
+
+# Words a rewrite instruction uses without naming a topic: the rewrite
+# verbs, pointers back to the answer and filler. Any other word must come
+# from the previous turn, or the message asks about something new
+_REWRITE_WORDS = frozenset("""
+    shorten shorter summarize summarise summary rephrase reword simplify
+    translate bullet bullets point points english portuguese explain again
+    it that this answer response reply text above previous last
+    the a an in into to with me please can could you make more less and
+    resuma resumir resumo encurte curto curta reformule simplifique traduza
+    tópicos topicos inglês ingles português portugues explique novo novamente
+    isso isto esse essa este esta resposta texto acima anterior última ultima
+    o os as um uma de em no na para pra por favor pode poderia você voce
+    faça faca deixe mais menos e
+    """.split())
+
+
+def _new_topic_words(text: str, previous_turn: str) -> Set[str]:
+    """
+    Words of a normalized message that are neither rewrite vocabulary nor
+    part of the previous turn.
+    """
+    previous = set(_WORD.findall(normalize_text(previous_turn)))
+    return {
+        word
+        for word in _WORD.findall(text)
+        if word not in _REWRITE_WORDS and word not in previous
+    }
+
+
+def classify_message(
+    question: str, previous_turn: Optional[str] = None
+) -> Tuple[str, str]:
+    """
+    Classifies a message into RETRIEVE, REUSE or SKIP.
+
+    A rewrite instruction is REUSE only if it points back at the previous
+    answer ("resuma isso", "explain that again") or names nothing the
+    previous turn did not; "Summarize the vacation policy" after a turn
+    about something else is a new question.
+
+    Args:
+        question: User's message
+        previous_turn: Text of the previous question and answer, None when
+            the conversation has no answer a rewrite could refer to
+
+    Returns:
+        Tuple[str, str]: (decision, reason)
+    """
+    text = normalize_text(question)
+    if not text:
+        return SKIP, "empty"
+    if _SMALL_TALK.match(text):
+        return SKIP, "small talk"
+    if (
+        previous_turn is not None
+        and len(text.split()) <= _MAX_REWRITE_WORDS
+        and _REWRITE.search(text)
+    ):
+        if _new_topic_words(text, previous_turn):
+            return RETRIEVE, "rewrite naming a new topic"
+        return REUSE, "rewrite of the previous answer"
+    return RETRIEVE, "information request"
+
+
+class RoutingStats:
+    """Thread-safe counters of routing decisions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {RETRIEVE: 0, REUSE: 0, SKIP: 0}
+        self._reuse_misses = 0
+
+    def record(self, decision: str, reuse_miss: bool = False) -> None:
+        with self._lock:
+            self._counts[decision] += 1
+            self._reuse_misses += int(reuse_miss)
+
+    def stats(self) -> dict:
+        """
+        Returns decision counts and the share of turns that avoided a
+        knowledge base search.
+        """
+        with self._lock:
+            total = sum(self._counts.values())
+            avoided = self._counts[REUSE] + self._counts[SKIP]
+            return {
+                **self._counts,
+                "reuse_misses": self._reuse_misses,
+                "retrieval_avoided_rate": avoided / total if total else 0.0,
+            }
+
+
+routing_stats = RoutingStats()
+
+# Last retrieved context (and its scores) of each conversation. Checkpoints
+# do not persist it, so a REUSE can miss here (other process, expired entry).
+_recent_contexts = TTLCache(max_size=4096, ttl_seconds=ROUTER_CONTEXT_TTL_SECONDS)
+
+
+def _thread_id(config: Optional[RunnableConfig]) -> Optional[str]:
+    return ((config or {}).get("configurable") or {}).get("thread_id")
+
+
+def remember_context(
+    config: Optional[RunnableConfig], context: str, scores: List[float]
+) -> None:
+    """
+    Keeps a freshly retrieved context so the next turn can reuse it.
+    """
+    thread_id = _thread_id(config)
+    if thread_id:
+        _recent_contexts.set(thread_id, (context, scores))
+
+
+def _previous_turn(state: MentoriaState) -> Optional[str]:
+    """
+    Text of the last question and answer before the current message (the
+    last one), None if no answer came before it.
+    """
+    earlier = state["messages"][:-1]
+    if not any(message.type == "ai" for message in earlier):
+        return None
+    start = max(
+        (i for i, message in enumerate(earlier) if message.type == "human"),
+        default=0,
+    )
+    return " ".join(
+        message.text for message in earlier[start:] if message.type in ("human", "ai")
+    )
+
+
+def route_node(state: MentoriaState, config: RunnableConfig):
+    question = state["question"]
+    if not ROUTER_ENABLED:
+        return {"route": RETRIEVE}
+
+    decision, reason = classify_message(question, _previous_turn(state))
+    update = {"route": decision}
+    reuse_miss = False
+
+    if decision == REUSE:
+        thread_id = _thread_id(config)
+        recent = _recent_contexts.get(thread_id) if thread_id else None
+        if recent is None:
+            # Rewrites only need the chat history; no search either way
+            recent, reuse_miss = (NO_CONTEXT_NEEDED, []), True
+        update["context"], update["retrieval_scores"] = recent
+    elif decision == SKIP:
+        update["context"] = NO_CONTEXT_NEEDED
+        update["retrieval_scores"] = []
+
+    routing_stats.record(decision, reuse_miss)
+    print(f"--- ROUTE: {decision} ({reason}) ---")
+    return update
+
+
+def next_after_route(state: MentoriaState):
+    """
+    Conditional edge after the router: history management always runs,
+    retrieval only when the router asked for it.
+    """
+    if state.get("route", RETRIEVE) == RETRIEVE:
+        return ["retrieve", "history"]
+    return ["history"]
+
+
+def get_routing_stats() -> dict:
+    """
+    Returns routing decision counts since the process started.
+    """
+    return routing_stats.stats()
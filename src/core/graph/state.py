@@ -11,3 +11,13 @@ class MentoriaState(TypedDict):
     user_role: str
     context: str
     question: str
+    # Router decision for the current turn: "retrieve", "reuse" or "skip"
+    route: str
+    # Vector scores of the chunks behind the current context
+    retrieval_scores: List[float]
+    # Running summary of the turns before messages[summarized_count:]
+    summary: str
+    summarized_count: int
+    # Set when this turn answered with less than usual to meet its deadline
+    # (retrieval timed out, tools withheld, skipped or timed out)
+    degraded: bool
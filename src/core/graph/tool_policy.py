@@ -0,0 +1,183 @@
+"""
+Tool Policy Module - MentorIA Core
+Uses retrieval scores to decide how the agent gets the web search tool:
+not at all when the knowledge base clearly answers the question, as usual
+in between, and with the web search for the question already run and
+handed to the first LLM call when internal context is weak.
+"""
+
+import asyncio
+import threading
+import uuid
+from typing import Dict, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolCall
+from langchain_core.tools import BaseTool
+
+from src.config import (
+    TOOL_POLICY_ENABLED,
+    TOOL_POLICY_STRONG_SCORE,
+    TOOL_POLICY_WEAK_SCORE,
+)
+from src.core.deadline import run_with_timeout
+from src.core.graph.state import MentoriaState
+from src.core.telemetry import record_agent_iterations
+
+INTERNAL_ONLY = "internal_only"
+TOOLS = "tools"
+WEB_PREFETCH = "web_prefetch"
+
+
+def choose_tool_policy(state: MentoriaState) -> str:
+    """
+    Picks the tool policy for the current turn.
+
+    Returns:
+        str: INTERNAL_ONLY (no tools bound), TOOLS (tools bound) or
+            WEB_PREFETCH (tools bound, web search results already given)
+    """
+    if not TOOL_POLICY_ENABLED:
+        return TOOLS
+
+    route = state.get("route", "retrieve")
+    if route == "skip":
+        return INTERNAL_ONLY
+
+    scores = state.get("retrieval_scores") or []
+    if not scores:
+        # A fresh search found nothing; a reused context carries no scores
+        return WEB_PREFETCH if route == "retrieve" else TOOLS
+
+    top_score = max(scores)
+    if top_score >= TOOL_POLICY_STRONG_SCORE:
+        return INTERNAL_ONLY
+    if top_score < TOOL_POLICY_WEAK_SCORE:
+        return WEB_PREFETCH
+    return TOOLS
+
+
+def is_first_pass(state: MentoriaState) -> bool:
+    """True while the agent has not yet called any tool in this turn."""
+    messages = state["messages"]
+    return bool(messages) and messages[-1].type == "human"
+
+
+# Id prefix of the tool calls made by the prefetch rather than the LLM
+PREFETCH_CALL_PREFIX = "prefetch_"
+
+
+def is_prefetch_call(message: BaseMessage) -> bool:
+    """True for the tool call message the prefetch adds for the agent."""
+    calls = getattr(message, "tool_calls", None) or []
+    return any(call["id"].startswith(PREFETCH_CALL_PREFIX) for call in calls)
+
+
+def _prefetch_call(tool: BaseTool, question: str) -> ToolCall:
+    return ToolCall(
+        name=tool.name,
+        args={"query": question},
+        id=f"{PREFETCH_CALL_PREFIX}{uuid.uuid4().hex}",
+        type="tool_call",
+    )
+
+
+def _prefetch_failed(error: BaseException) -> List[BaseMessage]:
+    print(f"Warning: web search prefetch failed: {error!r}")
+    return []
+
+
+def prefetch_web_search(
+    tool: BaseTool, question: str, timeout: Optional[float]
+) -> List[BaseMessage]:
+    """
+    Runs the (cached) web search for the question and returns it as a
+    tool call and its result, for the agent's first LLM call to read as if
+    it had searched itself: it answers in one call instead of asking for a
+    search (usually with a reworded query the prefetch could not serve).
+
+    Returns:
+        List[BaseMessage]: [AIMessage with the call, ToolMessage], or []
+            if the search failed or timed out (the agent keeps its tools)
+    """
+    call = _prefetch_call(tool, question)
+    try:
+        result = run_with_timeout(lambda: tool.invoke(call), timeout)
+    except Exception as e:
+        # Timeouts included: a late result still lands in the cache
+        return _prefetch_failed(e)
+    return [AIMessage(content="", tool_calls=[call]), result]
+
+
+async def aprefetch_web_search(
+    tool: BaseTool, question: str, timeout: Optional[float]
+) -> List[BaseMessage]:
+    """
+    Async variant of prefetch_web_search.
+    """
+    call = _prefetch_call(tool, question)
+    try:
+        result = await asyncio.wait_for(tool.ainvoke(call), timeout)
+    except Exception as e:
+        return _prefetch_failed(e)
+    return [AIMessage(content="", tool_calls=[call]), result]
+
+
+class AgentLoopStats:
+    """
+    Counts LLM calls per answered turn, overall and per tool policy.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._answers: Dict[str, int] = {}
+        self._llm_calls: Dict[str, int] = {}
+
+    def record(self, policy: str, llm_calls: int) -> None:
+        with self._lock:
+            self._answers[policy] = self._answers.get(policy, 0) + 1
+            self._llm_calls[policy] = self._llm_calls.get(policy, 0) + llm_calls
+
+    def stats(self) -> dict:
+        with self._lock:
+            answers = sum(self._answers.values())
+            calls = sum(self._llm_calls.values())
+            return {
+                "answers": answers,
+                "llm_calls": calls,
+                "avg_llm_calls_per_answer": calls / answers if answers else 0.0,
+                "by_policy": {
+                    policy: {
+                        "answers": count,
+                        "avg_llm_calls_per_answer": self._llm_calls[policy] / count,
+                    }
+                    for policy, count in self._answers.items()
+                },
+            }
+
+
+agent_loop_stats = AgentLoopStats()
+
+
+def record_agent_call(state: MentoriaState, policy: str, response) -> None:
+    """
+    Records a finished answer (a response without tool calls) with the
+    number of LLM calls the turn took.
+    """
+    if getattr(response, "tool_calls", None):
+        return
+    messages: List = state["messages"]
+    calls = 1
+    for message in reversed(messages):
+        if message.type == "human":
+            break
+        if message.type == "ai" and not is_prefetch_call(message):
+            calls += 1
+    agent_loop_stats.record(policy, calls)
+    record_agent_iterations(policy, calls)
+
+
+def get_agent_loop_stats() -> dict:
+    """
+    Returns the average number of LLM calls per answer, per tool policy.
+    """
+    return agent_loop_stats.stats()
@@ -0,0 +1,378 @@
+"""
+Vector Index Module - MentorIA Core
+In-process vector index: a memory-mapped float32 embedding matrix plus a
+side table of chunk texts and metadata, searched with a vectorized cosine
+top-k. Built from the MongoDB chunk collection.
+
+Each build is written to its own version directory under the index path
+and published by atomically replacing a CURRENT pointer file, so a
+reader always opens one complete version.
+
+With int8 or binary storage the scan runs over a quantized matrix and
+only the best candidates' float32 rows are read back for rescoring.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from pymongo.collection import Collection
+
+from src.config import EMBEDDING_STORAGE, QUANTIZED_RESCORE_FACTOR
+from src.core.quantization import (
+    BINARY,
+    FLOAT,
+    FULL_EMBEDDING_FIELD,
+    INT8,
+    check_storage_mode,
+    decode_vector,
+    hamming_distances,
+    quantize,
+    rescore,
+)
+
+EMBEDDINGS_FILE = "embeddings.f32"
+QUANTIZED_FILE = "embeddings.q"
+CHUNKS_FILE = "chunks.json"
+META_FILE = "meta.json"
+# Names the version directory in use; replaced atomically by each build
+CURRENT_FILE = "CURRENT"
+_VERSION_PREFIX = "v"
+
+# Rows of the quantized matrix widened to float32 at a time while scanning
+# (small enough for the widened block to stay in the CPU cache)
+_SCAN_BLOCK_ROWS = 4096
+
+
+def current_index_dir(index_dir: str) -> Path:
+    """
+    Returns the directory of the index version in use: the one named by
+    the CURRENT pointer, or index_dir itself for an index built before
+    versioning.
+    """
+    root = Path(index_dir)
+    try:
+        version = (root / CURRENT_FILE).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return root
+    return root / version
+
+
+class LocalVectorIndex:
+    """
+    Read-only cosine-similarity index over unit-normalized float32 rows.
+
+    Scores are reported as (1 + cosine) / 2, the same scale Atlas uses for
+    cosine vectorSearchScore, so thresholds work across backends.
+
+    A quantized index ranks every row on its int8 (cosine) or binary
+    (Hamming) matrix and rescores the best k * rescore_factor rows
+    exactly from the float32 matrix.
+    """
+
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        chunks: List[dict],
+        meta: dict,
+        quantized: Optional[np.ndarray] = None,
+        rescore_factor: int = QUANTIZED_RESCORE_FACTOR,
+    ):
+        self.embeddings = embeddings
+        self.chunks = chunks
+        self.meta = meta
+        self.quantized = quantized
+        self.rescore_factor = max(1, rescore_factor)
+        self.storage = meta.get("storage", FLOAT)
+        self._int8_norms = None
+        if quantized is not None and self.storage == INT8:
+            self._int8_norms = self._row_norms(quantized)
+
+    @staticmethod
+    def _row_norms(matrix: np.ndarray) -> np.ndarray:
+        norms = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), _SCAN_BLOCK_ROWS):
+            block = matrix[start : start + _SCAN_BLOCK_ROWS].astype(np.float32)
+            norms[start : start + len(block)] = np.linalg.norm(block, axis=1)
+        norms[norms == 0] = 1.0
+        return norms
+
+    @classmethod
+    def load(cls, index_dir: str) -> "LocalVectorIndex":
+        """
+        Opens the current version of an index, memory-mapping the
+        embedding matrix. A version deleted by newer builds while it is
+        being opened is retried from the new CURRENT pointer.
+
+        Raises:
+            FileNotFoundError: If the index has not been built
+        """
+        while True:
+            path = current_index_dir(index_dir)
+            try:
+                return cls._load_version(path, index_dir)
+            except FileNotFoundError:
+                if current_index_dir(index_dir) == path:
+                    raise
+
+    @classmethod
+    def _load_version(cls, path: Path, index_dir: str) -> "LocalVectorIndex":
+        meta_path = path / META_FILE
+        if not meta_path.exists():
+            raise FileNotFoundError(
+                f"Local vector index not found in {index_dir}. "
+                "Run ingestion with --build-local-index first."
+            )
+
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        chunks = json.loads((path / CHUNKS_FILE).read_text(encoding="utf-8"))
+        storage = meta.get("storage", FLOAT)
+        quantized = None
+        if meta["count"]:
+            embeddings = np.memmap(
+                path / EMBEDDINGS_FILE,
+                dtype=np.float32,
+                mode="r",
+                shape=(meta["count"], meta["dimensions"]),
+            )
+            if storage != FLOAT:
+                quantized = np.memmap(
+                    path / QUANTIZED_FILE,
+                    dtype=np.int8 if storage == INT8 else np.uint8,
+                    mode="r",
+                    shape=(meta["count"], meta["quantized_width"]),
+                )
+        else:
+            embeddings = np.zeros((0, meta["dimensions"]), dtype=np.float32)
+        return cls(embeddings, chunks, meta, quantized)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def search(self, query_embedding: List[float], k: int = 5) -> List[Dict]:
+        """
+        Returns the k most similar chunks.
+
+        Args:
+            query_embedding: Query vector
+            k: Number of results (default: 5)
+
+        Returns:
+            List[Dict]: Chunks with 'text', 'metadata', 'source' and 'score',
+                best first
+        """
+        if not len(self.chunks):
+            return []
+        if self.quantized is not None:
+            return self._search_quantized(query_embedding, k)
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        similarities = self.embeddings @ query
+        k = min(k, len(similarities))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+
+        return [
+            {**self.chunks[i], "score": float((1.0 + similarities[i]) / 2.0)}
+            for i in top
+        ]
+
+    def _candidate_scores(self, query_embedding: List[float]) -> np.ndarray:
+        """Quantized similarity of every row to the query (higher is closer)."""
+        query = quantize(query_embedding, self.storage)[0]
+        scores = np.empty(len(self.quantized), dtype=np.float32)
+        for start in range(0, len(self.quantized), _SCAN_BLOCK_ROWS):
+            block = self.quantized[start : start + _SCAN_BLOCK_ROWS]
+            if self.storage == BINARY:
+                block_scores = -hamming_distances(block, query)
+            else:
+                block_scores = block.astype(np.float32) @ query.astype(np.float32)
+            scores[start : start + len(block)] = block_scores
+        if self._int8_norms is not None:
+            scores /= self._int8_norms
+        return scores
+
+    def _search_quantized(self, query_embedding: List[float], k: int) -> List[Dict]:
+        scores = self._candidate_scores(query_embedding)
+        candidates = min(k * self.rescore_factor, len(scores))
+        top = np.argpartition(-scores, candidates - 1)[:candidates]
+        # Sorted row order keeps the float32 reads sequential in the memmap
+        top.sort()
+        return rescore(
+            query_embedding,
+            [self.chunks[i] for i in top],
+            self.embeddings[top],
+            k,
+        )
+
+
+def build_local_index(
+    collection: Collection,
+    index_dir: str,
+    embedding_field: str = "embedding",
+    storage: str = EMBEDDING_STORAGE,
+) -> int:
+    """
+    Builds the local index from every chunk stored in the collection.
+
+    The index is written to a new version directory and published by
+    atomically replacing the CURRENT pointer, so readers never see a
+    half-written index. The previous version is kept for readers still
+    opening it; older ones are deleted.
+
+    Args:
+        collection: MongoDB chunk collection
+        index_dir: Target directory
+        embedding_field: Field holding the float embedding (chunks stored
+            quantized are read from their full-precision copy)
+        storage: "float", or "int8"/"binary" to also write a quantized
+            matrix to search (default: EMBEDDING_STORAGE env)
+
+    Returns:
+        int: Number of indexed chunks
+    """
+    check_storage_mode(storage)
+    root = Path(index_dir)
+    version = f"{_VERSION_PREFIX}{time.time_ns()}"
+    staging = root / version
+    staging.mkdir(parents=True)
+
+    expected = collection.count_documents({embedding_field: {"$exists": True}})
+    cursor = collection.find(
+        {embedding_field: {"$exists": True}},
+        {
+            "text": 1,
+            "metadata": 1,
+            "source": 1,
+            embedding_field: 1,
+            FULL_EMBEDDING_FIELD: 1,
+        },
+    ).sort("_id", 1)
+
+    matrix: Optional[np.memmap] = None
+    quantized: Optional[np.memmap] = None
+    dimensions = 0
+    chunks: List[dict] = []
+    for doc in cursor:
+        if len(chunks) >= expected:
+            break
+        vector = decode_vector(doc.get(FULL_EMBEDDING_FIELD, doc[embedding_field]))
+        if matrix is None:
+            dimensions = vector.shape[0]
+            matrix = np.memmap(
+                staging / EMBEDDINGS_FILE,
+                dtype=np.float32,
+                mode="w+",
+                shape=(expected, dimensions),
+            )
+            if storage != FLOAT:
+                row = quantize(vector, storage)[0]
+                quantized = np.memmap(
+                    staging / QUANTIZED_FILE,
+                    dtype=row.dtype,
+                    mode="w+",
+                    shape=(expected, row.shape[0]),
+                )
+        norm = np.linalg.norm(vector)
+        matrix[len(chunks)] = vector / norm if norm else vector
+        if quantized is not None:
+            quantized[len(chunks)] = quantize(vector, storage)[0]
+        metadata = dict(doc.get("metadata") or {})
+        metadata.pop("embedding", None)
+        chunks.append(
+            {
+                "id": str(doc["_id"]),
+                "text": doc.get("text", ""),
+                "metadata": metadata,
+                "source": doc.get("source", "unknown"),
+            }
+        )
+
+    quantized_width = 0
+    if quantized is not None:
+        quantized_width = quantized.shape[1]
+        quantized.flush()
+        del quantized
+        if len(chunks) < expected:
+            with open(staging / QUANTIZED_FILE, "r+b") as f:
+                f.truncate(len(chunks) * quantized_width)
+
+    if matrix is not None:
+        matrix.flush()
+        del matrix
+        if len(chunks) < expected:
+            # Documents were deleted while building: trim the unused rows
+            with open(staging / EMBEDDINGS_FILE, "r+b") as f:
+                f.truncate(len(chunks) * dimensions * 4)
+
+    (staging / CHUNKS_FILE).write_text(
+        json.dumps(chunks, default=str), encoding="utf-8"
+    )
+    (staging / META_FILE).write_text(
+        json.dumps(
+            {
+                "count": len(chunks),
+                "dimensions": dimensions,
+                "storage": storage if quantized_width else FLOAT,
+                "quantized_width": quantized_width,
+                "built_at": time.time(),
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    previous = current_index_dir(index_dir)
+    _publish_version(root, version)
+    _remove_old_versions(root, keep={version, previous.name} - {root.name})
+    print(f"Local vector index built with {len(chunks)} chunks in {index_dir}")
+    return len(chunks)
+
+
+def _publish_version(root: Path, version: str) -> None:
+    pointer = root / f"{CURRENT_FILE}.tmp"
+    pointer.write_text(version, encoding="utf-8")
+    os.replace(pointer, root / CURRENT_FILE)
+
+
+def _remove_old_versions(root: Path, keep: set) -> None:
+    """
+    Deletes version directories not in keep (and the files of an index
+    built before versioning), including those of interrupted builds.
+    """
+    for entry in root.iterdir():
+        if entry.is_dir():
+            if entry.name.startswith(_VERSION_PREFIX) and entry.name not in keep:
+                shutil.rmtree(entry, ignore_errors=True)
+        elif entry.name in (EMBEDDINGS_FILE, QUANTIZED_FILE, CHUNKS_FILE, META_FILE):
+            entry.unlink(missing_ok=True)
+
+
+_loaded_index: Optional[LocalVectorIndex] = None
+_loaded_version: Optional[Path] = None
+_index_lock = threading.Lock()
+
+
+def get_local_index(index_dir: str) -> LocalVectorIndex:
+    """
+    Returns the process-wide index, reloading it after a rebuild.
+    """
+    global _loaded_index, _loaded_version
+
+    version = current_index_dir(index_dir)
+    if _loaded_index is not None and version == _loaded_version:
+        return _loaded_index
+
+    with _index_lock:
+        if _loaded_index is None or version != _loaded_version:
+            _loaded_index = LocalVectorIndex.load(index_dir)
+            _loaded_version = version
+        return _loaded_index
@@ -0,0 +1,111 @@
+"""
+Knowledge Base Version Module - MentorIA Core
+Identifier of the current knowledge base contents. Ingestion records a
+new version every time it changes the stored chunks, so caches derived
+from the knowledge base (the semantic answer cache) can detect that they
+are stale.
+"""
+
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from pymongo.collection import Collection
+
+from src.config import KB_VERSION_BACKEND, KB_VERSION_PATH, get_mongodb_client
+
+DATABASE_NAME = os.getenv("DATABASE")
+COLLECTION_NAME = os.getenv("COLLECTION")
+
+_VERSION_ID = "kb_version"
+
+
+class MongoVersionStore:
+    """
+    Version stored as one document in the chunk collection's meta
+    collection.
+    """
+
+    def __init__(self, meta_collection: Collection):
+        self._meta_collection = meta_collection
+
+    def get(self) -> Optional[str]:
+        doc = self._meta_collection.find_one({"_id": _VERSION_ID})
+        return doc["version"] if doc else None
+
+    def bump(self) -> str:
+        version = uuid.uuid4().hex
+        self._meta_collection.replace_one(
+            {"_id": _VERSION_ID},
+            {
+                "_id": _VERSION_ID,
+                "version": version,
+                "updated_at": datetime.now(timezone.utc),
+            },
+            upsert=True,
+        )
+        return version
+
+
+class FileVersionStore:
+    """
+    Version stored in a local text file.
+    """
+
+    def __init__(self, path: str):
+        self._path = Path(path)
+
+    def get(self) -> Optional[str]:
+        if not self._path.exists():
+            return None
+        return self._path.read_text(encoding="utf-8").strip()
+
+    def bump(self) -> str:
+        version = uuid.uuid4().hex
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(version, encoding="utf-8")
+        tmp_path.replace(self._path)
+        return version
+
+
+def get_version_store():
+    """
+    Returns the version store selected by KB_VERSION_BACKEND.
+
+    Raises:
+        ValueError: If the backend is unknown or Mongo settings are missing
+    """
+    if KB_VERSION_BACKEND == "file":
+        return FileVersionStore(KB_VERSION_PATH)
+
+    if KB_VERSION_BACKEND == "mongo":
+        if not COLLECTION_NAME:
+            raise ValueError("COLLECTION not found in environment variables")
+        if not DATABASE_NAME:
+            raise ValueError("DATABASE not found in environment variables")
+        db = get_mongodb_client()[DATABASE_NAME]
+        return MongoVersionStore(db[f"{COLLECTION_NAME}_meta"])
+
+    raise ValueError(
+        f"Invalid KB_VERSION_BACKEND '{KB_VERSION_BACKEND}' "
+        "(expected 'mongo' or 'file')"
+    )
+
+
+def get_knowledge_base_version() -> Optional[str]:
+    """
+    Returns the identifier of the current knowledge base contents
+    (None before the first ingestion).
+    """
+    return get_version_store().get()
+
+
+def bump_knowledge_base_version() -> str:
+    """
+    Records a new knowledge base version; called by ingestion after it
+    changed the stored chunks.
+    """
+    return get_version_store().bump()
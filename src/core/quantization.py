@@ -0,0 +1,127 @@
+"""
+Quantization Module - MentorIA Core
+Scalar (int8) and binary quantization of chunk embeddings for compact
+vector storage, and the full-precision rescoring that restores the float
+ranking of the candidates a quantized search returns.
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+from bson.binary import Binary, BinaryVectorDtype
+
+FLOAT = "float"
+INT8 = "int8"
+BINARY = "binary"
+STORAGE_MODES = (FLOAT, INT8, BINARY)
+
+# Float32 copy of each quantized embedding, read only to rescore candidates
+FULL_EMBEDDING_FIELD = "embedding_full"
+
+
+def check_storage_mode(mode: str) -> str:
+    """
+    Returns mode if it is a known storage mode.
+
+    Raises:
+        ValueError: If mode is not "float", "int8" or "binary"
+    """
+    if mode not in STORAGE_MODES:
+        raise ValueError(
+            f"Unknown EMBEDDING_STORAGE '{mode}'; expected one of "
+            f"{', '.join(STORAGE_MODES)}"
+        )
+    return mode
+
+
+def normalize_rows(vectors) -> np.ndarray:
+    """Returns the vectors as unit-length float32 rows (2-D)."""
+    rows = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(rows, axis=1, keepdims=True)
+    return rows / np.where(norms == 0, 1.0, norms)
+
+
+def quantize(vectors, mode: str) -> np.ndarray:
+    """
+    Quantizes float vectors row by row.
+
+    int8 scales each unit-normalized row so its largest component is 127:
+    cosine similarity ignores the per-row scale, so no codebook is needed.
+    binary keeps one sign bit per dimension, packed 8 per byte.
+
+    Args:
+        vectors: One vector or a 2-D batch
+        mode: "int8" or "binary"
+
+    Returns:
+        np.ndarray: int8 rows, or uint8 rows of packed bits
+    """
+    rows = normalize_rows(vectors)
+    if mode == INT8:
+        peaks = np.abs(rows).max(axis=1, keepdims=True)
+        scaled = rows * (127.0 / np.where(peaks == 0, 1.0, peaks))
+        return np.rint(scaled).astype(np.int8)
+    if mode == BINARY:
+        return np.packbits(rows > 0, axis=1)
+    raise ValueError(f"Cannot quantize to '{mode}'")
+
+
+def to_bson_vector(vector: np.ndarray, mode: str) -> Binary:
+    """
+    Encodes one vector as a BSON binary vector: float32, int8 or packed
+    bits, the compact types Atlas Vector Search indexes directly.
+    """
+    if mode == INT8:
+        return Binary.from_vector(vector, BinaryVectorDtype.INT8)
+    if mode == BINARY:
+        # pymongo rejects uint8 numpy arrays for packed bits; lists work
+        return Binary.from_vector(vector.tolist(), BinaryVectorDtype.PACKED_BIT, 0)
+    return Binary.from_vector(
+        np.asarray(vector, dtype=np.float32), BinaryVectorDtype.FLOAT32
+    )
+
+
+def decode_vector(value) -> np.ndarray:
+    """
+    Returns a stored float embedding (array of doubles or BSON float32
+    vector) as a float32 array.
+    """
+    if isinstance(value, Binary):
+        return value.as_vector(return_numpy=True).data.astype(np.float32, copy=False)
+    return np.asarray(value, dtype=np.float32)
+
+
+def hamming_distances(packed_rows: np.ndarray, packed_query: np.ndarray) -> np.ndarray:
+    """Hamming distance between each row of packed bits and the query."""
+    return np.bitwise_count(np.bitwise_xor(packed_rows, packed_query)).sum(
+        axis=1, dtype=np.int32
+    )
+
+
+def rescore(
+    query_embedding: Sequence[float],
+    candidates: List[Dict],
+    vectors,
+    k: int,
+) -> List[Dict]:
+    """
+    Ranks candidates by exact cosine similarity to the query and keeps the
+    best k, scored (1 + cosine) / 2 like float searches.
+
+    Args:
+        query_embedding: Float query vector
+        candidates: Chunks returned by the quantized search
+        vectors: Full-precision embedding of each candidate, same order
+        k: Number of results
+
+    Returns:
+        List[Dict]: The k best candidates with their exact 'score'
+    """
+    if not candidates:
+        return []
+    query = normalize_rows(query_embedding)[0]
+    similarities = normalize_rows(vectors) @ query
+    top = np.argsort(-similarities)[:k]
+    return [
+        {**candidates[i], "score": float((1.0 + similarities[i]) / 2.0)} for i in top
+    ]
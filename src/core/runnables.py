@@ -0,0 +1,123 @@
+"""
+Runnables Module - MentorIA Core
+Registry of model clients and chains that are built once and reused.
+"""
+
+import threading
+from typing import Callable, Hashable, Optional, Sequence
+
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.runnables import Runnable
+
+from src.config import LLM_MODEL_NAME, get_embedding_model, get_llm_model
+from src.core.graph.prompts import get_mentoria_prompt, get_summary_prompt
+
+
+class RunnableRegistry:
+    """
+    Thread-safe registry that builds each runnable once per key.
+
+    Model clients and composed chains are stateless with respect to a
+    conversation, so one instance per configuration can be shared by every
+    session and graph step.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._runnables: dict = {}
+
+    def get_or_create(self, key: Hashable, factory: Callable):
+        runnable = self._runnables.get(key)
+        if runnable is not None:
+            return runnable
+
+        with self._lock:
+            runnable = self._runnables.get(key)
+            if runnable is None:
+                runnable = factory()
+                self._runnables[key] = runnable
+            return runnable
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """
+        Drops cached runnables so the next lookup rebuilds them.
+
+        Args:
+            kind: Only drop entries of this kind (e.g. "agent_chain");
+                drops everything when omitted
+        """
+        with self._lock:
+            if kind is None:
+                self._runnables.clear()
+                return
+            for key in [k for k in self._runnables if k[0] == kind]:
+                del self._runnables[key]
+
+    def __len__(self) -> int:
+        return len(self._runnables)
+
+
+_registry = RunnableRegistry()
+
+
+def get_shared_embedding_model():
+    """
+    Returns the shared embedding model instance.
+    """
+    return _registry.get_or_create(("embedding_model",), get_embedding_model)
+
+
+def get_agent_chain(
+    tools: Sequence,
+    temperature: float = 0.3,
+    model_name: str = LLM_MODEL_NAME,
+) -> Runnable:
+    """
+    Returns the MentorIA prompt piped into the tool-bound LLM.
+
+    The chain is built on first use for each (model, temperature, tools)
+    combination and reused afterwards.
+
+    Args:
+        tools: Tools to bind to the LLM (an empty sequence binds none)
+        temperature: Temperature for the LLM (default: 0.3)
+        model_name: LLM model name (default: LLM_MODEL env)
+
+    Returns:
+        Runnable: prompt_template | llm (with tools bound)
+    """
+    tool_names = tuple(tool.name for tool in tools)
+    key = ("agent_chain", model_name, temperature, tool_names)
+
+    def build() -> Runnable:
+        llm = get_llm_model(temperature=temperature, model=model_name)
+        if tools:
+            llm = llm.bind_tools(list(tools))
+        return get_mentoria_prompt() | llm
+
+    return _registry.get_or_create(key, build)
+
+
+def get_summary_chain(model_name: str = LLM_MODEL_NAME) -> Runnable:
+    """
+    Returns the chain that folds older conversation turns into the running
+    summary (deterministic, no tools).
+    """
+    key = ("summary_chain", model_name)
+
+    def build() -> Runnable:
+        llm = get_llm_model(temperature=0.0, model=model_name)
+        return get_summary_prompt() | llm | StrOutputParser()
+
+    return _registry.get_or_create(key, build)
+
+
+def invalidate_runnables(kind: Optional[str] = None) -> None:
+    """
+    Clears cached runnables, e.g. after credentials or model config change.
+
+    Args:
+        kind: "agent_chain", "summary_chain" or "embedding_model"; clears
+            all when omitted
+    """
+    _registry.invalidate(kind)
@@ -0,0 +1,324 @@
+"""
+Semantic Cache Module - MentorIA Core
+Answer cache keyed by question embedding: a new question close enough to
+a previously answered one (for the same role) reuses the stored answer
+instead of running the graph.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.config import (
+    DEFAULT_USER_NAME,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_MIN_WORDS,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL_SECONDS,
+    SEMANTIC_CACHE_VERSION_CHECK_SECONDS,
+)
+from src.core.cache import normalize_text
+from src.core.kb_version import get_knowledge_base_version
+
+# Openings that make a question depend on the previous turns
+_REFERENTIAL_START = re.compile(
+    r"^(and|but|so|also|e|mas|então|entao|também|tambem|"
+    r"and what about|what about|e quanto|e sobre)\b"
+)
+_REFERENTIAL_WORDS = re.compile(
+    r"\b(that|this|it|those|these|above|isso|isto|aquilo|disso|nisso|"
+    r"acima|anterior)\b"
+)
+
+
+# Stands for the user's name in stored answers
+_NAME_PLACEHOLDER = "\x00user_name\x00"
+
+
+def _name_pattern(user_name: str) -> re.Pattern:
+    """Matches user_name as a whole word (not inside another word)."""
+    return re.compile(rf"(?<!\w){re.escape(user_name)}(?!\w)")
+
+
+def is_self_contained(question: str) -> bool:
+    """
+    Heuristic check that a question can be answered without the
+    conversation history, which is required to share answers across
+    sessions.
+    """
+    text = normalize_text(question)
+    if len(text.split()) < SEMANTIC_CACHE_MIN_WORDS:
+        return False
+    return not (_REFERENTIAL_START.match(text) or _REFERENTIAL_WORDS.search(text))
+
+
+@dataclass
+class CachedAnswer:
+    question: str
+    # Answer with the original user's name replaced by _NAME_PLACEHOLDER
+    answer: str
+    user_name: str
+    latency: float
+    created_at: float
+    similarity: float = 0.0
+
+    def personalized(self, user_name: str) -> str:
+        """
+        Returns the answer addressed to user_name instead of the user it was
+        originally generated for (DEFAULT_USER_NAME when user_name is empty,
+        never the original user's name).
+        """
+        return self.answer.replace(
+            _NAME_PLACEHOLDER, user_name.strip() or DEFAULT_USER_NAME
+        )
+
+
+class SemanticAnswerCache:
+    """
+    Thread-safe semantic cache of final answers, partitioned by user role.
+
+    Entries expire after ttl_seconds and the whole cache is dropped when the
+    knowledge base version changes (i.e. after a re-ingestion).
+
+    Args:
+        threshold: Minimum cosine similarity for a hit
+        max_entries: Entries kept per role (oldest evicted first)
+        ttl_seconds: Entry lifetime
+        version_provider: Returns the current knowledge base version
+        version_check_seconds: How often the version is re-checked
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = SEMANTIC_CACHE_TTL_SECONDS,
+        version_provider: Optional[Callable[[], Optional[str]]] = None,
+        version_check_seconds: float = SEMANTIC_CACHE_VERSION_CHECK_SECONDS,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version_provider = version_provider
+        self.version_check_seconds = version_check_seconds
+        self._lock = threading.Lock()
+        self._vectors: Dict[str, List[np.ndarray]] = {}
+        self._entries: Dict[str, List[CachedAnswer]] = {}
+        self._matrices: Dict[str, np.ndarray] = {}
+        self._version: Optional[str] = None
+        self._version_checked_at = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._saved_latency = 0.0
+
+    @staticmethod
+    def _role_key(user_role: str) -> str:
+        return normalize_text(user_role or "")
+
+    def _version_due(self) -> bool:
+        """
+        True if the knowledge base version should be re-read now; claims
+        the check so concurrent callers do not all read it.
+        """
+        if self.version_provider is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._version_checked_at < self.version_check_seconds:
+                return False
+            self._version_checked_at = now
+            return True
+
+    def _read_version(self) -> None:
+        # Blocking I/O (MongoDB or the manifest file): never under the lock
+        try:
+            version = self.version_provider()
+        except Exception as e:
+            print(f"Warning: could not read knowledge base version: {e}")
+            return
+        with self._lock:
+            if version != self._version:
+                if self._version is not None:
+                    self._invalidations += 1
+                self._version = version
+                self._vectors.clear()
+                self._entries.clear()
+                self._matrices.clear()
+
+    def refresh_version(self) -> None:
+        """
+        Re-reads the knowledge base version when due, dropping every entry
+        if it changed.
+        """
+        if self._version_due():
+            self._read_version()
+
+    async def arefresh_version(self) -> None:
+        """
+        Async variant of refresh_version; the read runs in a worker thread.
+        """
+        if self._version_due():
+            await asyncio.to_thread(self._read_version)
+
+    def _evict_expired(self, role: str) -> None:
+        cutoff = time.time() - self.ttl_seconds
+        entries = self._entries.get(role, [])
+        first_valid = next(
+            (i for i, entry in enumerate(entries) if entry.created_at >= cutoff),
+            len(entries),
+        )
+        if first_valid:
+            del entries[:first_valid]
+            del self._vectors[role][:first_valid]
+            self._matrices.pop(role, None)
+
+    def lookup(
+        self, question_embedding: List[float], user_role: str
+    ) -> Optional[CachedAnswer]:
+        """
+        Returns the most similar cached answer above the threshold.
+        """
+        self.refresh_version()
+        return self._search(question_embedding, user_role)
+
+    async def alookup(
+        self, question_embedding: List[float], user_role: str
+    ) -> Optional[CachedAnswer]:
+        """
+        Async variant of lookup that keeps the version read off the loop.
+        """
+        await self.arefresh_version()
+        return self._search(question_embedding, user_role)
+
+    def _search(
+        self, question_embedding: List[float], user_role: str
+    ) -> Optional[CachedAnswer]:
+        role = self._role_key(user_role)
+        query = np.asarray(question_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm:
+            query = query / norm
+
+        with self._lock:
+            self._evict_expired(role)
+            entries = self._entries.get(role)
+            if not entries:
+                self._misses += 1
+                return None
+
+            matrix = self._matrices.get(role)
+            if matrix is None:
+                matrix = np.vstack(self._vectors[role])
+                self._matrices[role] = matrix
+
+            similarities = matrix @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self._misses += 1
+                return None
+
+            entry = entries[best]
+            self._hits += 1
+            self._saved_latency += entry.latency
+            return CachedAnswer(
+                question=entry.question,
+                answer=entry.answer,
+                user_name=entry.user_name,
+                latency=entry.latency,
+                created_at=entry.created_at,
+                similarity=float(similarities[best]),
+            )
+
+    def store(
+        self,
+        question_embedding: List[float],
+        user_role: str,
+        question: str,
+        answer: str,
+        user_name: str = "",
+        latency: float = 0.0,
+    ) -> None:
+        """
+        Adds an answer to the cache for the given role. Occurrences of
+        user_name in the answer are stored as a placeholder, filled in for
+        each user by CachedAnswer.personalized.
+        """
+        role = self._role_key(user_role)
+        vector = np.asarray(question_embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector = vector / norm
+        if user_name:
+            answer = _name_pattern(user_name).sub(_NAME_PLACEHOLDER, answer)
+
+        with self._lock:
+            vectors = self._vectors.setdefault(role, [])
+            entries = self._entries.setdefault(role, [])
+            vectors.append(vector)
+            entries.append(
+                CachedAnswer(
+                    question=question,
+                    answer=answer,
+                    user_name=user_name,
+                    latency=latency,
+                    created_at=time.time(),
+                )
+            )
+            if len(entries) > self.max_entries:
+                del entries[0]
+                del vectors[0]
+            self._matrices.pop(role, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors.clear()
+            self._entries.clear()
+            self._matrices.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns hit rate, saved latency and size counters.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": sum(len(e) for e in self._entries.values()),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "saved_latency_seconds": self._saved_latency,
+                "invalidations": self._invalidations,
+                "knowledge_base_version": self._version,
+            }
+
+
+_semantic_cache: Optional[SemanticAnswerCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> SemanticAnswerCache:
+    """
+    Returns the process-wide semantic answer cache.
+    """
+    global _semantic_cache
+    if _semantic_cache is None:
+        with _cache_lock:
+            if _semantic_cache is None:
+                _semantic_cache = SemanticAnswerCache(
+                    version_provider=get_knowledge_base_version
+                )
+    return _semantic_cache
+
+
+def peek_semantic_cache() -> Optional[SemanticAnswerCache]:
+    """
+    Returns the process-wide semantic answer cache if it was already
+    created, without creating it.
+    """
+    return _semantic_cache
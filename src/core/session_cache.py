@@ -0,0 +1,70 @@
+"""
+Session Cache Module - MentorIA Core
+Keeps a per-UI-session copy of the conversation so reruns of the
+interface do not read the whole history back from the checkpointer.
+"""
+
+from typing import List, MutableMapping
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from src.core.graph.graph_builder import initialize_conversation
+
+
+class ConversationSessionCache:
+    """
+    Conversation history cached in a UI session store (e.g.
+    st.session_state).
+
+    The history is loaded from the checkpointer once per conversation,
+    together with the welcome-message initialization, and then kept up to
+    date locally from the streamed answers. It is reloaded only when the
+    conversation changes or the cache is invalidated.
+
+    Args:
+        store: Mutable mapping that survives UI reruns
+    """
+
+    CONVERSATION_KEY = "conversation_id"
+    LOADED_KEY = "history_loaded"
+    MESSAGES_KEY = "messages"
+
+    def __init__(self, store: MutableMapping):
+        self._store = store
+
+    @property
+    def conversation_id(self) -> str:
+        return self._store[self.CONVERSATION_KEY]
+
+    def start(self, conversation_id: str) -> None:
+        """
+        Switches to a conversation, forcing its history to be loaded.
+        """
+        self._store[self.CONVERSATION_KEY] = conversation_id
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._store[self.LOADED_KEY] = False
+        self._store[self.MESSAGES_KEY] = []
+
+    def history(self, user_name: str) -> List[BaseMessage]:
+        """
+        Returns the conversation history, initializing the conversation and
+        reading the checkpointer only on a cache miss.
+        """
+        if not self._store.get(self.LOADED_KEY):
+            self._store[self.MESSAGES_KEY] = initialize_conversation(
+                self.conversation_id, user_name
+            )
+            self._store[self.LOADED_KEY] = True
+        return self._store[self.MESSAGES_KEY]
+
+    def append_exchange(self, question: str, answer: str) -> None:
+        """
+        Records a completed exchange locally, mirroring what the graph
+        appended to the checkpoint.
+        """
+        self._store[self.MESSAGES_KEY] = self._store.get(self.MESSAGES_KEY, []) + [
+            HumanMessage(content=question),
+            AIMessage(content=answer),
+        ]
@@ -0,0 +1,148 @@
+"""
+Single-Flight Module - MentorIA Core
+Coalesces concurrent identical calls: the first caller runs the work and
+every caller arriving while it is in flight (or shortly after it
+finished) gets the same result. Works across threads and asyncio tasks.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+
+class SingleFlight:
+    """
+    Per-key request coalescing.
+
+    Args:
+        grace_seconds: How long a successful result keeps being shared
+            after completion; 0 shares only with in-flight callers.
+            Failures are never shared after completion.
+    """
+
+    def __init__(self, grace_seconds: float = 0.0):
+        self.grace_seconds = grace_seconds
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Tuple[Future, Optional[float]]] = {}
+        self._executions = 0
+        self._coalesced = 0
+        self._grace_hits = 0
+        # Shared async calls in flight, referenced until done
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _join_or_lead(self, key: Hashable) -> Tuple[Future, bool]:
+        """
+        Returns the shared future for key and whether the caller must run
+        the work (leader).
+        """
+        now = time.monotonic()
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                future, finished_at = call
+                if finished_at is None:
+                    self._coalesced += 1
+                    return future, False
+                if now - finished_at < self.grace_seconds:
+                    self._grace_hits += 1
+                    return future, False
+            future = Future()
+            self._calls[key] = (future, None)
+            self._executions += 1
+            self._prune(now)
+            return future, True
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            key
+            for key, (_, finished_at) in self._calls.items()
+            if finished_at is not None and now - finished_at >= self.grace_seconds
+        ]
+        for key in expired:
+            del self._calls[key]
+
+    def _finish(self, key: Hashable, future: Future, error: bool) -> None:
+        with self._lock:
+            if self._calls.get(key, (None,))[0] is not future:
+                return
+            if error or self.grace_seconds <= 0:
+                del self._calls[key]
+            else:
+                self._calls[key] = (future, time.monotonic())
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Runs fn() unless an identical call is in flight, in which case its
+        result (or exception) is returned instead.
+
+        Must not be called from an event loop thread while an async caller
+        of the same key is in flight on that loop (it would block it).
+        """
+        future, leader = self._join_or_lead(key)
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            self._finish(key, future, error=True)
+            raise
+        future.set_result(result)
+        self._finish(key, future, error=False)
+        return result
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async variant of do; coalesces with both async and threaded
+        callers of the same key.
+
+        The leader runs fn in a detached task, so cancelling any caller
+        (the leader included, e.g. by its own timeout) never cancels the
+        shared call for the others.
+        """
+        future, leader = self._join_or_lead(key)
+        if not leader:
+            return await asyncio.shield(asyncio.wrap_future(future))
+
+        task = asyncio.ensure_future(self._arun(key, future, fn))
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return await asyncio.shield(task)
+
+    async def _arun(
+        self, key: Hashable, future: Future, fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        try:
+            result = await fn()
+        except BaseException as e:
+            # Also covers cancellation, so followers never wait forever
+            future.set_exception(e)
+            self._finish(key, future, error=True)
+            raise
+        future.set_result(result)
+        self._finish(key, future, error=False)
+        return result
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        # Retrieved so an error nobody awaits any more is not logged as lost
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """
+        Returns executed calls and calls served by another caller's work.
+        """
+        with self._lock:
+            requests = self._executions + self._coalesced + self._grace_hits
+            saved = self._coalesced + self._grace_hits
+            return {
+                "requests": requests,
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "grace_hits": self._grace_hits,
+                "coalesced_rate": saved / requests if requests else 0.0,
+            }
@@ -0,0 +1,509 @@
+"""
+Telemetry Module - MentorIA Core
+Per-node timing, token and cost-driver metrics. Durations and counts are
+kept in in-process Prometheus-style histograms and counters (rendered by
+render_metrics for the /metrics endpoint); with TELEMETRY_JSON_LOGS every
+span is also written as one JSON line tagged with its session and node.
+
+Metric labels never include the session id (unbounded cardinality); the
+JSON logs carry it.
+"""
+
+import json
+import math
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables.config import ensure_config
+
+from src.config import TELEMETRY_JSON_LOGS
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_PREFIX = "mentoria_"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with a fixed set of label names."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = _PREFIX + name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labels)
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}_total{_label_text(self.labels, key)} {value:g}"
+            for key, value in values
+        ]
+
+
+class Histogram(Counter):
+    """Cumulative-bucket histogram with a fixed set of label names."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # Per-bucket counts (plus +Inf), then count and sum
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            else:
+                series[0][-1] += 1
+            series[1] += 1
+            series[2] += value
+
+    def snapshot(self, **labels) -> Optional[dict]:
+        """Returns count, sum and mean of one label combination."""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            if series is None:
+                return None
+            return {
+                "count": series[1],
+                "sum": series[2],
+                "mean": series[2] / series[1] if series[1] else 0.0,
+            }
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted(
+                (k, [list(v[0]), v[1], v[2]]) for k, v in self._series.items()
+            )
+        lines = []
+        for key, (counts, count, total) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else f"{bound:g}"
+                labels = _label_text(self.labels, key, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_count{_label_text(self.labels, key)} {count}")
+            lines.append(f"{self.name}_sum{_label_text(self.labels, key)} {total:g}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds the process metrics plus collectors: callables returning the
+    stats dicts other modules already keep (caches, router, ...), exported
+    as gauges.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Counter] = {}
+        self._collectors: Dict[str, Callable[[], Optional[dict]]] = {}
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labels=()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labels)
+
+    def histogram(
+        self, name: str, documentation: str, labels=(), buckets=LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labels, buckets)
+
+    def register_collector(
+        self, component: str, collect: Callable[[], Optional[dict]]
+    ) -> None:
+        with self._lock:
+            self._collectors[component] = collect
+
+    def collect_stats(self) -> Dict[str, dict]:
+        """
+        Returns every collector's current stats (failures and components
+        not created yet are skipped).
+        """
+        with self._lock:
+            collectors = dict(self._collectors)
+        stats = {}
+        for component, collect in collectors.items():
+            try:
+                component_stats = collect()
+            except Exception as e:
+                print(f"Warning: {component} stats unavailable: {e}", file=sys.stderr)
+                continue
+            if component_stats is not None:
+                stats[component] = component_stats
+        return stats
+
+    def render(self) -> str:
+        """Renders everything in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for component, stats in sorted(self.collect_stats().items()):
+            lines.extend(_gauge_lines(_PREFIX + component, stats))
+        return "\n".join(lines) + "\n"
+
+
+def _gauge_lines(prefix: str, stats: dict) -> List[str]:
+    """
+    Flattens a stats dict into gauges; a nested dict keyed by category
+    (e.g. by_policy) becomes <prefix>_policy_<stat>{policy="..."}.
+    """
+    families: Dict[str, List[str]] = {}
+    for key, value in sorted(stats.items()):
+        if _is_number(value):
+            families.setdefault(f"{prefix}_{key}", []).append(
+                f"{prefix}_{key} {value:g}"
+            )
+        elif isinstance(value, dict) and key.startswith("by_"):
+            label = key[3:]
+            for category, sub_stats in sorted(value.items()):
+                for sub_key, sub_value in sorted((sub_stats or {}).items()):
+                    if _is_number(sub_value):
+                        name = f"{prefix}_{label}_{sub_key}"
+                        families.setdefault(name, []).append(
+                            f'{name}{{{label}="{_escape(category)}"}} {sub_value:g}'
+                        )
+    lines = []
+    for name, samples in families.items():
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(samples)
+    return lines
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+registry = MetricsRegistry()
+
+NODE_SECONDS = registry.histogram(
+    "node_duration_seconds", "Graph node duration", ("node", "status")
+)
+REQUEST_SECONDS = registry.histogram(
+    "graph_run_duration_seconds", "Full graph run duration per answer", ("status",)
+)
+LLM_SECONDS = registry.histogram(
+    "llm_duration_seconds", "LLM call duration", ("node", "model", "status")
+)
+LLM_TOKENS = registry.counter(
+    "llm_tokens", "LLM tokens by node and kind (prompt, completion)", ("node", "kind")
+)
+TOOL_SECONDS = registry.histogram(
+    "tool_duration_seconds", "Tool call duration", ("node", "tool", "status")
+)
+EMBEDDING_SECONDS = registry.histogram(
+    "embedding_duration_seconds",
+    "Embedding model call duration",
+    ("node", "kind", "status"),
+)
+VECTOR_SEARCH_SECONDS = registry.histogram(
+    "vector_search_duration_seconds",
+    "Vector search duration",
+    ("node", "backend", "status"),
+)
+CHECKPOINT_SECONDS = registry.histogram(
+    "checkpoint_duration_seconds",
+    "Checkpointer read/write duration",
+    ("operation", "status"),
+)
+AGENT_LLM_CALLS = registry.histogram(
+    "agent_llm_calls_per_answer",
+    "LLM calls (tool-loop iterations) per answered turn",
+    ("policy",),
+    buckets=(1, 2, 3, 4, 5, 8),
+)
+
+
+def run_context() -> dict:
+    """
+    Session and node of the graph run the caller executes in, taken from
+    the current runnable config ({} outside a graph run).
+    """
+    metadata = ensure_config().get("metadata") or {}
+    context = {}
+    if metadata.get("thread_id"):
+        context["session"] = metadata["thread_id"]
+    if metadata.get("langgraph_node"):
+        context["node"] = metadata["langgraph_node"]
+    return context
+
+
+def log_event(event: str, **fields) -> None:
+    """Writes one structured JSON log line when TELEMETRY_JSON_LOGS is on."""
+    if not TELEMETRY_JSON_LOGS:
+        return
+    record = {"ts": round(time.time(), 6), "event": event, **fields}
+    print(json.dumps(record, default=str, ensure_ascii=False), file=sys.stderr)
+
+
+def _record_span(
+    name: str,
+    histogram: Histogram,
+    seconds: float,
+    status: str,
+    labels: dict,
+    **log_fields,
+) -> None:
+    histogram.observe(seconds, status=status, **labels)
+    log_event(
+        "span",
+        span=name,
+        duration_ms=round(seconds * 1e3, 3),
+        status=status,
+        **labels,
+        **log_fields,
+    )
+
+
+@contextmanager
+def span(name: str, histogram: Histogram, **labels):
+    """
+    Times the enclosed block into histogram (status ok/error) and logs it.
+    The current session and node are added from the runnable config.
+    """
+    context = run_context()
+    labels = {"node": context.get("node", "none"), **labels}
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        seconds = time.perf_counter() - started
+        _record_span(
+            name, histogram, seconds, status, labels, session=context.get("session")
+        )
+
+
+def record_agent_iterations(policy: str, llm_calls: int) -> None:
+    AGENT_LLM_CALLS.observe(llm_calls, policy=policy)
+    log_event("answer", policy=policy, llm_calls=llm_calls, **run_context())
+
+
+def _token_usage(response) -> Tuple[int, int]:
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                return usage.get("input_tokens", 0), usage.get("output_tokens", 0)
+    return 0, 0
+
+
+class TelemetryCallbackHandler(BaseCallbackHandler):
+    """
+    Times graph runs, nodes, LLM calls and tool calls from LangChain
+    callbacks, and counts LLM tokens. Attached to every graph run.
+    """
+
+    # Bookkeeping only: run inline instead of in an executor for async runs
+    run_inline = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._runs: Dict[UUID, tuple] = {}
+
+    def _kind_of(self, run_id: Optional[UUID]) -> Optional[str]:
+        with self._lock:
+            run = self._runs.get(run_id)
+        return run[0] if run else None
+
+    def _start(self, run_id: UUID, kind: str, name: str, metadata: Optional[dict]):
+        metadata = metadata or {}
+        tags = {
+            "session": metadata.get("thread_id"),
+            "node": metadata.get("langgraph_node"),
+        }
+        with self._lock:
+            self._runs[run_id] = (kind, name, tags, time.perf_counter())
+
+    def _finish(self, run_id: UUID, status: str, response=None) -> None:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        kind, name, tags, started = run
+        seconds = time.perf_counter() - started
+        session, node = tags["session"], tags["node"] or "none"
+        log_tags = {"session": session, "node": node}
+
+        if kind == "graph":
+            _record_span(name, REQUEST_SECONDS, seconds, status, {}, session=session)
+        elif kind == "node":
+            _record_span(
+                name, NODE_SECONDS, seconds, status, {"node": node}, session=session
+            )
+        elif kind == "tool":
+            TOOL_SECONDS.observe(seconds, node=node, tool=name, status=status)
+            log_event(
+                "span",
+                span="tool",
+                tool=name,
+                duration_ms=round(seconds * 1e3, 3),
+                status=status,
+                **log_tags,
+            )
+        elif kind == "llm":
+            LLM_SECONDS.observe(seconds, node=node, model=name, status=status)
+            prompt, completion = _token_usage(response) if response else (0, 0)
+            LLM_TOKENS.inc(prompt, node=node, kind="prompt")
+            LLM_TOKENS.inc(completion, node=node, kind="completion")
+            log_event(
+                "span",
+                span="llm",
+                model=name,
+                duration_ms=round(seconds * 1e3, 3),
+                status=status,
+                prompt_tokens=prompt,
+                completion_tokens=completion,
+                **log_tags,
+            )
+
+    def on_chain_start(
+        self,
+        serialized,
+        inputs,
+        *,
+        run_id,
+        parent_run_id=None,
+        tags=None,
+        metadata=None,
+        **kwargs,
+    ):
+        name = kwargs.get("name")
+        if parent_run_id is None:
+            self._start(run_id, "graph", "graph_run", metadata)
+        elif (
+            name
+            and name == (metadata or {}).get("langgraph_node")
+            and any(tag.startswith("graph:step:") for tag in tags or ())
+            # A node calling a runnable of the same name (tools -> ToolNode)
+            and self._kind_of(parent_run_id) != "node"
+        ):
+            self._start(run_id, "node", name, metadata)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._finish(run_id, "ok")
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id, "error")
+
+    def on_chat_model_start(
+        self, serialized, messages, *, run_id, metadata=None, **kwargs
+    ):
+        model = (metadata or {}).get("ls_model_name") or "unknown"
+        self._start(run_id, "llm", model, metadata)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._finish(run_id, "ok", response)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id, "error")
+
+    def on_tool_start(
+        self,
+        serialized,
+        input_str,
+        *,
+        run_id,
+        parent_run_id=None,
+        metadata=None,
+        **kwargs,
+    ):
+        if self._kind_of(parent_run_id) == "tool":
+            # A wrapped tool (e.g. behind the result cache) is part of its wrapper
+            return
+        name = kwargs.get("name") or (serialized or {}).get("name") or "unknown"
+        self._start(run_id, "tool", name, metadata)
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        self._finish(run_id, "ok")
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id, "error")
+
+
+telemetry_handler = TelemetryCallbackHandler()
+
+
+def register_collector(component: str, collect: Callable[[], Optional[dict]]) -> None:
+    """
+    Exports a module's stats() dict as mentoria_<component>_* gauges.
+    collect runs on every scrape: it must not build its component or do
+    I/O, and returns None while the component does not exist yet.
+    """
+    registry.register_collector(component, collect)
+
+
+def render_metrics() -> str:
+    """Returns all metrics in the Prometheus text exposition format."""
+    return registry.render()
@@ -0,0 +1,163 @@
+"""
+Tool Cache Module - MentorIA Core
+Caches the results of search tools (Tavily) so identical searches from
+different sessions skip the remote call.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from langchain_core.tools import BaseTool
+from pydantic import ConfigDict, PrivateAttr
+
+from src.config import (
+    WEB_SEARCH_CACHE_BACKEND,
+    WEB_SEARCH_CACHE_COLLECTION,
+    WEB_SEARCH_CACHE_PATH,
+    WEB_SEARCH_CACHE_SIZE,
+    WEB_SEARCH_CACHE_TTL_SECONDS,
+)
+from src.core.cache import TTLCache, build_cache_store, normalize_text
+
+
+class CachedTool(BaseTool):
+    """
+    Read-through cache in front of another tool.
+
+    Exposes the wrapped tool's name, description and argument schema, so
+    ToolNode and bind_tools see the same tool. Keys combine the tool name,
+    the normalized query and the remaining arguments; error results are
+    never cached.
+
+    Args:
+        tool: Tool whose results are cached
+        cache: Cache shared by every instance of the tool
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    tool: BaseTool
+    cache: TTLCache
+    remote_calls: int = 0
+    remote_seconds: float = 0.0
+    # ToolNode runs parallel tool calls in threads
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(self, tool: BaseTool, cache: TTLCache, **kwargs: Any):
+        super().__init__(
+            tool=tool,
+            cache=cache,
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            handle_tool_error=tool.handle_tool_error,
+            **kwargs,
+        )
+
+    def cache_key(self, arguments: Dict[str, Any]) -> str:
+        normalized = {
+            name: normalize_text(value) if isinstance(value, str) else value
+            for name, value in arguments.items()
+        }
+        payload = json.dumps(normalized, sort_keys=True, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{self.name}:{digest}"
+
+    @staticmethod
+    def _cacheable(result: Any) -> bool:
+        if isinstance(result, dict) and "error" in result:
+            return False
+        return result is not None
+
+    def _record_call(self, started_at: float) -> None:
+        seconds = time.perf_counter() - started_at
+        with self._lock:
+            self.remote_calls += 1
+            self.remote_seconds += seconds
+
+    def _run(self, run_manager=None, **kwargs: Any) -> Any:
+        # Unset optional arguments are left to the wrapped tool's defaults
+        kwargs = {name: value for name, value in kwargs.items() if value is not None}
+        key = self.cache_key(kwargs)
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+
+        started_at = time.perf_counter()
+        callbacks = run_manager.get_child() if run_manager else None
+        result = self.tool.invoke(kwargs, config={"callbacks": callbacks})
+        self._record_call(started_at)
+        if self._cacheable(result):
+            self.cache.set(key, result)
+        return result
+
+    async def _arun(self, run_manager=None, **kwargs: Any) -> Any:
+        kwargs = {name: value for name, value in kwargs.items() if value is not None}
+        key = self.cache_key(kwargs)
+        if self.cache.store is None:
+            result = self.cache.get(key)
+        else:
+            result = await asyncio.to_thread(self.cache.get, key)
+        if result is not None:
+            return result
+
+        started_at = time.perf_counter()
+        callbacks = run_manager.get_child() if run_manager else None
+        result = await self.tool.ainvoke(kwargs, config={"callbacks": callbacks})
+        self._record_call(started_at)
+        if self._cacheable(result):
+            if self.cache.store is None:
+                self.cache.set(key, result)
+            else:
+                await asyncio.to_thread(self.cache.set, key, result)
+        return result
+
+    def stats(self) -> dict:
+        """
+        Returns cache counters plus remote call count and the estimated
+        latency saved by hits (hits x mean remote call time).
+        """
+        stats = self.cache.stats()
+        with self._lock:
+            calls, seconds = self.remote_calls, self.remote_seconds
+        mean_call = seconds / calls if calls else 0.0
+        stats["remote_calls"] = calls
+        stats["saved_latency_seconds"] = stats["hits"] * mean_call
+        return stats
+
+
+_web_search_cache: Optional[TTLCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_web_search_cache() -> TTLCache:
+    """
+    Returns the process-wide web search result cache configured from the
+    WEB_SEARCH_CACHE_* environment variables.
+    """
+    global _web_search_cache
+    if _web_search_cache is None:
+        with _cache_lock:
+            if _web_search_cache is None:
+                _web_search_cache = TTLCache(
+                    max_size=WEB_SEARCH_CACHE_SIZE,
+                    ttl_seconds=WEB_SEARCH_CACHE_TTL_SECONDS,
+                    store=build_cache_store(
+                        WEB_SEARCH_CACHE_BACKEND,
+                        WEB_SEARCH_CACHE_PATH,
+                        WEB_SEARCH_CACHE_COLLECTION,
+                        "WEB_SEARCH_CACHE_BACKEND",
+                    ),
+                )
+    return _web_search_cache
+
+
+def cached_search_tool(tool: BaseTool) -> CachedTool:
+    """
+    Wraps a search tool with the shared web search result cache.
+    """
+    return CachedTool(tool, get_web_search_cache())
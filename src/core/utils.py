@@ -21,6 +21,14 @@ def format_context(context_chunks: list[str]) -> str:
     return "\n\n".join(context_chunks)
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token count estimate (~4 characters per token), good enough for
+    prompt budgeting without a tokenizer round-trip.
+    """
+    return (len(text) + 3) // 4
+
+
 def extract_response_text(response) -> str:
     """
     Robustly extracts text from LLM responses.
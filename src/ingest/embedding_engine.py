@@ -0,0 +1,155 @@
+"""
+Embedding Engine Module - MentorIA Ingest
+Generates embeddings in batches over a bounded thread pool, with
+token-bucket rate limiting and per-batch retries.
+"""
+
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from src.core.telemetry import EMBEDDING_SECONDS, span
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how many requests start per second.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum burst size (default: 1)
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Blocks until the requested number of tokens is available.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class EmbeddingEngine:
+    """
+    Embeds texts in fixed-size batches processed concurrently.
+
+    Each batch is retried with exponential backoff, so a transient API
+    error only delays that batch instead of failing the whole corpus.
+
+    Args:
+        embeddings_model: Model exposing embed_documents(texts)
+        batch_size: Texts per embed_documents call (default: 100)
+        concurrency: Maximum batches in flight (default: 4)
+        requests_per_minute: Rate limit for batch requests; 0 disables it
+        max_retries: Retries per batch after the first attempt (default: 5)
+        backoff_base: Initial backoff in seconds (default: 1.0)
+        backoff_max: Maximum backoff in seconds (default: 60.0)
+        progress: Print progress after each batch (default: True)
+    """
+
+    def __init__(
+        self,
+        embeddings_model,
+        batch_size: int = 100,
+        concurrency: int = 4,
+        requests_per_minute: float = 0,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        progress: bool = True,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.embeddings_model = embeddings_model
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.progress = progress
+        self.rate_limiter: Optional[TokenBucket] = (
+            TokenBucket(rate=requests_per_minute / 60.0, capacity=concurrency)
+            if requests_per_minute
+            else None
+        )
+        self._progress_lock = threading.Lock()
+        self._done = 0
+
+    def _embed_batch(self, index: int, texts: List[str]) -> List[List[float]]:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                with span("embedding", EMBEDDING_SECONDS, kind="documents"):
+                    return self.embeddings_model.embed_documents(texts)
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise RuntimeError(
+                        f"Embedding batch {index} failed after "
+                        f"{attempt + 1} attempts: {e}"
+                    ) from e
+                delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+                delay *= random.uniform(0.5, 1.0)
+                print(
+                    f"Batch {index} failed ({e}); retrying in {delay:.1f}s",
+                    file=sys.stderr,
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    def _report(self, total: int, batch_len: int) -> None:
+        with self._progress_lock:
+            self._done += batch_len
+            if self.progress:
+                print(f"Embedded {self._done}/{total} chunks")
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embeds all texts, preserving input order.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List[List[float]]: One vector per input text
+        """
+        batches = [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        self._done = 0
+
+        def run(index: int) -> List[List[float]]:
+            vectors = self._embed_batch(index, batches[index])
+            self._report(len(texts), len(batches[index]))
+            return vectors
+
+        vectors: List[List[float]] = []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for batch_vectors in executor.map(run, range(len(batches))):
+                vectors.extend(batch_vectors)
+
+        return vectors
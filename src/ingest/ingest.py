@@ -5,46 +5,286 @@ Orchestrates the complete document ingestion process.
 
 import argparse
 import sys
+from pathlib import Path
+from typing import List, Tuple
 
-from src.ingest.loaders import load_documents
-from src.ingest.processing import split_documents, generate_embeddings
-from src.ingest.storage import store_in_mongodb
+from src.config import (
+    EMBED_BATCH_SIZE,
+    EMBED_CONCURRENCY,
+    EMBED_MAX_RETRIES,
+    EMBED_REQUESTS_PER_MINUTE,
+    LOADER_PAGES_PER_TASK,
+    LOADER_WORKERS,
+    LOCAL_INDEX_PATH,
+    RETRIEVAL_BACKEND,
+    get_embedding_model,
+)
+from src.core.graph.vector_index import build_local_index
+from src.core.kb_version import bump_knowledge_base_version
+from src.ingest.embedding_engine import EmbeddingEngine
+from src.ingest.loaders import iter_loaded_files, list_document_files
+from src.ingest.manifest import (
+    assign_chunk_ids,
+    file_hash,
+    get_manifest_store,
+    ingest_settings,
+)
+from src.ingest.pipeline import ChangedFile, peak_rss_mb, run_streaming_pipeline
+from src.ingest.processing import (
+    generate_embeddings,
+    get_text_splitter,
+    split_documents,
+)
+from src.ingest.storage import (
+    delete_chunks,
+    delete_legacy_chunks,
+    find_existing_chunk_ids,
+    get_chunk_collection,
+    store_in_mongodb,
+)
+
+
+def find_changed_files(
+    documents_path: str,
+    recorded: dict,
+    settings: dict,
+    full_refresh: bool = False,
+    recursive: bool = False,
+) -> Tuple[List[ChangedFile], List[str], int]:
+    """
+    Compares the files in documents_path with the manifest. A file is
+    unchanged only if its content hash and its ingestion settings both
+    match the recorded entry.
+
+    Args:
+        documents_path: Path to the directory containing documents
+        recorded: Manifest entries by source key
+        settings: Current ingestion settings (see ingest_settings)
+        full_refresh: Treat every file as changed
+        recursive: Also scan subdirectories
+
+    Returns:
+        Tuple: (new or changed files, source keys of deleted files,
+            number of files in the directory)
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+        ValueError: If no documents are found
+    """
+    root = Path(documents_path)
+    files = list_document_files(documents_path, recursive=recursive)
+    if not files:
+        raise ValueError(f"No documents found in {documents_path}")
+
+    changed = []
+    current_keys = set()
+    for file_path in files:
+        source_key = file_path.relative_to(root).as_posix()
+        current_keys.add(source_key)
+        content_hash = file_hash(file_path)
+        previous_entry = recorded.get(source_key, {})
+
+        if (
+            not full_refresh
+            and previous_entry.get("file_hash") == content_hash
+            and previous_entry.get("settings") == settings
+        ):
+            continue
+
+        changed.append(
+            ChangedFile(
+                path=file_path,
+                source_key=source_key,
+                file_hash=content_hash,
+                settings=settings,
+                previous_chunk_ids=previous_entry.get("chunk_ids", []),
+            )
+        )
+
+    deleted = sorted(set(recorded) - current_keys)
+    return changed, deleted, len(files)
+
+
+def ingest_file(
+    changed_file: ChangedFile,
+    documents: List,
+    collection,
+    manifest,
+    chunk_size: int = 1000,
+    chunk_overlap: int = 200,
+    embed_batch_size: int = EMBED_BATCH_SIZE,
+    embed_concurrency: int = EMBED_CONCURRENCY,
+    embed_requests_per_minute: float = EMBED_REQUESTS_PER_MINUTE,
+    full_refresh: bool = False,
+):
+    """
+    Splits, embeds and stores the loaded documents of one new or changed
+    file, then removes its stale chunks and records it in the manifest.
+    """
+    chunks = split_documents(
+        documents, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+    )
+    assign_chunk_ids(
+        chunks, changed_file.source_key, changed_file.settings["embedding_model"]
+    )
+    chunk_ids = [chunk.metadata["chunk_id"] for chunk in chunks]
+
+    # Only embed chunks that are not stored yet
+    existing = set() if full_refresh else find_existing_chunk_ids(collection, chunk_ids)
+    new_chunks = [c for c in chunks if c.metadata["chunk_id"] not in existing]
+    if new_chunks:
+        generate_embeddings(
+            new_chunks,
+            batch_size=embed_batch_size,
+            concurrency=embed_concurrency,
+            requests_per_minute=embed_requests_per_minute,
+        )
+        store_in_mongodb(new_chunks, collection=collection)
+
+    stale_ids = set(changed_file.previous_chunk_ids) - set(chunk_ids)
+    removed = delete_chunks(collection, list(stale_ids))
+    manifest.save_entry(
+        changed_file.source_key,
+        changed_file.file_hash,
+        chunk_ids,
+        changed_file.settings,
+    )
+    print(
+        f"{changed_file.source_key}: {len(new_chunks)} new, "
+        f"{len(chunks) - len(new_chunks)} unchanged, {removed} removed chunks"
+    )
 
 
 def ingest_documents(
     documents_path: str,
     chunk_size: int = 1000,
     chunk_overlap: int = 200,
+    embed_batch_size: int = EMBED_BATCH_SIZE,
+    embed_concurrency: int = EMBED_CONCURRENCY,
+    embed_requests_per_minute: float = EMBED_REQUESTS_PER_MINUTE,
+    full_refresh: bool = False,
+    stream: bool = False,
+    workers: int = LOADER_WORKERS,
+    recursive: bool = False,
+    pages_per_task: int = LOADER_PAGES_PER_TASK,
+    build_index: bool = RETRIEVAL_BACKEND == "local",
 ):
     """
     Main ingestion function that can be called externally.
 
+    Ingestion is incremental: files whose content hash and settings (chunk
+    size, overlap, embedding model) match the manifest are skipped, only
+    chunks whose deterministic id is not stored yet are embedded, and
+    chunks of changed or deleted files that no longer exist are removed.
+    The first run (empty manifest) and full refreshes also remove chunks
+    stored before ingestion was incremental.
+
     Args:
         documents_path: Path to the directory containing documents
         chunk_size: Chunk size in characters (default: 1000)
         chunk_overlap: Overlap between chunks in characters (default: 200)
-        database_name: Database name (optional, uses DATABASE env)
-        collection_name: Collection name (optional, uses COLLECTION env)
+        embed_batch_size: Chunks per embedding request
+        embed_concurrency: Maximum concurrent embedding requests
+        embed_requests_per_minute: Embedding request rate limit (0 = none)
+        full_refresh: Ignore the manifest and re-embed every chunk
+        stream: Run loader, splitter, embedder and writer as a streaming
+            pipeline of bounded batches instead of stage by stage
+        workers: Processes used to parse files (0 = one per CPU core);
+            streaming mode loads page by page in a single process
+        recursive: Also ingest documents in subdirectories
+        pages_per_task: Split PDFs larger than this into page ranges
+            parsed in parallel (0 = never split)
+        build_index: Rebuild the local vector index from the collection
+            afterwards (default: when RETRIEVAL_BACKEND is "local")
 
     Raises:
         ValueError: If credentials or settings are not defined
         FileNotFoundError: If the document directory does not exist
     """
+    manifest = get_manifest_store()
+    recorded = manifest.load()
+    settings = ingest_settings(chunk_size, chunk_overlap)
+    changed, deleted, total_files = find_changed_files(
+        documents_path, recorded, settings, full_refresh, recursive
+    )
+    collection = get_chunk_collection()
 
-    # Load documents
-    documents = load_documents(documents_path)
-
-    # Split into chunks
-    chunks = split_documents(
-        documents, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+    print(
+        f"{total_files - len(changed)} of {total_files} files unchanged "
+        "since last ingestion"
     )
 
-    # Generate embeddings
-    chunks_with_embeddings = generate_embeddings(chunks)
+    if stream:
+        engine = EmbeddingEngine(
+            get_embedding_model(),
+            batch_size=embed_batch_size,
+            concurrency=embed_concurrency,
+            requests_per_minute=embed_requests_per_minute,
+            max_retries=EMBED_MAX_RETRIES,
+            progress=False,
+        )
+        totals, _ = run_streaming_pipeline(
+            changed,
+            get_text_splitter(chunk_size, chunk_overlap),
+            engine,
+            collection,
+            manifest,
+            full_refresh=full_refresh,
+        )
+        print(
+            f"{totals['files']} files streamed: {totals['embedded']} of "
+            f"{totals['chunks']} chunks embedded, {totals['removed']} removed"
+        )
+        ingested = totals["files"]
+
+    else:
+        ingested = 0
+        loaded = iter_loaded_files(
+            [changed_file.path for changed_file in changed], workers, pages_per_task
+        )
+        for changed_file, (_, documents, error) in zip(changed, loaded):
+            if error:
+                print(
+                    f"Error loading {changed_file.path.name}: {error}",
+                    file=sys.stderr,
+                )
+                continue
+            print(f"Loaded: {changed_file.path.name} ({len(documents)} pages)")
+            ingest_file(
+                changed_file,
+                documents,
+                collection,
+                manifest,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                embed_batch_size=embed_batch_size,
+                embed_concurrency=embed_concurrency,
+                embed_requests_per_minute=embed_requests_per_minute,
+                full_refresh=full_refresh,
+            )
+            ingested += 1
+
+    # Remove chunks of files that disappeared from the directory
+    for source_key in deleted:
+        removed = delete_chunks(collection, recorded[source_key].get("chunk_ids", []))
+        manifest.remove_entry(source_key)
+        print(f"{source_key}: deleted, {removed} chunks removed")
 
-    # Store in MongoDB
-    store_in_mongodb(chunks_with_embeddings)
+    # Chunks from before the manifest have no entry to be removed through
+    legacy = 0
+    if full_refresh or not recorded:
+        legacy = delete_legacy_chunks(collection)
+        if legacy:
+            print(f"{legacy} chunks from before incremental ingestion removed")
 
+    # Files that failed to load keep their previous chunks
+    if ingested or deleted or legacy:
+        bump_knowledge_base_version()
+
+    if build_index:
+        build_local_index(collection, LOCAL_INDEX_PATH)
+
+    print(f"Peak RSS: {peak_rss_mb():.0f} MB")
     print("Ingestion completed successfully!")
 
 
@@ -73,6 +313,62 @@ def main():
         default=200,
         help="Overlap between chunks in characters (default: 200)",
     )
+    parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=EMBED_BATCH_SIZE,
+        help=f"Chunks per embedding request (default: {EMBED_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--embed-concurrency",
+        type=int,
+        default=EMBED_CONCURRENCY,
+        help=f"Concurrent embedding requests (default: {EMBED_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--embed-rpm",
+        type=float,
+        default=EMBED_REQUESTS_PER_MINUTE,
+        help="Embedding requests per minute, 0 for unlimited "
+        f"(default: {EMBED_REQUESTS_PER_MINUTE:g})",
+    )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Ignore the ingestion manifest and re-embed every chunk",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream loader -> splitter -> embedder -> writer in bounded "
+        "batches to keep memory flat",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=LOADER_WORKERS,
+        help="Processes used to parse documents, 0 for one per CPU core "
+        f"(default: {LOADER_WORKERS})",
+    )
+    parser.add_argument(
+        "--pages-per-task",
+        type=int,
+        default=LOADER_PAGES_PER_TASK,
+        help="Split PDFs with more pages than this into ranges parsed in "
+        f"parallel, 0 to never split (default: {LOADER_PAGES_PER_TASK})",
+    )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Also ingest documents in subdirectories",
+    )
+    parser.add_argument(
+        "--build-local-index",
+        action="store_true",
+        default=RETRIEVAL_BACKEND == "local",
+        help="Rebuild the local vector index after ingestion "
+        "(default: on when RETRIEVAL_BACKEND=local)",
+    )
     parser.add_argument(
         "--database",
         type=str,
@@ -93,6 +389,15 @@ def main():
             documents_path=args.documents_path,
             chunk_size=args.chunk_size,
             chunk_overlap=args.chunk_overlap,
+            embed_batch_size=args.embed_batch_size,
+            embed_concurrency=args.embed_concurrency,
+            embed_requests_per_minute=args.embed_rpm,
+            full_refresh=args.full_refresh,
+            stream=args.stream,
+            workers=args.workers,
+            recursive=args.recursive,
+            pages_per_task=args.pages_per_task,
+            build_index=args.build_local_index,
         )
     except Exception as e:
         print(f"Error during ingestion: {e}", file=sys.stderr)
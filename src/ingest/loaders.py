@@ -3,11 +3,85 @@ Document Loading Module - MentorIA Ingest
 Responsible for loading documents of different formats (PDF, TXT).
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+import os
 import sys
 
 from langchain_community.document_loaders import PyPDFLoader, TextLoader
+from langchain_core.documents import Document
+from pypdf import PdfReader
+
+SUPPORTED_EXTENSIONS = (".pdf", ".txt")
+
+
+def list_document_files(documents_path: str, recursive: bool = False) -> List[Path]:
+    """
+    Lists the supported document files in a directory.
+
+    Args:
+        documents_path: Path to the directory containing documents
+        recursive: Also scan subdirectories (default: False)
+
+    Returns:
+        List[Path]: PDF files followed by TXT files, each sorted by path
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    path = Path(documents_path)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Directory not found: {documents_path}")
+
+    pattern = "**/*{}" if recursive else "*{}"
+    files = []
+    for extension in SUPPORTED_EXTENSIONS:
+        files.extend(sorted(path.glob(pattern.format(extension))))
+    return files
+
+
+def _read_file(file_path: Path) -> List:
+    if file_path.suffix.lower() == ".pdf":
+        return PyPDFLoader(str(file_path)).load()
+    return TextLoader(str(file_path), encoding="utf-8").load()
+
+
+def load_file(file_path: Path) -> List:
+    """
+    Loads a single PDF or TXT file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        List: Loaded documents (one per page for PDFs)
+    """
+    docs = _read_file(file_path)
+    if file_path.suffix.lower() == ".pdf":
+        print(f"Loaded: {file_path.name} ({len(docs)} pages)")
+    else:
+        print(f"Loaded: {file_path.name}")
+    return docs
+
+
+def iter_file_pages(file_path: Path) -> Iterator:
+    """
+    Lazily yields the documents of a single PDF or TXT file, one page at a
+    time for PDFs, without materializing the whole file.
+
+    Args:
+        file_path: Path to the file
+
+    Yields:
+        Document: Loaded page (or the whole text file)
+    """
+    if file_path.suffix.lower() == ".pdf":
+        loader = PyPDFLoader(str(file_path))
+    else:
+        loader = TextLoader(str(file_path), encoding="utf-8")
+    yield from loader.lazy_load()
 
 
 def load_documents(documents_path: str) -> List:
@@ -25,32 +99,159 @@ def load_documents(documents_path: str) -> List:
         ValueError: If no documents are found
     """
     documents = []
-    path = Path(documents_path)
-
-    if not path.exists():
-        raise FileNotFoundError(f"Directory not found: {documents_path}")
 
-    # Process PDF files
-    pdf_files = list(path.glob("*.pdf"))
-    for pdf_file in pdf_files:
+    for file_path in list_document_files(documents_path):
         try:
-            loader = PyPDFLoader(str(pdf_file))
-            docs = loader.load()
-            documents.extend(docs)
-            print(f"Loaded: {pdf_file.name} ({len(docs)} pages)")
+            documents.extend(load_file(file_path))
         except Exception as e:
-            print(f"Error loading {pdf_file.name}: {e}", file=sys.stderr)
+            print(f"Error loading {file_path.name}: {e}", file=sys.stderr)
 
-    # Process TXT files
-    txt_files = list(path.glob("*.txt"))
-    for txt_file in txt_files:
-        try:
-            loader = TextLoader(str(txt_file), encoding="utf-8")
-            docs = loader.load()
-            documents.extend(docs)
-            print(f"Loaded: {txt_file.name}")
-        except Exception as e:
-            print(f"Error loading {txt_file.name}: {e}", file=sys.stderr)
+    if not documents:
+        raise ValueError(f"No documents found in {documents_path}")
+
+    return documents
+
+
+def _load_pdf_pages(file_path: str, start: int, end: int) -> List:
+    """
+    Extracts pages [start, end) of a PDF with the same text extraction and
+    core metadata as PyPDFLoader.
+    """
+    reader = PdfReader(file_path)
+    total_pages = len(reader.pages)
+    documents = []
+    for page_number in range(start, min(end, total_pages)):
+        documents.append(
+            Document(
+                page_content=reader.pages[page_number].extract_text(),
+                metadata={
+                    "source": file_path,
+                    "total_pages": total_pages,
+                    "page": page_number,
+                    "page_label": reader.page_labels[page_number],
+                },
+            )
+        )
+    return documents
+
+
+def _run_load_task(task: Tuple[str, Optional[int], Optional[int]]):
+    """
+    Process pool entry point. Returns (documents, error) so one failing
+    file never aborts the other tasks.
+    """
+    file_path, start, end = task
+    try:
+        if start is None:
+            return _read_file(Path(file_path)), None
+        return _load_pdf_pages(file_path, start, end), None
+    except Exception as e:
+        return [], str(e)
+
+
+def _plan_tasks(
+    file_paths: List[Path], pages_per_task: int
+) -> List[Tuple[str, Optional[int], Optional[int]]]:
+    """
+    Builds one task per file, or one per page range for PDFs with more
+    than pages_per_task pages.
+    """
+    tasks = []
+    for file_path in file_paths:
+        page_count = 0
+        if pages_per_task and file_path.suffix.lower() == ".pdf":
+            try:
+                page_count = len(PdfReader(str(file_path)).pages)
+            except Exception:
+                page_count = 0
+        if page_count > pages_per_task:
+            for start in range(0, page_count, pages_per_task):
+                tasks.append((str(file_path), start, start + pages_per_task))
+        else:
+            tasks.append((str(file_path), None, None))
+    return tasks
+
+
+def iter_loaded_files(
+    file_paths: List[Path],
+    workers: int = 0,
+    pages_per_task: int = 0,
+) -> Iterator[Tuple[Path, List, Optional[str]]]:
+    """
+    Parses files across a process pool, yielding results in input order.
+
+    Args:
+        file_paths: Files to load
+        workers: Worker processes (default: 0, one per CPU core);
+            1 loads sequentially in this process
+        pages_per_task: Split PDFs with more pages than this into page
+            ranges parsed in parallel (default: 0, never split)
+
+    Yields:
+        Tuple[Path, List, Optional[str]]: (file, documents, error); a file
+            that failed in any of its ranges yields no documents
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = _plan_tasks(file_paths, pages_per_task)
+    if not tasks:
+        return
+
+    if workers == 1 or len(tasks) <= 1:
+        results = map(_run_load_task, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(tasks)))
+        results = executor.map(_run_load_task, tasks)
+
+    try:
+        current_path, documents, error = None, [], None
+        for (file_path, _, _), (task_documents, task_error) in zip(tasks, results):
+            if file_path != current_path:
+                if current_path is not None:
+                    yield Path(current_path), [] if error else documents, error
+                current_path, documents, error = file_path, [], None
+            documents.extend(task_documents)
+            error = error or task_error
+        if current_path is not None:
+            yield Path(current_path), [] if error else documents, error
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def load_documents_parallel(
+    documents_path: str,
+    workers: int = 0,
+    recursive: bool = False,
+    pages_per_task: int = 0,
+) -> List:
+    """
+    Loads documents from a directory using a process pool.
+
+    Args:
+        documents_path: Path to the directory containing documents
+        workers: Worker processes (default: 0, one per CPU core)
+        recursive: Also scan subdirectories (default: False)
+        pages_per_task: Page-range size for splitting large PDFs
+            (default: 0, never split)
+
+    Returns:
+        List: Loaded documents, in deterministic file and page order
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+        ValueError: If no documents are found
+    """
+    documents = []
+    file_paths = list_document_files(documents_path, recursive=recursive)
+
+    loaded = iter_loaded_files(file_paths, workers, pages_per_task)
+    for file_path, docs, error in loaded:
+        if error:
+            print(f"Error loading {file_path.name}: {error}", file=sys.stderr)
+            continue
+        documents.extend(docs)
+        print(f"Loaded: {file_path.name} ({len(docs)} pages)")
 
     if not documents:
         raise ValueError(f"No documents found in {documents_path}")
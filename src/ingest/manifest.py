@@ -0,0 +1,186 @@
+"""
+Manifest Module - MentorIA Ingest
+Tracks content hashes of ingested files, the settings they were ingested
+with and the ids of their chunks so re-ingestion only processes what
+changed.
+"""
+
+import hashlib
+import json
+import os
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+from pymongo.collection import Collection
+
+from src.config import (
+    EMBEDDING_MODEL_NAME,
+    INGEST_MANIFEST_BACKEND,
+    INGEST_MANIFEST_PATH,
+    get_mongodb_client,
+)
+
+DATABASE_NAME = os.getenv("DATABASE")
+COLLECTION_NAME = os.getenv("COLLECTION")
+
+
+def file_hash(file_path: Path) -> str:
+    """
+    Returns the SHA-256 hex digest of a file's contents.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def ingest_settings(
+    chunk_size: int, chunk_overlap: int, embedding_model: str = EMBEDDING_MODEL_NAME
+) -> Dict:
+    """
+    Returns the settings that shape a file's stored chunks. They are
+    recorded with each manifest entry; a file ingested under different
+    settings is ingested again even if its content did not change.
+    """
+    return {
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "embedding_model": embedding_model,
+    }
+
+
+def assign_chunk_ids(
+    chunks: List, source_key: str, embedding_model: str = EMBEDDING_MODEL_NAME
+) -> List:
+    """
+    Stores a deterministic 'chunk_id' in each chunk's metadata.
+
+    The id is derived from the source file, the page, the chunk text and
+    the embedding model, so unchanged chunks keep their id when a file is
+    edited elsewhere, while switching models re-embeds every chunk.
+    Identical texts on the same page are told apart by occurrence.
+
+    Args:
+        chunks: Chunks produced from a single file
+        source_key: Stable identifier of the file (path relative to the
+            documents directory)
+        embedding_model: Model whose vectors will be stored for the chunks
+
+    Returns:
+        List: The same chunks, with metadata['chunk_id'] set
+    """
+    return list(iter_assign_chunk_ids(chunks, source_key, embedding_model))
+
+
+def iter_assign_chunk_ids(
+    chunks: Iterable, source_key: str, embedding_model: str = EMBEDDING_MODEL_NAME
+) -> Iterator:
+    """
+    Lazy variant of assign_chunk_ids for streaming ingestion.
+    Must see every chunk of the file, in order, to produce the same ids.
+    """
+    occurrences: Dict[tuple, int] = defaultdict(int)
+    for chunk in chunks:
+        page = chunk.metadata.get("page", "")
+        text_hash = hashlib.sha256(chunk.page_content.encode("utf-8")).hexdigest()
+        occurrence = occurrences[(page, text_hash)]
+        occurrences[(page, text_hash)] += 1
+
+        raw_id = f"{source_key}\0{page}\0{text_hash}\0{occurrence}\0{embedding_model}"
+        chunk.metadata["chunk_id"] = hashlib.sha256(raw_id.encode("utf-8")).hexdigest()
+        yield chunk
+
+
+class MongoManifestStore:
+    """
+    Manifest stored as one document per source file in MongoDB.
+    """
+
+    def __init__(self, collection: Collection):
+        self._collection = collection
+
+    def load(self) -> Dict[str, dict]:
+        return {doc["_id"]: doc for doc in self._collection.find({})}
+
+    def save_entry(
+        self, source_key: str, file_hash: str, chunk_ids: List[str], settings: Dict
+    ):
+        self._collection.replace_one(
+            {"_id": source_key},
+            {
+                "_id": source_key,
+                "file_hash": file_hash,
+                "chunk_ids": chunk_ids,
+                "settings": settings,
+                "updated_at": datetime.now(timezone.utc),
+            },
+            upsert=True,
+        )
+
+    def remove_entry(self, source_key: str):
+        self._collection.delete_one({"_id": source_key})
+
+
+class FileManifestStore:
+    """
+    Manifest stored as a local JSON file.
+    """
+
+    def __init__(self, path: str):
+        self._path = Path(path)
+        self._entries: Dict[str, dict] = {}
+        if self._path.exists():
+            self._entries = json.loads(self._path.read_text(encoding="utf-8"))
+
+    def _flush(self):
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._entries, indent=2), encoding="utf-8")
+        tmp_path.replace(self._path)
+
+    def load(self) -> Dict[str, dict]:
+        return dict(self._entries)
+
+    def save_entry(
+        self, source_key: str, file_hash: str, chunk_ids: List[str], settings: Dict
+    ):
+        self._entries[source_key] = {
+            "file_hash": file_hash,
+            "chunk_ids": chunk_ids,
+            "settings": settings,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._flush()
+
+    def remove_entry(self, source_key: str):
+        if self._entries.pop(source_key, None) is not None:
+            self._flush()
+
+
+def get_manifest_store():
+    """
+    Returns the manifest store selected by INGEST_MANIFEST_BACKEND.
+
+    Raises:
+        ValueError: If the backend is unknown or Mongo settings are missing
+    """
+    if INGEST_MANIFEST_BACKEND == "file":
+        return FileManifestStore(INGEST_MANIFEST_PATH)
+
+    if INGEST_MANIFEST_BACKEND == "mongo":
+        if not COLLECTION_NAME:
+            raise ValueError("COLLECTION not found in environment variables")
+        if not DATABASE_NAME:
+            raise ValueError("DATABASE not found in environment variables")
+        client = get_mongodb_client()
+        db = client[DATABASE_NAME]
+        return MongoManifestStore(db[f"{COLLECTION_NAME}_manifest"])
+
+    raise ValueError(
+        f"Invalid INGEST_MANIFEST_BACKEND '{INGEST_MANIFEST_BACKEND}' "
+        "(expected 'mongo' or 'file')"
+    )
+
@@ -0,0 +1,238 @@
+"""
+Streaming Pipeline Module - MentorIA Ingest
+Connects loader -> splitter -> embedder -> writer as generator stages
+exchanging bounded batches, so memory stays flat regardless of corpus
+size and writes start before loading finishes.
+"""
+
+import queue
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from src.ingest.embedding_engine import EmbeddingEngine
+from src.ingest.loaders import iter_file_pages
+from src.ingest.manifest import iter_assign_chunk_ids
+from src.ingest.storage import delete_chunks, find_existing_chunk_ids, store_in_mongodb
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class ChangedFile:
+    """A new or modified source file that must be (re)ingested."""
+
+    path: Path
+    source_key: str
+    file_hash: str
+    settings: Dict
+    previous_chunk_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FileCompleted:
+    """Marker emitted after the last chunk of a file has been produced."""
+
+    changed_file: ChangedFile
+    chunk_ids: List[str]
+
+
+@dataclass
+class Batch:
+    """Chunks travelling together, plus files fully contained so far."""
+
+    chunks: List
+    completed: List[FileCompleted]
+    total_chunks: int = 0
+
+
+_END = object()
+
+
+def peak_rss_mb() -> float:
+    """
+    Returns the peak resident set size of this process in MB
+    (0.0 when the platform does not expose it).
+    """
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def iter_file_chunks(
+    changed_files: Iterable[ChangedFile], text_splitter
+) -> Iterator:
+    """
+    Loader + splitter stage: yields chunks page by page, followed by a
+    FileCompleted marker for each file. Failing files are skipped.
+    """
+    for changed_file in changed_files:
+        chunk_ids = []
+        try:
+            pages = iter_file_pages(changed_file.path)
+            chunks = (
+                chunk
+                for page in pages
+                for chunk in text_splitter.split_documents([page])
+            )
+            chunks = iter_assign_chunk_ids(
+                chunks,
+                changed_file.source_key,
+                changed_file.settings["embedding_model"],
+            )
+            for chunk in chunks:
+                chunk_ids.append(chunk.metadata["chunk_id"])
+                yield chunk
+        except Exception as e:
+            print(f"Error loading {changed_file.path.name}: {e}", file=sys.stderr)
+            continue
+        print(f"Loaded: {changed_file.path.name} ({len(chunk_ids)} chunks)")
+        yield FileCompleted(changed_file, chunk_ids)
+
+
+def iter_batches(items: Iterable, batch_size: int) -> Iterator[Batch]:
+    """
+    Groups chunks into batches of at most batch_size. FileCompleted markers
+    ride along with the batch in which they arrive, so a file is only
+    committed once all of its chunks have been written.
+    """
+    chunks: List = []
+    completed: List[FileCompleted] = []
+    for item in items:
+        if isinstance(item, FileCompleted):
+            completed.append(item)
+            continue
+        chunks.append(item)
+        if len(chunks) >= batch_size:
+            yield Batch(chunks, completed, len(chunks))
+            chunks, completed = [], []
+    if chunks or completed:
+        yield Batch(chunks, completed, len(chunks))
+
+
+def prefetch(items: Iterable, max_pending: int) -> Iterator:
+    """
+    Runs the upstream iterator in a background thread, keeping at most
+    max_pending items buffered, so loading overlaps embedding and writing.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+                buffer.put(item)
+        except BaseException as e:
+            buffer.put(e)
+            return
+        buffer.put(_END)
+
+    worker = threading.Thread(target=produce, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # Unblock the producer if it is waiting on a full buffer
+        while not buffer.empty():
+            buffer.get_nowait()
+
+
+def embed_batches(
+    batches: Iterable[Batch],
+    engine: EmbeddingEngine,
+    collection,
+    full_refresh: bool = False,
+) -> Iterator[Batch]:
+    """
+    Embedder stage: drops chunks that are already stored (unless
+    full_refresh) and embeds the rest of each batch.
+    """
+    for batch in batches:
+        chunks = batch.chunks
+        if chunks and not full_refresh:
+            existing = find_existing_chunk_ids(
+                collection, [c.metadata["chunk_id"] for c in chunks]
+            )
+            chunks = [c for c in chunks if c.metadata["chunk_id"] not in existing]
+        if chunks:
+            vectors = engine.embed([c.page_content for c in chunks])
+            for chunk, vector in zip(chunks, vectors):
+                chunk.metadata["embedding"] = vector
+        yield Batch(chunks, batch.completed, batch.total_chunks)
+
+
+def write_batches(batches: Iterable[Batch], collection, manifest) -> Dict[str, int]:
+    """
+    Writer stage: upserts each batch, then removes stale chunks and updates
+    the manifest for files completed by that batch.
+
+    Returns:
+        Dict[str, int]: Counters of processed, embedded and removed chunks
+    """
+    totals = {"chunks": 0, "embedded": 0, "removed": 0, "files": 0}
+    for batch in batches:
+        if batch.chunks:
+            store_in_mongodb(batch.chunks, collection=collection)
+        totals["chunks"] += batch.total_chunks
+        totals["embedded"] += len(batch.chunks)
+
+        for done in batch.completed:
+            changed_file = done.changed_file
+            stale_ids = set(changed_file.previous_chunk_ids) - set(done.chunk_ids)
+            totals["removed"] += delete_chunks(collection, list(stale_ids))
+            manifest.save_entry(
+                changed_file.source_key,
+                changed_file.file_hash,
+                done.chunk_ids,
+                changed_file.settings,
+            )
+            totals["files"] += 1
+
+        print(
+            f"Written {totals['chunks']} chunks "
+            f"({totals['embedded']} embedded), peak RSS {peak_rss_mb():.0f} MB"
+        )
+    return totals
+
+
+def run_streaming_pipeline(
+    changed_files: List[ChangedFile],
+    text_splitter,
+    engine: EmbeddingEngine,
+    collection,
+    manifest,
+    full_refresh: bool = False,
+    prefetch_batches: int = 2,
+) -> Tuple[Dict[str, int], float]:
+    """
+    Runs loader -> splitter -> embedder -> writer over the changed files.
+
+    Each batch holds batch_size * concurrency chunks, so one batch keeps
+    every embedding worker busy while at most prefetch_batches further
+    batches are buffered.
+
+    Returns:
+        Tuple[Dict[str, int], float]: Stage counters and peak RSS in MB
+    """
+    batch_size = engine.batch_size * engine.concurrency
+    items = iter_file_chunks(changed_files, text_splitter)
+    batches = prefetch(iter_batches(items, batch_size), prefetch_batches)
+    embedded = embed_batches(batches, engine, collection, full_refresh)
+    totals = write_batches(embedded, collection, manifest)
+    return totals, peak_rss_mb()
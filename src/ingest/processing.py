@@ -6,7 +6,34 @@ Responsible for splitting documents into chunks and generating embeddings.
 from typing import List
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from src.config import get_embedding_model
+from src.config import (
+    EMBED_BATCH_SIZE,
+    EMBED_CONCURRENCY,
+    EMBED_MAX_RETRIES,
+    EMBED_REQUESTS_PER_MINUTE,
+    get_embedding_model,
+)
+from src.ingest.embedding_engine import EmbeddingEngine
+
+
+def get_text_splitter(
+    chunk_size: int = 1000, chunk_overlap: int = 200
+) -> RecursiveCharacterTextSplitter:
+    """
+    Creates the text splitter used for ingestion.
+
+    Args:
+        chunk_size: Chunk size in characters
+        chunk_overlap: Overlap between chunks in characters
+
+    Returns:
+        RecursiveCharacterTextSplitter: Configured splitter
+    """
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=len,
+    )
 
 
 def split_documents(
@@ -23,11 +50,7 @@ def split_documents(
     Returns:
         List: List of document chunks
     """
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        length_function=len,
-    )
+    text_splitter = get_text_splitter(chunk_size, chunk_overlap)
 
     chunks = text_splitter.split_documents(documents)
     print(f"Documents split into {len(chunks)} chunks")
@@ -35,22 +58,39 @@ def split_documents(
     return chunks
 
 
-def generate_embeddings(chunks: List) -> List:
+def generate_embeddings(
+    chunks: List,
+    batch_size: int = EMBED_BATCH_SIZE,
+    concurrency: int = EMBED_CONCURRENCY,
+    requests_per_minute: float = EMBED_REQUESTS_PER_MINUTE,
+) -> List:
     """
     Generates embeddings for each chunk using Google Gemini.
 
     Args:
         chunks: List of document chunks
-        google_api_key: Google API key
+        batch_size: Chunks per embedding request (default: EMBED_BATCH_SIZE)
+        concurrency: Maximum concurrent requests (default: EMBED_CONCURRENCY)
+        requests_per_minute: Request rate limit, 0 for unlimited
+            (default: EMBED_REQUESTS_PER_MINUTE)
 
     Returns:
         List: List of chunks with generated embeddings
     """
-    embeddings_model = get_embedding_model()
+    engine = EmbeddingEngine(
+        get_embedding_model(),
+        batch_size=batch_size,
+        concurrency=concurrency,
+        requests_per_minute=requests_per_minute,
+        max_retries=EMBED_MAX_RETRIES,
+    )
 
-    print("Generating embeddings...")
+    print(
+        f"Generating embeddings (batch size {batch_size}, "
+        f"concurrency {concurrency})..."
+    )
     texts = [chunk.page_content for chunk in chunks]
-    embedding_vectors = embeddings_model.embed_documents(texts)
+    embedding_vectors = engine.embed(texts)
 
     # Add embeddings to chunk metadata
     for i, chunk in enumerate(chunks):
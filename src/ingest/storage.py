@@ -4,12 +4,20 @@ Responsible for MongoDB Atlas operations, including collection creation
 and vector search indexes.
 """
 
-from typing import List
+from typing import List, Optional, Set
 import os
-from pymongo import MongoClient
+from pymongo import MongoClient, ReplaceOne
 from pymongo.collection import Collection
 from pymongo.database import Database
-from src.config import get_mongodb_client
+from src.config import EMBEDDING_STORAGE, get_mongodb_client
+from src.core.quantization import (
+    BINARY,
+    FLOAT,
+    FULL_EMBEDDING_FIELD,
+    check_storage_mode,
+    quantize,
+    to_bson_vector,
+)
 
 DATABASE_NAME = os.getenv("DATABASE")
 COLLECTION_NAME = os.getenv("COLLECTION")
@@ -20,6 +28,7 @@ def ensure_collection(
     database_name: str,
     collection_name: str,
     embedding_dimensions: int = 768,
+    storage: str = EMBEDDING_STORAGE,
 ) -> Collection:
     """
     Ensures that the collection and vector search index exist.
@@ -29,6 +38,7 @@ def ensure_collection(
         database_name: Database name
         collection_name: Collection name
         embedding_dimensions: Embedding dimensions (default: 768)
+        storage: Embedding storage mode the index must match
 
     Returns:
         Collection: Ensured MongoDB collection
@@ -67,7 +77,11 @@ def ensure_collection(
             print("  - Field: embedding")
             print("  - Type: vector")
             print(f"  - Dimensions: {embedding_dimensions}")
-            print("  - Similarity: cosine")
+            if storage == BINARY:
+                # Atlas compares packed-bit vectors by Hamming distance
+                print("  - Similarity: euclidean (binary vectors)")
+            else:
+                print(f"  - Similarity: cosine ({storage} vectors)")
             print(
                 "\nThe system will continue, but vector searches may not "
                 "work until the index is created."
@@ -82,44 +96,122 @@ def ensure_collection(
     return collection
 
 
-def store_in_mongodb(
-    chunks: List,
-):
+def get_chunk_collection() -> Collection:
     """
-    Stores chunks with embeddings in MongoDB Atlas.
+    Returns the chunk collection configured by DATABASE/COLLECTION,
+    ensuring it exists.
 
-    Args:
-        chunks: List of chunks with embeddings
-        mongodb_connection_string: MongoDB connection string
-        database_name: Database name
-        collection_name: Collection name
+    Raises:
+        ValueError: If DATABASE or COLLECTION are not defined
     """
-    client = get_mongodb_client()
-
     if not COLLECTION_NAME:
         raise ValueError("COLLECTION not found in environment variables")
 
     if not DATABASE_NAME:
         raise ValueError("DATABASE not found in environment variables")
 
-    collection = ensure_collection(client, DATABASE_NAME, COLLECTION_NAME)
-
-    # Prepare documents for insertion
-    documents_to_insert = []
-    for chunk in chunks:
-        doc = {
-            "text": chunk.page_content,
-            "embedding": chunk.metadata.get("embedding"),
-            "metadata": {k: v for k, v in chunk.metadata.items() if k != "embedding"},
-            "source": chunk.metadata.get("source", "unknown"),
-        }
-        documents_to_insert.append(doc)
-
-    # Insert documents
-    if documents_to_insert:
-        result = collection.insert_many(documents_to_insert)
+    return ensure_collection(get_mongodb_client(), DATABASE_NAME, COLLECTION_NAME)
+
+
+def chunk_to_document(chunk, storage: str = EMBEDDING_STORAGE) -> dict:
+    """
+    Converts a chunk with embedding into the stored MongoDB document.
+    Chunks with a 'chunk_id' use it as the document _id.
+
+    In the quantized storage modes 'embedding' holds the int8 or binary
+    vector the search index reads, and 'embedding_full' a float32 copy
+    used to rescore the search candidates.
+    """
+    embedding = chunk.metadata.get("embedding")
+    doc = {
+        "text": chunk.page_content,
+        "embedding": embedding,
+        "metadata": {k: v for k, v in chunk.metadata.items() if k != "embedding"},
+        "source": chunk.metadata.get("source", "unknown"),
+    }
+    if storage != FLOAT and embedding is not None:
+        doc["embedding"] = to_bson_vector(quantize(embedding, storage)[0], storage)
+        doc[FULL_EMBEDDING_FIELD] = to_bson_vector(embedding, FLOAT)
+    if "chunk_id" in chunk.metadata:
+        doc["_id"] = chunk.metadata["chunk_id"]
+    return doc
+
+
+def find_existing_chunk_ids(collection: Collection, chunk_ids: List[str]) -> Set[str]:
+    """
+    Returns which of the given chunk ids are already stored.
+    """
+    existing = set()
+    for i in range(0, len(chunk_ids), 1000):
+        batch = chunk_ids[i : i + 1000]
+        existing.update(
+            doc["_id"] for doc in collection.find({"_id": {"$in": batch}}, {"_id": 1})
+        )
+    return existing
+
+
+def delete_chunks(collection: Collection, chunk_ids: List[str]) -> int:
+    """
+    Deletes stored chunks by id.
+
+    Returns:
+        int: Number of deleted documents
+    """
+    if not chunk_ids:
+        return 0
+    result = collection.delete_many({"_id": {"$in": list(chunk_ids)}})
+    return result.deleted_count
+
+
+def delete_legacy_chunks(collection: Collection) -> int:
+    """
+    Deletes chunks stored before ingestion was incremental. They carry a
+    driver-generated ObjectId _id instead of a chunk id and belong to no
+    manifest entry, so no later run would ever remove them.
+
+    Returns:
+        int: Number of deleted documents
+    """
+    result = collection.delete_many({"_id": {"$not": {"$type": "string"}}})
+    return result.deleted_count
+
+
+def store_in_mongodb(
+    chunks: List,
+    collection: Optional[Collection] = None,
+    storage: str = EMBEDDING_STORAGE,
+):
+    """
+    Stores chunks with embeddings in MongoDB Atlas.
+
+    Chunks carrying a deterministic 'chunk_id' are upserted, so storing the
+    same chunk twice never duplicates it; chunks without one are inserted.
+
+    Args:
+        chunks: List of chunks with embeddings
+        collection: Target collection (default: DATABASE/COLLECTION env)
+        storage: "float", "int8" or "binary" (default: EMBEDDING_STORAGE env)
+    """
+    check_storage_mode(storage)
+    if collection is None:
+        collection = get_chunk_collection()
+
+    documents = [chunk_to_document(chunk, storage) for chunk in chunks]
+    upserts = [
+        ReplaceOne({"_id": doc["_id"]}, doc, upsert=True)
+        for doc in documents
+        if "_id" in doc
+    ]
+    inserts = [doc for doc in documents if "_id" not in doc]
+
+    if upserts:
+        result = collection.bulk_write(upserts, ordered=False)
+        print(
+            f"{result.upserted_count} documents inserted and "
+            f"{result.modified_count} updated in collection"
+        )
+    if inserts:
+        result = collection.insert_many(inserts)
         print(f"{len(result.inserted_ids)} documents inserted into collection")
-    else:
+    if not documents:
         print("No documents to insert")
-
-    client.close()
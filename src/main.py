@@ -1,19 +1,38 @@
 """
 MentorIA Main File
 Command-line interface to run ingestion and RAG queries.
+
+Each command imports only what it needs when it runs (the agent graph,
+the HTTP server, the ingestion pipeline), so --help and the commands
+that do not use them start fast and without their credentials.
 """
 
 import argparse
+import os
 import sys
 
-from src.core.agent_orchestrator import generate_response
-from ingest.ingest import ingest_documents
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import (  # noqa: E402
+    API_HOST,
+    API_PORT,
+    API_WORKERS,
+    CHECKPOINT_KEEP_LAST,
+    EMBED_BATCH_SIZE,
+    EMBED_CONCURRENCY,
+    EMBED_REQUESTS_PER_MINUTE,
+    LOADER_PAGES_PER_TASK,
+    LOADER_WORKERS,
+    RETRIEVAL_BACKEND,
+)
 
 
 def interactive_query_mode():
     """
     Interactive mode for making RAG queries.
     """
+    from src.core.agent_orchestrator import generate_response
+
     print("\n=== MentorIA - Interactive Mode ===")
     print("Enter your questions (or 'exit' to quit)\n")
 
@@ -44,6 +63,8 @@ def single_query_mode(question: str):
     """
     Single query mode.
     """
+    from src.core.agent_orchestrator import generate_response
+
     try:
         print("Processing...")
         response = generate_response(question)
@@ -54,6 +75,35 @@ def single_query_mode(question: str):
         sys.exit(1)
 
 
+def compact_checkpoints_mode(keep_last: int, max_idle_days: float):
+    """
+    Applies the checkpoint retention policy to the stored conversations.
+    """
+    from src.core.graph.checkpointing import compact_checkpoints
+    from src.core.graph.graph_builder import get_checkpointer
+
+    try:
+        totals = compact_checkpoints(
+            get_checkpointer(), keep_last=keep_last, max_idle_days=max_idle_days
+        )
+    except Exception as e:
+        print(f"Error compacting checkpoints: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"Threads: {totals['threads']} "
+        f"({totals['expired_threads']} expired and deleted)"
+    )
+    print(f"Pruned checkpoints: {totals['pruned_checkpoints']}")
+    print(f"Rewritten without ephemeral state: {totals['rewritten_checkpoints']}")
+    for name in ("checkpoints", "writes"):
+        before, after = totals["before"][name], totals["after"][name]
+        print(
+            f"{name}: {before['count']} docs / {before['size_bytes'] / 1024:.0f} KB"
+            f" -> {after['count']} docs / {after['size_bytes'] / 1024:.0f} KB"
+        )
+
+
 def main():
     """
     Main function that manages the command-line interface.
@@ -73,8 +123,23 @@ Usage examples:
   # Document ingestion
   python src/main.py ingest ./documents
 
+  # HTTP API (SSE streaming) with 4 worker processes
+  python src/main.py serve --workers 4
+
+  # Keep the latest 5 checkpoints per session, drop sessions idle for 30 days
+  python src/main.py compact-checkpoints --keep-last 5 --max-idle-days 30
+
   # Ingestion with custom parameters
   python src/main.py ingest ./documents --chunk-size 1500 --chunk-overlap 300
+
+  # Ingestion with parallel, rate-limited embedding
+  python src/main.py ingest ./documents --embed-batch-size 50 --embed-concurrency 8
+
+  # Streaming ingestion with bounded memory
+  python src/main.py ingest ./documents --stream
+
+  # Parallel parsing on 8 processes, splitting PDFs into 50-page ranges
+  python src/main.py ingest ./documents --workers 8 --pages-per-task 50
         """,
     )
 
@@ -110,6 +175,95 @@ Usage examples:
         default=200,
         help="Overlap between chunks in characters (default: 200)",
     )
+    ingest_parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=EMBED_BATCH_SIZE,
+        help=f"Chunks per embedding request (default: {EMBED_BATCH_SIZE})",
+    )
+    ingest_parser.add_argument(
+        "--embed-concurrency",
+        type=int,
+        default=EMBED_CONCURRENCY,
+        help=f"Concurrent embedding requests (default: {EMBED_CONCURRENCY})",
+    )
+    ingest_parser.add_argument(
+        "--embed-rpm",
+        type=float,
+        default=EMBED_REQUESTS_PER_MINUTE,
+        help="Embedding requests per minute, 0 for unlimited "
+        f"(default: {EMBED_REQUESTS_PER_MINUTE:g})",
+    )
+    ingest_parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Ignore the ingestion manifest and re-embed every chunk",
+    )
+    ingest_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream loader -> splitter -> embedder -> writer in bounded "
+        "batches to keep memory flat",
+    )
+    ingest_parser.add_argument(
+        "--workers",
+        type=int,
+        default=LOADER_WORKERS,
+        help="Processes used to parse documents, 0 for one per CPU core "
+        f"(default: {LOADER_WORKERS})",
+    )
+    ingest_parser.add_argument(
+        "--pages-per-task",
+        type=int,
+        default=LOADER_PAGES_PER_TASK,
+        help="Split PDFs with more pages than this into ranges parsed in "
+        f"parallel, 0 to never split (default: {LOADER_PAGES_PER_TASK})",
+    )
+    ingest_parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Also ingest documents in subdirectories",
+    )
+    ingest_parser.add_argument(
+        "--build-local-index",
+        action="store_true",
+        default=RETRIEVAL_BACKEND == "local",
+        help="Rebuild the local vector index after ingestion "
+        "(default: on when RETRIEVAL_BACKEND=local)",
+    )
+
+    # Subparser for the HTTP API
+    serve_parser = subparsers.add_parser("serve", help="Run the HTTP API server")
+    serve_parser.add_argument(
+        "--host", type=str, default=API_HOST, help=f"Bind address (default: {API_HOST})"
+    )
+    serve_parser.add_argument(
+        "--port", type=int, default=API_PORT, help=f"Port (default: {API_PORT})"
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=API_WORKERS,
+        help=f"Worker processes (default: {API_WORKERS})",
+    )
+
+    # Subparser for checkpoint compaction
+    compact_parser = subparsers.add_parser(
+        "compact-checkpoints", help="Prune and compact stored conversation state"
+    )
+    compact_parser.add_argument(
+        "--keep-last",
+        type=int,
+        default=CHECKPOINT_KEEP_LAST,
+        help="Checkpoints kept per session, 0 keeps all "
+        f"(default: {CHECKPOINT_KEEP_LAST})",
+    )
+    compact_parser.add_argument(
+        "--max-idle-days",
+        type=float,
+        default=0,
+        help="Delete sessions idle for this many days, 0 keeps all (default: 0)",
+    )
 
     args = parser.parse_args()
 
@@ -123,13 +277,32 @@ Usage examples:
         else:
             interactive_query_mode()
 
+    elif args.command == "serve":
+        from src.api import run as run_api
+
+        run_api(host=args.host, port=args.port, workers=args.workers)
+
+    elif args.command == "compact-checkpoints":
+        compact_checkpoints_mode(args.keep_last, args.max_idle_days)
+
     elif args.command == "ingest":
+        from src.ingest.ingest import ingest_documents
+
         # Run ingestion using the main function
         try:
             ingest_documents(
                 documents_path=args.documents_path,
                 chunk_size=args.chunk_size,
                 chunk_overlap=args.chunk_overlap,
+                embed_batch_size=args.embed_batch_size,
+                embed_concurrency=args.embed_concurrency,
+                embed_requests_per_minute=args.embed_rpm,
+                full_refresh=args.full_refresh,
+                stream=args.stream,
+                workers=args.workers,
+                recursive=args.recursive,
+                pages_per_task=args.pages_per_task,
+                build_index=args.build_local_index,
             )
         except Exception as e:
             print(f"Error during ingestion: {e}", file=sys.stderr)
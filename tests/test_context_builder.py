@@ -0,0 +1,44 @@
+from src.core.context_builder import assemble_context
+from src.core.utils import estimate_tokens
+
+
+def chunk(name: str, text: str, score: float) -> dict:
+    return {"text": text, "metadata": {"source": name, "page": 0}, "score": score}
+
+
+def test_blocks_after_one_that_does_not_fit_still_fill_the_budget():
+    results = [
+        chunk("small.pdf", "Short answer about vacation days.", 0.9),
+        chunk("large.pdf", "word " * 400, 0.8),
+        chunk("other.pdf", "Another short relevant passage.", 0.7),
+    ]
+
+    context = assemble_context(results, token_budget=60)
+
+    assert "small.pdf" in context
+    assert "large.pdf" not in context
+    assert context.index("small.pdf") < context.index("other.pdf")
+
+
+def test_oversized_top_block_does_not_empty_the_context():
+    results = [
+        chunk("large.pdf", "word " * 400, 0.9),
+        chunk("small.pdf", "Short answer about vacation days.", 0.5),
+    ]
+
+    context = assemble_context(results, token_budget=40)
+
+    assert context == "[Source: small.pdf, page 1]\nShort answer about vacation days."
+
+
+def test_truncated_block_stays_within_the_budget():
+    results = [
+        chunk("large.pdf", "word " * 400, 0.9),
+        chunk("small.pdf", "Short answer about vacation days.", 0.5),
+    ]
+
+    context = assemble_context(results, token_budget=120)
+
+    assert context.startswith("[Source: large.pdf, page 1]")
+    assert context.endswith("…")
+    assert estimate_tokens(context) <= 120
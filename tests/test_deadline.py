@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core import deadline
+
+
+@pytest.fixture
+def small_pool(monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(deadline, "_timeout_executor", pool)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+def test_queue_wait_does_not_count_against_the_timeout(small_pool):
+    # Four 0.2s calls on two workers: the last two wait 0.2s for a worker
+    # and finish 0.4s after submission, past their 0.3s timeout
+    def call():
+        return deadline.run_with_timeout(lambda: time.sleep(0.2) or "ok", 0.3)
+
+    with ThreadPoolExecutor(max_workers=4) as callers:
+        results = [f.result() for f in [callers.submit(call) for _ in range(4)]]
+
+    assert results == ["ok"] * 4
+
+
+def test_queued_call_is_cancelled_on_timeout(small_pool):
+    release = threading.Event()
+    ran = []
+
+    def blocker():
+        release.wait(5)
+
+    def queued():
+        ran.append(True)
+
+    for _ in range(2):
+        small_pool.submit(blocker)
+    with pytest.raises(TimeoutError):
+        deadline.run_with_timeout(queued, 0.1)
+    release.set()
+    small_pool.shutdown(wait=True)
+
+    assert ran == []
+
+
+def test_running_call_times_out_with_builtin_timeout_error(small_pool):
+    with pytest.raises(TimeoutError):
+        deadline.run_with_timeout(lambda: time.sleep(0.5), 0.1)
+
+
+def test_no_timeout_runs_inline():
+    assert deadline.run_with_timeout(threading.current_thread, None) is (
+        threading.current_thread()
+    )
+
+
+def test_asyncio_timeouts_are_timeout_errors():
+    with pytest.raises(deadline.TIMEOUT_ERRORS):
+        asyncio.run(asyncio.wait_for(asyncio.sleep(1), 0.01))
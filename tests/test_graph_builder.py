@@ -0,0 +1,27 @@
+import asyncio
+import threading
+
+from src.core.graph import graph_builder
+
+
+def test_first_async_build_runs_off_the_event_loop(monkeypatch):
+    app, threads = object(), []
+
+    def build():
+        threads.append(threading.current_thread())
+        return app
+
+    monkeypatch.setattr(graph_builder, "_app", None)
+    monkeypatch.setattr(graph_builder, "get_app", build)
+
+    assert asyncio.run(graph_builder.aget_app()) is app
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+
+
+def test_built_app_is_returned_without_a_thread_hop(monkeypatch):
+    app = object()
+    monkeypatch.setattr(graph_builder, "_app", app)
+    monkeypatch.setattr(graph_builder, "get_app", lambda: 1 / 0)
+
+    assert asyncio.run(graph_builder.aget_app()) is app
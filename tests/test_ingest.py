@@ -0,0 +1,160 @@
+import contextlib
+import io
+
+from bson import ObjectId
+from langchain_core.documents import Document
+
+from benchmarks.fixtures import MemoryCollection
+from src.ingest import ingest
+from src.ingest.manifest import (
+    FileManifestStore,
+    assign_chunk_ids,
+    file_hash,
+    ingest_settings,
+)
+
+
+def documents_dir(tmp_path):
+    documents = tmp_path / "documents"
+    documents.mkdir()
+    (documents / "a.txt").write_text("first document", encoding="utf-8")
+    (documents / "b.txt").write_text("second document", encoding="utf-8")
+    return documents
+
+
+def recorded_for(documents, settings) -> dict:
+    return {
+        path.name: {
+            "file_hash": file_hash(path),
+            "chunk_ids": [f"{path.name}-chunk"],
+            "settings": settings,
+        }
+        for path in documents.iterdir()
+    }
+
+
+def test_unchanged_files_with_same_settings_are_skipped(tmp_path):
+    documents = documents_dir(tmp_path)
+    settings = ingest_settings(1000, 200)
+
+    changed, deleted, total = ingest.find_changed_files(
+        str(documents), recorded_for(documents, settings), settings
+    )
+
+    assert (changed, deleted, total) == ([], [], 2)
+
+
+def test_changed_settings_reingest_every_file(tmp_path):
+    documents = documents_dir(tmp_path)
+    recorded = recorded_for(documents, ingest_settings(1000, 200))
+
+    for settings in (
+        ingest_settings(500, 200),
+        ingest_settings(1000, 100),
+        ingest_settings(1000, 200, embedding_model="models/text-embedding-004"),
+    ):
+        changed, _, _ = ingest.find_changed_files(str(documents), recorded, settings)
+
+        assert sorted(c.source_key for c in changed) == ["a.txt", "b.txt"]
+        assert all(c.settings == settings for c in changed)
+        assert changed[0].previous_chunk_ids == [f"{changed[0].source_key}-chunk"]
+
+
+def test_entries_without_settings_are_reingested(tmp_path):
+    documents = documents_dir(tmp_path)
+    recorded = recorded_for(documents, None)
+    for entry in recorded.values():
+        del entry["settings"]
+
+    changed, _, _ = ingest.find_changed_files(
+        str(documents), recorded, ingest_settings(1000, 200)
+    )
+
+    assert len(changed) == 2
+
+
+def test_chunk_ids_depend_on_the_embedding_model():
+    def ids(model):
+        chunks = [Document(page_content="same text", metadata={"page": 1})]
+        return assign_chunk_ids(chunks, "a.txt", model)[0].metadata["chunk_id"]
+
+    assert ids("models/embedding-001") == ids("models/embedding-001")
+    assert ids("models/embedding-001") != ids("models/text-embedding-004")
+
+
+def test_version_is_kept_when_every_changed_file_fails(tmp_path, monkeypatch):
+    documents = documents_dir(tmp_path)
+    manifest = FileManifestStore(str(tmp_path / "manifest.json"))
+    bumps = []
+
+    def failing_loader(paths, workers, pages_per_task):
+        for path in paths:
+            yield path, [], "unreadable"
+
+    monkeypatch.setattr(ingest, "get_manifest_store", lambda: manifest)
+    monkeypatch.setattr(ingest, "get_chunk_collection", MemoryCollection)
+    monkeypatch.setattr(ingest, "iter_loaded_files", failing_loader)
+    monkeypatch.setattr(ingest, "bump_knowledge_base_version", lambda: bumps.append(1))
+    with (
+        contextlib.redirect_stdout(io.StringIO()),
+        contextlib.redirect_stderr(io.StringIO()),
+    ):
+        ingest.ingest_documents(str(documents), build_index=False)
+
+    assert bumps == []
+    assert manifest.load() == {}
+
+
+def run_quietly(documents, monkeypatch, collection, manifest, **kwargs):
+    def embed(chunks, **_):
+        for chunk in chunks:
+            chunk.metadata["embedding"] = [1.0, 0.0]
+
+    monkeypatch.setattr(ingest, "get_manifest_store", lambda: manifest)
+    monkeypatch.setattr(ingest, "get_chunk_collection", lambda: collection)
+    monkeypatch.setattr(ingest, "generate_embeddings", embed)
+    monkeypatch.setattr(ingest, "bump_knowledge_base_version", lambda: None)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ingest.ingest_documents(str(documents), workers=1, build_index=False, **kwargs)
+
+
+def insert_legacy_chunks(collection, documents):
+    # As stored before chunk ids: insert_many with driver-generated _ids
+    collection.insert_many(
+        [
+            {"_id": ObjectId(), "text": path.read_text(), "source": str(path)}
+            for path in sorted(documents.iterdir())
+        ]
+    )
+
+
+def stored_ids(collection) -> list:
+    return [doc["_id"] for doc in collection.find({}, {"_id": 1})]
+
+
+def test_first_run_replaces_chunks_stored_before_the_manifest(tmp_path, monkeypatch):
+    documents = documents_dir(tmp_path)
+    collection = MemoryCollection()
+    insert_legacy_chunks(collection, documents)
+    manifest = FileManifestStore(str(tmp_path / "manifest.json"))
+
+    run_quietly(documents, monkeypatch, collection, manifest)
+
+    ids = stored_ids(collection)
+    assert len(ids) == 2
+    assert all(isinstance(doc_id, str) for doc_id in ids)
+
+
+def test_full_refresh_removes_legacy_chunks(tmp_path, monkeypatch):
+    documents = documents_dir(tmp_path)
+    collection = MemoryCollection()
+    manifest = FileManifestStore(str(tmp_path / "manifest.json"))
+    run_quietly(documents, monkeypatch, collection, manifest)
+    insert_legacy_chunks(collection, documents)
+
+    # Incremental runs with a manifest leave unknown documents alone
+    run_quietly(documents, monkeypatch, collection, manifest)
+    assert len(stored_ids(collection)) == 4
+
+    run_quietly(documents, monkeypatch, collection, manifest, full_refresh=True)
+    assert len(stored_ids(collection)) == 2
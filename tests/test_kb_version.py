@@ -0,0 +1,11 @@
+from src.core.kb_version import FileVersionStore
+
+
+def test_file_store_records_a_new_version_on_each_bump(tmp_path):
+    store = FileVersionStore(str(tmp_path / "kb" / "ingest_manifest.version"))
+
+    assert store.get() is None
+    first = store.bump()
+    assert store.get() == first
+    assert store.bump() != first
+    assert not list(tmp_path.glob("kb/*.tmp"))
@@ -0,0 +1,23 @@
+from src.ingest.loaders import iter_loaded_files
+
+
+def test_no_files_yields_nothing_with_several_workers():
+    assert list(iter_loaded_files([], workers=4)) == []
+
+
+def test_files_are_yielded_in_input_order(tmp_path):
+    paths = []
+    for name in ("b.txt", "a.txt", "c.txt"):
+        path = tmp_path / name
+        path.write_text(f"contents of {name}", encoding="utf-8")
+        paths.append(path)
+
+    loaded = list(iter_loaded_files(paths, workers=2))
+
+    assert [path for path, _, _ in loaded] == paths
+    assert [documents[0].page_content for _, documents, _ in loaded] == [
+        "contents of b.txt",
+        "contents of a.txt",
+        "contents of c.txt",
+    ]
+    assert all(error is None for _, _, error in loaded)
@@ -0,0 +1,63 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.core.graph.router import (
+    REUSE,
+    RETRIEVE,
+    SKIP,
+    _previous_turn,
+    classify_message,
+)
+
+PREVIOUS_TURN = (
+    "Como funciona o registro de comparecimento? O registro é feito no "
+    "sistema de ponto e aprovado pela chefia imediata."
+)
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "Summarize the vacation policy",
+        "Resuma a política de férias",
+        "translate the code of conduct into English",
+        "Explique de novo a regra de estágio",
+    ],
+)
+def test_rewrite_naming_a_new_topic_retrieves(question):
+    assert classify_message(question, PREVIOUS_TURN)[0] == RETRIEVE
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "resuma isso",
+        "pode resumir em tópicos?",
+        "explain that again",
+        "translate it into English please",
+        "resuma o registro de comparecimento",
+    ],
+)
+def test_rewrite_of_the_previous_answer_reuses(question):
+    assert classify_message(question, PREVIOUS_TURN)[0] == REUSE
+
+
+def test_rewrite_without_previous_answer_retrieves():
+    assert classify_message("resuma isso", None)[0] == RETRIEVE
+
+
+def test_small_talk_skips():
+    assert classify_message("Obrigado mesmo!", PREVIOUS_TURN)[0] == SKIP
+
+
+def test_previous_turn_is_the_last_question_and_answer():
+    messages = [
+        AIMessage(content="Bem-vinda!"),
+        HumanMessage(content="Quem aprova as horas extras?"),
+        AIMessage(content="A chefia imediata."),
+        HumanMessage(content="resuma isso"),
+    ]
+    assert _previous_turn({"messages": messages}) == (
+        "Quem aprova as horas extras? A chefia imediata."
+    )
+    assert _previous_turn({"messages": messages[1:2]}) is None
@@ -0,0 +1,52 @@
+import asyncio
+
+from src.core.semantic_cache import SemanticAnswerCache
+
+VECTOR = [1.0, 0.0, 0.0]
+
+
+def test_name_is_replaced_as_a_whole_word_only():
+    cache = SemanticAnswerCache(threshold=0.9)
+    cache.store(VECTOR, "Analista", "q", "Olá Ana! A Análise da Ana.", "Ana")
+
+    hit = cache.lookup(VECTOR, "Analista")
+
+    assert hit.personalized("Bruno") == "Olá Bruno! A Análise da Bruno."
+
+
+def test_anonymous_user_never_sees_the_original_name():
+    cache = SemanticAnswerCache(threshold=0.9)
+    cache.store(VECTOR, "Analista", "q", "Olá Ana! Seja bem-vinda, Ana.", "Ana")
+
+    hit = cache.lookup(VECTOR, "Analista")
+
+    for user_name in ("", "  "):
+        answer = hit.personalized(user_name)
+        assert "Ana" not in answer
+        assert answer == "Olá Colaborador! Seja bem-vinda, Colaborador."
+
+
+def test_version_is_read_without_holding_the_lock():
+    locked = []
+
+    def version():
+        locked.append(cache._lock.locked())
+        return "v1"
+
+    cache = SemanticAnswerCache(version_provider=version, version_check_seconds=0)
+    cache.lookup(VECTOR, "Analista")
+    asyncio.run(cache.alookup(VECTOR, "Analista"))
+
+    assert locked == [False, False]
+
+
+def test_version_change_drops_entries():
+    versions = iter(["v1", "v2"])
+    cache = SemanticAnswerCache(
+        threshold=0.9, version_provider=lambda: next(versions), version_check_seconds=0
+    )
+    cache.lookup(VECTOR, "Analista")
+    cache.store(VECTOR, "Analista", "q", "a")
+
+    assert asyncio.run(cache.alookup(VECTOR, "Analista")) is None
+    assert cache.stats()["invalidations"] == 1
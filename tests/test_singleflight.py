@@ -0,0 +1,61 @@
+import asyncio
+
+from src.core.singleflight import SingleFlight
+
+
+def test_leader_timeout_does_not_cancel_followers():
+    flight = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.3)
+        return "result"
+
+    async def caller(timeout):
+        try:
+            return await asyncio.wait_for(flight.ado("key", work), timeout)
+        except asyncio.TimeoutError:
+            return "timeout"
+
+    async def main():
+        leader = asyncio.ensure_future(caller(0.1))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(caller(5))
+        return await asyncio.gather(leader, follower)
+
+    assert asyncio.run(main()) == ["timeout", "result"]
+    assert runs == [1]
+    assert flight.stats()["coalesced"] == 1
+
+
+def test_errors_reach_every_caller():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    async def caller():
+        try:
+            await flight.ado("key", work)
+        except ValueError as e:
+            return str(e)
+
+    async def main():
+        return await asyncio.gather(caller(), caller())
+
+    assert asyncio.run(main()) == ["boom", "boom"]
+
+
+def test_sync_callers_share_one_execution():
+    flight = SingleFlight(grace_seconds=1.0)
+    runs = []
+
+    def work():
+        runs.append(1)
+        return 42
+
+    assert flight.do("key", work) == 42
+    assert flight.do("key", work) == 42
+    assert runs == [1]
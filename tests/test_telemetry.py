@@ -0,0 +1,49 @@
+from benchmarks.fixtures import slow_search_tool
+from src.core import agent_orchestrator, embedding_cache, semantic_cache
+from src.core.cache import TTLCache
+from src.core.graph import nodes
+from src.core.telemetry import MetricsRegistry, render_metrics
+from src.core.tool_cache import CachedTool
+
+
+def test_collectors_returning_none_are_skipped():
+    registry = MetricsRegistry()
+    registry.register_collector("built", lambda: {"hits": 3})
+    registry.register_collector("not_built", lambda: None)
+
+    assert registry.collect_stats() == {"built": {"hits": 3}}
+    assert "mentoria_built_hits 3" in registry.render()
+    assert "not_built" not in registry.render()
+
+
+def test_scrape_does_not_build_components(monkeypatch):
+    def unavailable():
+        raise AssertionError("a scrape must not build the web search tool")
+
+    monkeypatch.setattr(nodes, "_web_search_tool", None)
+    monkeypatch.setattr(nodes, "get_tavily_search_tool", unavailable)
+    monkeypatch.setattr(semantic_cache, "_semantic_cache", None)
+    monkeypatch.setattr(embedding_cache, "_query_embedding_cache", None)
+
+    metrics = render_metrics()
+
+    assert "mentoria_web_search_cache_" not in metrics
+    assert "mentoria_semantic_cache_" not in metrics
+    assert "mentoria_query_embedding_cache_" not in metrics
+    assert "mentoria_routing_" in metrics
+    assert nodes._web_search_tool is None
+    assert semantic_cache._semantic_cache is None
+    assert embedding_cache._query_embedding_cache is None
+
+
+def test_scrape_reads_components_already_built(monkeypatch):
+    tool = CachedTool(slow_search_tool(0.0), TTLCache(max_size=8, ttl_seconds=60))
+    tool.invoke({"query": "férias"})
+    tool.invoke({"query": "férias"})
+    monkeypatch.setattr(nodes, "_web_search_tool", tool)
+
+    stats = agent_orchestrator.get_web_search_cache_stats()
+
+    assert stats["remote_calls"] == 1
+    assert stats["hits"] == 1
+    assert "mentoria_web_search_cache_remote_calls 1" in render_metrics()
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.tools import tool
+
+from src.core.cache import TTLCache
+from src.core.tool_cache import CachedTool
+
+queries = []
+
+
+@tool
+def search(query: str) -> dict:
+    """Searches the web."""
+    queries.append(query)
+    if query.startswith("fail"):
+        return {"error": "quota exceeded"}
+    return {"results": [{"content": f"about {query}"}]}
+
+
+def cached(ttl_seconds=60) -> CachedTool:
+    queries.clear()
+    return CachedTool(search, TTLCache(max_size=8, ttl_seconds=ttl_seconds))
+
+
+def test_normalized_query_is_served_from_the_cache():
+    cached_search = cached()
+
+    first = cached_search.invoke({"query": "Política de Férias"})
+    second = cached_search.invoke({"query": "  política   de férias "})
+
+    assert second == first
+    assert queries == ["Política de Férias"]
+    assert cached_search.stats()["remote_calls"] == 1
+    assert cached_search.stats()["hits"] == 1
+
+
+def test_error_results_are_not_cached():
+    cached_search = cached()
+
+    for _ in range(2):
+        assert cached_search.invoke({"query": "fail"}) == {"error": "quota exceeded"}
+
+    assert queries == ["fail", "fail"]
+
+
+def test_expired_results_are_fetched_again():
+    cached_search = cached(ttl_seconds=0.05)
+
+    cached_search.invoke({"query": "férias"})
+    cached_search.invoke({"query": "férias"})
+    time.sleep(0.1)
+    cached_search.invoke({"query": "férias"})
+
+    assert queries == ["férias", "férias"]
+
+
+def test_async_calls_share_the_cache():
+    cached_search = cached()
+
+    async def run():
+        first = await cached_search.ainvoke({"query": "Férias"})
+        return first, await cached_search.ainvoke({"query": "férias"})
+
+    first, second = asyncio.run(run())
+
+    assert second == first
+    assert queries == ["Férias"]
+
+
+def test_concurrent_calls_are_all_counted():
+    cached_search = cached()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: cached_search.invoke({"query": f"q{i}"}), range(200)))
+
+    assert cached_search.stats()["remote_calls"] == 200
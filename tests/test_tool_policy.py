@@ -0,0 +1,52 @@
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import tool
+
+from src.core.graph import tool_policy
+from src.core.graph.tool_policy import (
+    AgentLoopStats,
+    is_prefetch_call,
+    prefetch_web_search,
+    record_agent_call,
+)
+
+
+@tool
+def search(query: str) -> dict:
+    """Searches the web."""
+    return {"results": [{"content": f"about {query}"}]}
+
+
+@tool
+def slow_search(query: str) -> dict:
+    """Searches the web slowly."""
+    time.sleep(0.5)
+    return {"results": []}
+
+
+def test_prefetch_returns_a_tool_call_and_its_result():
+    call, result = prefetch_web_search(search, "férias", timeout=1.0)
+
+    assert is_prefetch_call(call)
+    assert call.tool_calls[0]["args"] == {"query": "férias"}
+    assert result.tool_call_id == call.tool_calls[0]["id"]
+    assert "about férias" in result.content
+
+
+def test_failed_prefetch_adds_nothing():
+    assert prefetch_web_search(slow_search, "férias", timeout=0.05) == []
+
+
+def test_prefetch_call_is_not_counted_as_an_llm_call(monkeypatch):
+    stats = AgentLoopStats()
+    monkeypatch.setattr(tool_policy, "agent_loop_stats", stats)
+    call, result = prefetch_web_search(search, "férias", timeout=1.0)
+    state = {"messages": [HumanMessage(content="férias?"), call, result]}
+
+    record_agent_call(state, "web_prefetch", AIMessage(content="answer"))
+
+    assert stats.stats()["by_policy"]["web_prefetch"] == {
+        "answers": 1,
+        "avg_llm_calls_per_answer": 1.0,
+    }
@@ -0,0 +1,101 @@
+import contextlib
+import io
+import json
+import threading
+
+import numpy as np
+
+from benchmarks.fixtures import MemoryCollection
+from src.core.graph import vector_index
+from src.core.graph.vector_index import (
+    CURRENT_FILE,
+    LocalVectorIndex,
+    build_local_index,
+    current_index_dir,
+    get_local_index,
+)
+
+
+def collection_with(count: int, dimensions: int = 8) -> MemoryCollection:
+    rng = np.random.default_rng(count)
+    collection = MemoryCollection()
+    collection.insert_many(
+        [
+            {
+                "_id": f"{i:04d}",
+                "text": f"chunk {i}",
+                "source": "doc.pdf",
+                "embedding": rng.standard_normal(dimensions).tolist(),
+            }
+            for i in range(count)
+        ]
+    )
+    return collection
+
+
+def build(collection, index_dir) -> str:
+    with contextlib.redirect_stdout(io.StringIO()):
+        build_local_index(collection, str(index_dir), storage="float")
+    return current_index_dir(str(index_dir)).name
+
+
+def test_build_publishes_a_new_version_and_keeps_the_previous(tmp_path):
+    index_dir = tmp_path / "vector_index"
+    first = build(collection_with(3), index_dir)
+    second = build(collection_with(5), index_dir)
+
+    assert (index_dir / CURRENT_FILE).read_text() == second
+    assert len(LocalVectorIndex.load(str(index_dir))) == 5
+    assert (index_dir / first).is_dir()
+
+    third = build(collection_with(7), index_dir)
+    versions = sorted(p.name for p in index_dir.iterdir() if p.is_dir())
+    assert versions == sorted([second, third])
+
+
+def test_readers_never_see_a_partial_index(tmp_path):
+    index_dir = tmp_path / "vector_index"
+    build(collection_with(4), index_dir)
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                LocalVectorIndex.load(str(index_dir)).search([1.0] * 8, k=2)
+            except Exception as e:
+                errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for count in range(5, 25):
+        build(collection_with(count), index_dir)
+    done.set()
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+
+
+def test_unversioned_index_is_loaded_then_replaced(tmp_path, monkeypatch):
+    index_dir = tmp_path / "vector_index"
+    version = build(collection_with(3), index_dir)
+    # Lay the version out flat, as builds did before versioning
+    for path in (index_dir / version).iterdir():
+        path.rename(index_dir / path.name)
+    (index_dir / version).rmdir()
+    (index_dir / CURRENT_FILE).unlink()
+    monkeypatch.setattr(vector_index, "_loaded_index", None)
+
+    assert len(get_local_index(str(index_dir))) == 3
+
+    build(collection_with(6), index_dir)
+    assert len(get_local_index(str(index_dir))) == 6
+    assert not (index_dir / "meta.json").exists()
+    assert (
+        json.loads((current_index_dir(str(index_dir)) / "meta.json").read_text())[
+            "count"
+        ]
+        == 6
+    )